@@ -1,19 +1,39 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 import json
 import os
+import re
+import sys
 import time
+import html
 import glob # 파일 목록 조회용
-from config import paths
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(current_dir))
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from src.config import paths
+from src.core import browser_pool, page_ready, http_client, doc_index
 
 # --- [설정] ---
 SAVE_DIR = paths.AI_NEWS_DATA_DIR
 # Directory creation handled in config/paths.py
 
+SPACE_URL = "https://vidraft-news-stream.hf.space"
+
+# 브라우저 없이 데이터를 받을 후보 엔드포인트 (앞에서부터 시도, 처음 성공한 것 사용)
+# - /config, /gradio_api/config: Gradio 앱의 컴포넌트 초기값(뉴스 카드 텍스트/HTML 포함)
+# - /api/news: 커스텀 JSON 라우트가 있을 경우
+DIRECT_ENDPOINTS = ["/config", "/gradio_api/config", "/api/news"]
+
+# 엔드포인트 탐색은 재시도 없이 짧게 (잠든 Space는 5xx -> 재시도 백오프를 기다리지 않고 바로 다음 후보/브라우저로)
+PROBE_TIMEOUT = (3, 5)
+
+# 직접 수집/브라우저 수집 어느 쪽이든 같은 출처로 기록 (경로가 바뀌어도 같은 뉴스는 중복으로 판단되도록)
+SOURCE_NAME = "AI News Stream"
+
+# 뉴스 카드('📰'와 '👁'가 있는 버튼) 개수
+NEWS_CARD_COUNT_JS = "Array.from(document.querySelectorAll('button')).filter(b => b.innerText.includes('📰') && b.innerText.includes('👁')).length"
+
 def parse_news_text(text):
     """뉴스 카드 텍스트 파싱"""
     lines = [line.strip() for line in text.split('\n') if line.strip()]
@@ -36,9 +56,74 @@ def parse_news_text(text):
         "title": title,
         "content": content.strip(),
         "category": category,
-        "source": "AI News Stream (Selenium)"
+        "source": SOURCE_NAME
     }
 
+# --- [브라우저 없이 직접 수집] ---
+def _iter_strings(obj):
+    """JSON 안의 모든 문자열 값"""
+    if isinstance(obj, str):
+        yield obj
+    elif isinstance(obj, dict):
+        for v in obj.values(): yield from _iter_strings(v)
+    elif isinstance(obj, list):
+        for v in obj: yield from _iter_strings(v)
+
+def _html_to_text(value):
+    """카드 HTML -> 버튼 innerText와 비슷한 줄 단위 텍스트"""
+    value = re.sub(r"(?i)<br\s*/?>|</(div|p|li|h\d|button|span)>", "\n", value)
+    value = re.sub(r"<[^>]+>", "", value)
+    return html.unescape(value)
+
+def parse_cards_from_json(data):
+    """
+    엔드포인트 응답(JSON)에서 뉴스 카드 추출 -> parse_news_text와 같은 형식의 목록
+    1) 제목 필드가 있는 레코드 목록이면 그대로 매핑
+    2) 아니면 문자열 값에서 '📰' ~ '👁' 카드 텍스트를 찾아 parse_news_text로 파싱
+    """
+    records = data
+    if isinstance(data, dict):
+        records = data.get("news") or data.get("items") or []
+    if isinstance(records, list) and records and all(isinstance(r, dict) and r.get("title") for r in records):
+        return [{
+            "title": r["title"],
+            "content": (r.get("content") or r.get("summary") or r.get("description") or "").strip(),
+            "category": r.get("category") or "일반",
+            "source": SOURCE_NAME,
+        } for r in records]
+
+    news_list = []
+    for value in _iter_strings(data):
+        if "📰" not in value or "👁" not in value: continue
+        text = _html_to_text(value) if "<" in value else value
+        # 카드는 '📰 카테고리' 줄로 시작 -> 그 위치마다 잘라서 1장씩 파싱
+        for chunk in re.split(r"(?=📰)", text):
+            if "📰" in chunk and "👁" in chunk:
+                item = parse_news_text(chunk)
+                if item['title'] != "No Title":
+                    news_list.append(item)
+    return news_list
+
+def fetch_news_direct():
+    """Space의 데이터 엔드포인트를 HTTP로 직접 호출 (실패하거나 형식이 바뀌었으면 빈 리스트)"""
+    for endpoint in DIRECT_ENDPOINTS:
+        try:
+            res = http_client.get(SPACE_URL + endpoint, timeout=PROBE_TIMEOUT, retry=False)
+            if res.status_code != 200: continue
+            news_list = parse_cards_from_json(res.json())
+        except Exception as e:
+            print(f"   ⚠️ 직접 수집 실패 ({endpoint}): {e}")
+            continue
+        if news_list:
+            print(f"⚡ 브라우저 없이 수집 ({endpoint}): {len(news_list)}개")
+            return news_list
+    return []
+
+def _without_source(news_list):
+    # 예전 파일은 수집 경로별 출처("(API)"/"(Selenium)")가 붙어 있으므로 비교에서 제외
+    return [{k: v for k, v in item.items() if k != "source"} if isinstance(item, dict) else item
+            for item in news_list]
+
 def is_duplicate(new_data):
     """가장 최신 파일과 내용을 비교하여 중복 여부 확인"""
     # 1. 폴더 내 json 파일들을 찾음 (pathlib 객체와 glob 호환성 고려하여 str로 변환)
@@ -57,7 +142,7 @@ def is_duplicate(new_data):
             
         # 4. 내용 비교 (리스트 전체 비교)
         # *주의: 순서가 바뀌거나 내용이 조금이라도 다르면 '다르다'고 판단함
-        if new_data == old_data:
+        if isinstance(old_data, list) and _without_source(new_data) == _without_source(old_data):
             print(f"💤 데이터 변경 없음. (최신 파일: {os.path.basename(latest_file)})")
             return True # 중복임
             
@@ -66,55 +151,65 @@ def is_duplicate(new_data):
         
     return False # 중복 아님 (저장해야 함)
 
-def collect_ai_news():
-    print("🤖 AI News Stream 접속 중 (Selenium)...")
+def scrape_news_cards(driver):
+    """뉴스 스트림 페이지에서 뉴스 카드 목록 추출 (브라우저 렌더링)"""
+    from selenium.webdriver.common.by import By
+
+    driver.get(SPACE_URL)
     
-    options = webdriver.ChromeOptions()
-    # [옵션] 다시 백그라운드로 돌리고 싶으면 아래 주석 해제 (지금은 안정성을 위해 켜둠)
-    # options.add_argument("--headless") 
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--log-level=3")
+    print("⏳ 데이터 로딩 대기 중...")
+    # 뉴스 카드 수가 안정될 때까지 대기 (최대 40초, 기존 30초 + 10초)
+    page_ready.wait_until_ready(driver, "ai_news", count_script=NEWS_CARD_COUNT_JS, stable_for=2.0,
+                                conditions=("count",), timeout=40)
     
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+    buttons = driver.find_elements(By.TAG_NAME, "button")
     
-    try:
-        url = "https://vidraft-news-stream.hf.space"
-        driver.get(url)
-        
-        print("⏳ 데이터 로딩 대기 중...")
-        wait = WebDriverWait(driver, 30) # 넉넉하게 30초 대기
-        wait.until(EC.presence_of_element_located((By.TAG_NAME, "button")))
-        
-        # 확실한 로딩을 위해 추가 대기
-        time.sleep(10)
-        
-        buttons = driver.find_elements(By.TAG_NAME, "button")
-        
-        news_list = []
-        for btn in buttons:
-            text = btn.text
-            if "📰" in text and "👁" in text:
-                item = parse_news_text(text)
-                if item['title'] != "No Title":
-                    news_list.append(item)
+    news_list = []
+    for btn in buttons:
+        text = btn.text
+        if "📰" in text and "👁" in text:
+            item = parse_news_text(text)
+            if item['title'] != "No Title":
+                news_list.append(item)
+    return news_list
 
-        if news_list:
-            # [핵심] 중복 검사 로직 추가
-            if is_duplicate(news_list):
-                print("🚫 저장 건너뜀.")
-            else:
-                filename = SAVE_DIR / f"ai_trend_{int(time.time())}.json"
-                with open(filename, "w", encoding="utf-8") as f:
-                    json.dump(news_list, f, ensure_ascii=False, indent=4)
-                print(f"✅ 새로운 뉴스 업데이트 완료! -> {filename}")
-        else:
-            print("⚠️ 뉴스 카드를 찾지 못했습니다.")
+def fetch_news():
+    """
+    뉴스 카드 목록 (직접 호출 -> 실패 시 브라우저 렌더링). 어느 경로든 같은 형식/출처(SOURCE_NAME)
+    브라우저 수집까지 실패하면 예외는 호출 측으로
+    """
+    # 1. HTTP로 데이터 엔드포인트 직접 호출 (1초 내외, Chrome 불필요)
+    news_list = fetch_news_direct()
+    if news_list:
+        return news_list
 
+    # 2. 엔드포인트 형식이 바뀌었으면 브라우저 렌더링으로 대체
+    print("🌐 직접 수집 실패 -> 브라우저로 수집합니다.")
+    # 공용 설정(browser_pool)으로 headless Chrome 실행 (화면을 보며 확인하려면 BROWSER_HEADLESS=0)
+    with browser_pool.browser() as driver:
+        return scrape_news_cards(driver)
+
+def collect_ai_news():
+    print("🤖 AI News Stream 접속 중...")
+    
+    try:
+        news_list = fetch_news()
     except Exception as e:
         print(f"❌ 수집 중 오류: {e}")
-    finally:
-        driver.quit()
+        return
+
+    if news_list:
+        # [핵심] 중복 검사 로직 추가
+        if is_duplicate(news_list):
+            print("🚫 저장 건너뜀.")
+        else:
+            filename = SAVE_DIR / f"ai_trend_{int(time.time())}.json"
+            with open(filename, "w", encoding="utf-8") as f:
+                json.dump(news_list, f, ensure_ascii=False, indent=4)
+            doc_index.record(filename)
+            print(f"✅ 새로운 뉴스 업데이트 완료! -> {filename}")
+    else:
+        print("⚠️ 뉴스 카드를 찾지 못했습니다.")
 
 if __name__ == "__main__":
     collect_ai_news()
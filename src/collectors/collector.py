@@ -1,6 +1,4 @@
-import requests
 import json
-import time
 import os
 import sys
 
@@ -13,6 +11,7 @@ print("sys.path:", sys.path)
 
 
 from src.config import paths
+from src.core import run_ledger, http_client, async_fetch, cursor_state, doc_index
 
 # --- [1] 설정 ---
 SAVE_DIR = paths.NEWS_DATA_DIR
@@ -55,27 +54,32 @@ def should_collect(news_item):
     return True
 
 # --- [3] 메인 수집 로직 ---
-def run_collector():
-    # 1. 뉴스 리스트 요청 (최신 20개)
-    list_url = "https://api.saveticker.com/api/news/list?page=1&page_size=20&sort=created_at_desc"
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-    }
-    
-    print("📡 최신 뉴스 리스트 스캔 중... (필터 완화됨)")
+PAGE_SIZE = 20
+
+def fetch_news_page(page):
+    """최신순 뉴스 목록 1페이지 (실패 시 None)"""
+    list_url = f"https://api.saveticker.com/api/news/list?page={page}&page_size={PAGE_SIZE}&sort=created_at_desc"
     try:
-        response = requests.get(list_url, headers=headers, timeout=10)
+        response = http_client.get(list_url, timeout=10)
     except Exception as e:
         print(f"❌ 연결 실패: {e}")
-        return
+        return None
     
     if response.status_code != 200:
-        print("❌ 리스트 가져오기 실패")
-        return
+        print(f"❌ 리스트 가져오기 실패 ({page}페이지)")
+        return None
+    return response.json().get('news_list', [])
 
-    news_list = response.json().get('news_list', [])
+def run_collector():
+    # 1. 뉴스 리스트 요청 (지난 수집 지점까지 페이지 순회)
+    print("📡 최신 뉴스 리스트 스캔 중... (필터 완화됨)")
+    news_list, complete = cursor_state.walk_pages("news", fetch_news_page, PAGE_SIZE)
+    if not news_list:
+        print("💤 새로운 뉴스가 없습니다.")
+        return
     
-    count = 0
+    targets = []
+    titles = {}
     for news_item in news_list:
         news_id = news_item['id']
         title = news_item['title']
@@ -84,49 +88,58 @@ def run_collector():
         if not should_collect(news_item):
             continue 
 
-        # 3. 중복 확인
+        titles[news_id] = title
+        targets.append((news_id, f"https://api.saveticker.com/api/news/detail/{news_id}"))
+
+    saved = set()
+
+    # 3. 상세 내용 수집 (동시 요청, 도착하는 대로 저장)
+    def save_detail(news_id, detail_res, error):
+        title = titles[news_id]
+        if error is not None:
+            print(f"   ⚠️ 상세 수집 중 에러: {title} ({error})")
+            return False
+        if detail_res.status_code != 200:
+            return False
+
+        full_data = detail_res.json().get('news', {})
+        
+        # 본문 추출
+        content_text = ""
+        raw_content = full_data.get('content', '')
+        
+        if isinstance(raw_content, list):
+            content_text = "\n".join([c.get('content', '') for c in raw_content if c.get('type') == 'text'])
+        else:
+            content_text = str(raw_content)
+
+        # 데이터 구조핑
+        save_data = {
+            "id": news_id,
+            "title": full_data.get('title', ''),
+            "created_at": full_data.get('created_at', ''),
+            "content": content_text,
+            "source": full_data.get('source', ''),
+            "tags": [t.get('name') for t in full_data.get('tags', [])],
+            "author": full_data.get('author_name', 'Unknown') # 작성자 정보 추가
+        }
+
         filename = SAVE_DIR / f"{news_id}.json"
-        if os.path.exists(filename):
-            print(f"   ⏭️ 이미 있음: {title}")
-            continue
-
-        # 4. 상세 내용 수집
-        detail_url = f"https://api.saveticker.com/api/news/detail/{news_id}"
-        try:
-            detail_res = requests.get(detail_url, headers=headers, timeout=5)
-            
-            if detail_res.status_code == 200:
-                full_data = detail_res.json().get('news', {})
-                
-                # 본문 추출
-                content_text = ""
-                raw_content = full_data.get('content', '')
-                
-                if isinstance(raw_content, list):
-                    content_text = "\n".join([c.get('content', '') for c in raw_content if c.get('type') == 'text'])
-                else:
-                    content_text = str(raw_content)
-
-                # 데이터 구조핑
-                save_data = {
-                    "id": news_id,
-                    "title": full_data.get('title', ''),
-                    "created_at": full_data.get('created_at', ''),
-                    "content": content_text,
-                    "source": full_data.get('source', ''),
-                    "tags": [t.get('name') for t in full_data.get('tags', [])],
-                    "author": full_data.get('author_name', 'Unknown') # 작성자 정보 추가
-                }
-
-                with open(filename, "w", encoding="utf-8") as f:
-                    json.dump(save_data, f, ensure_ascii=False, indent=4)
-                
-                print(f"   ✅ 수집 완료: {title}")
-                count += 1
-                time.sleep(0.3) 
-        except Exception as e:
-            print(f"   ⚠️ 상세 수집 중 에러: {title} ({e})")
-            continue
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(save_data, f, ensure_ascii=False, indent=4)
+        
+        run_ledger.note_file(filename)
+        doc_index.record(filename)
+        run_ledger.note_items()
+        print(f"   ✅ 수집 완료: {title}")
+        saved.add(news_id)
+        return True
+
+    count = async_fetch.fetch_all(targets, save_detail, timeout=5)
+
+    # 4. 수위표 전진 (상세 수집에 실패한 글은 다음 실행에서 다시 시도)
+    cursor_state.advance("news", news_list, failed_ids=[i for i, _ in targets if i not in saved],
+                         complete=complete)
         
     print(f"\n🎉 총 {count}개의 뉴스를 새로 저장했습니다.")
 
@@ -11,10 +11,9 @@ project_root = os.path.dirname(os.path.dirname(current_dir))
 sys.path.append(project_root)
 
 # 4. 모듈 임포트 (이제 루트에서 시작하므로 src.config로 불러옵니다)
-import requests
 import json
-import time
 from src.config import paths  # [수정] from config -> from src.config
+from src.core import run_ledger, http_client, fan_out, doc_index
 
 # [설정]
 SAVE_DIR = paths.TREND_DATA_DIR
@@ -35,65 +34,78 @@ def load_regions():
     with open(REGIONS_FILE, 'r', encoding='utf-8') as f:
         return json.load(f)
 
-def collect_commercial_trend():
+URL = "http://apis.data.go.kr/B553077/api/open/sdsc2/storeListInDong"
+
+def _has_items(res):
+    """업종 목록이 들어 있는 응답만 캐시 (오류/빈 응답을 6시간 재사용하지 않도록)"""
+    try:
+        return bool(res.json().get('body', {}).get('items'))
+    except ValueError:
+        return False
+
+def fetch_region(target):
+    """지역 1곳의 업종 분포 -> 리포트 문단 (실패/데이터 없음이면 None)"""
+    name = target['name']
+    code = target['code']
+    
+    print(f"   🔎 분석 중: {name} ({code})...")
+    
+    params = {
+        "serviceKey": API_KEY,
+        "pageNo": 1,
+        "numOfRows": 200, 
+        "divId": "signguCd", 
+        "key": code, 
+        "type": "json"         
+    }
+    
+    try:
+        res = http_client.get(URL, params=params, verify=False, timeout=15, cache_if=_has_items)
+        data = res.json()
+        
+        if 'body' in data and 'items' in data['body']:
+            items = data['body']['items']
+            
+            # 카테고리 카운팅
+            categories = {}
+            for item in items:
+                cat = item.get('indsMclsNm') 
+                if cat: categories[cat] = categories.get(cat, 0) + 1
+            
+            top_cat = sorted(categories.items(), key=lambda x: x[1], reverse=True)[:5]
+            total = len(items)
+            run_ledger.note_items(total)
+            
+            # 지역별 리포트 작성
+            region_report = f"### 📍 {name}\n"
+            for k, v in top_cat:
+                ratio = (v / total) * 100
+                region_report += f"- {k}: {v}개 ({ratio:.1f}%)\n"
+            
+            return region_report
+            
+        else:
+            print(f"   ⚠️ 데이터 없음: {name}")
+
+    except Exception as e:
+        print(f"   ❌ {name} 수집 실패: {e}")
+    return None
+
+def collect_commercial_trend(max_workers=None):
     print("🏪 상권 트렌드 멀티 스캔 중...")
     
     targets = load_regions()
-    all_reports = []
 
-    for target in targets:
-        name = target['name']
-        code = target['code']
-        
-        print(f"   🔎 분석 중: {name} ({code})...")
-        
-        url = "http://apis.data.go.kr/B553077/api/open/sdsc2/storeListInDong"
-        params = {
-            "serviceKey": API_KEY,
-            "pageNo": 1,
-            "numOfRows": 200, 
-            "divId": "signguCd", 
-            "key": code, 
-            "type": "json"         
-        }
-        
-        try:
-            res = requests.get(url, params=params, verify=False)
-            data = res.json()
-            
-            if 'body' in data and 'items' in data['body']:
-                items = data['body']['items']
-                
-                # 카테고리 카운팅
-                categories = {}
-                for item in items:
-                    cat = item.get('indsMclsNm') 
-                    if cat: categories[cat] = categories.get(cat, 0) + 1
-                
-                top_cat = sorted(categories.items(), key=lambda x: x[1], reverse=True)[:5]
-                total = len(items)
-                
-                # 지역별 리포트 작성
-                region_report = f"### 📍 {name}\n"
-                for k, v in top_cat:
-                    ratio = (v / total) * 100
-                    region_report += f"- {k}: {v}개 ({ratio:.1f}%)\n"
-                
-                all_reports.append(region_report)
-                
-            else:
-                print(f"   ⚠️ 데이터 없음: {name}")
-
-        except Exception as e:
-            print(f"   ❌ {name} 수집 실패: {e}")
-        
-        time.sleep(1) # API 매너 호출 (초당 제한 방지)
+    # 지역별 동시 수집 -> regions.json 순서대로 병합
+    all_reports = [r for r in fan_out.map_ordered(fetch_region, targets, max_workers) if r]
 
     # 통합 저장
     if all_reports:
         content = f"[통합 상권 트렌드 분석]\n{'='*30}\n" + "\n".join(all_reports)
         with open(f"{SAVE_DIR}/commercial.txt", "w", encoding="utf-8") as f:
             f.write(content)
+        run_ledger.note_file(f"{SAVE_DIR}/commercial.txt")
+        doc_index.record(f"{SAVE_DIR}/commercial.txt")
         print(f"✅ 총 {len(targets)}개 지역 상권 데이터 저장 완료.")
 
 if __name__ == "__main__":
@@ -1,6 +1,4 @@
-import requests
 import json
-import time
 import os
 import sys
 
@@ -9,6 +7,7 @@ project_root = os.path.dirname(os.path.dirname(os.path.dirname(current_dir)))
 sys.path.append(project_root)
 # --- [설정] ---
 from src.config import paths
+from src.core import run_ledger, http_client, async_fetch, cursor_state, doc_index
 SAVE_DIR = paths.COMMUNITY_DATA_DIR  # 별도 폴더에 저장
 if not os.path.exists(SAVE_DIR):
     os.makedirs(SAVE_DIR)
@@ -34,64 +33,80 @@ def should_collect(post_item):
             
     return True
 
-def run_community_collector():
+PAGE_SIZE = 20
+
+def fetch_community_page(page):
+    """최신순 커뮤니티 글 목록 1페이지 (실패 시 None)"""
     # 커뮤니티 API (카테고리: user_news)
-    list_url = "https://api.saveticker.com/api/community/list?page=1&page_size=20&category=user_news&sort=created_at_desc"
-    
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-    }
-    
+    list_url = f"https://api.saveticker.com/api/community/list?page={page}&page_size={PAGE_SIZE}&category=user_news&sort=created_at_desc"
+    response = http_client.get(list_url, timeout=10)
+    if response.status_code != 200:
+        print(f"❌ 리스트 실패 (Status: {response.status_code})")
+        return None
+
+    # 커뮤니티 API의 키는 'posts' 입니다.
+    return response.json().get('posts', [])
+
+def run_community_collector():
     print("🗣️ 커뮤니티 여론(User News) 스캔 중...")
     try:
-        response = requests.get(list_url, headers=headers)
-        if response.status_code != 200:
-            print(f"❌ 리스트 실패 (Status: {response.status_code})")
-            return
-
-        # 커뮤니티 API의 키는 'posts' 입니다.
-        posts = response.json().get('posts', [])
+        # 지난 수집 지점까지 페이지 순회
+        posts, complete = cursor_state.walk_pages("community", fetch_community_page, PAGE_SIZE)
         
-        count = 0
+        targets = []
+        by_id = {}
         for post in posts:
             post_id = post['id']
-            title = post['title']
             
             # 1. 필터링
             if not should_collect(post):
                 continue
 
-            # 2. 중복 확인
-            filename = os.path.join(SAVE_DIR, f"{post_id}.json")
-            if os.path.exists(filename):
-                continue # 조용히 넘어감
+            by_id[post_id] = post
+            targets.append((post_id, f"https://api.saveticker.com/api/community/detail/{post_id}"))
+
+        saved = set()
+
+        # 2. 상세 내용 수집 (동시 요청, 도착하는 대로 저장)
+        def save_detail(post_id, detail_res, error):
+            post = by_id[post_id]
+            if error is not None:
+                print(f"   ⚠️ 상세 수집 실패: {post['title']} ({error})")
+                return False
+            if detail_res.status_code != 200:
+                return False
+
+            # 상세 데이터 구조 확인 필요 (보통 'post' 키 안에 있음)
+            full_data = detail_res.json().get('post', post) # 없으면 리스트 데이터 사용
+            
+            # 저장할 데이터 구조
+            save_data = {
+                "id": post_id,
+                "title": full_data['title'],
+                "created_at": full_data['created_at'],
+                "content": full_data.get('content', ''),
+                "author": full_data.get('author_name', 'Unknown'),
+                "view_count": full_data.get('view_count', 0),
+                "likes": full_data.get('like_stats', {}).get('like_count', 0),
+                "source": "Saveticker Community"
+            }
 
-            # 3. 상세 내용 수집 (선택사항이나, 확실한 저장을 위해 호출)
-            detail_url = f"https://api.saveticker.com/api/community/detail/{post_id}"
-            detail_res = requests.get(detail_url, headers=headers)
+            filename = os.path.join(SAVE_DIR, f"{post_id}.json")
+            with open(filename, "w", encoding="utf-8") as f:
+                json.dump(save_data, f, ensure_ascii=False, indent=4)
             
-            if detail_res.status_code == 200:
-                # 상세 데이터 구조 확인 필요 (보통 'post' 키 안에 있음)
-                full_data = detail_res.json().get('post', post) # 없으면 리스트 데이터 사용
-                
-                # 저장할 데이터 구조
-                save_data = {
-                    "id": post_id,
-                    "title": full_data['title'],
-                    "created_at": full_data['created_at'],
-                    "content": full_data.get('content', ''),
-                    "author": full_data.get('author_name', 'Unknown'),
-                    "view_count": full_data.get('view_count', 0),
-                    "likes": full_data.get('like_stats', {}).get('like_count', 0),
-                    "source": "Saveticker Community"
-                }
-
-                with open(filename, "w", encoding="utf-8") as f:
-                    json.dump(save_data, f, ensure_ascii=False, indent=4)
-                
-                print(f"   ✅ 수집: {title}")
-                count += 1
-                time.sleep(0.5)
+            run_ledger.note_file(filename)
+            doc_index.record(filename)
+            run_ledger.note_items()
+            print(f"   ✅ 수집: {post['title']}")
+            saved.add(post_id)
+            return True
+
+        count = async_fetch.fetch_all(targets, save_detail, timeout=5)
+
+        # 3. 수위표 전진 (상세 수집에 실패한 글은 다음 실행에서 다시 시도)
+        cursor_state.advance("community", posts, failed_ids=[i for i, _ in targets if i not in saved],
+                             complete=complete)
 
         if count > 0:
             print(f"🎉 총 {count}개의 커뮤니티 인사이트를 추가했습니다.")
@@ -1,14 +1,17 @@
-import requests
 import os
 import sys
+import heapq
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(current_dir)))
 sys.path.append(project_root)
 from src.config import paths
+from src.core import run_ledger, http_client, json_stream, doc_index
 SAVE_DIR = paths.ASSET_DATA_DIR
 if not os.path.exists(SAVE_DIR): os.makedirs(SAVE_DIR)
 
+TOP_K = 5
+
 def collect_defi_yields():
     print("⛓️ 크립토 온체인 데이터(DefiLlama) 수집 중...")
     
@@ -17,22 +20,30 @@ def collect_defi_yields():
     url = "https://yields.llama.fi/pools"
     
     try:
-        res = requests.get(url).json()
-        data = res['data']
-        
-        # TVL 100M 이상, Stablecoin 필터링
-        high_tvl_pools = [p for p in data if p['tvlUsd'] > 100000000 and p['stablecoin']]
-        # 수익률(APY) 높은 순 정렬
-        top_pools = sorted(high_tvl_pools, key=lambda x: x['apy'], reverse=True)[:5]
+        # /pools는 전체 풀 목록(수십 MB) -> 통째로 디코딩하지 않고 풀 단위로 읽으며 바로 필터링
+        with http_client.open_stream(url, timeout=(10, 60)) as reader:
+            if reader.status_code != 200:
+                reader.cacheable = False
+                print(f"⚠️ 온체인 수집 실패 (Status: {reader.status_code})")
+                return
+
+            # TVL 100M 이상, Stablecoin 필터링
+            high_tvl_pools = (p for p in json_stream.iter_array(reader, "data")
+                              if (p.get('tvlUsd') or 0) > 100000000 and p.get('stablecoin'))
+            # 수익률(APY) 높은 순 상위 5개만 힙으로 유지
+            top_pools = heapq.nlargest(TOP_K, high_tvl_pools, key=lambda x: x.get('apy') or 0)
         
         lines = []
         for p in top_pools:
             lines.append(f"- {p['project']} ({p['symbol']}): APY {p['apy']:.2f}% (TVL: ${p['tvlUsd']/1000000:.0f}M)")
             
         content = "[Major Stablecoin Yields (Low Risk)]\n" + "\n".join(lines)
+        run_ledger.note_items(len(lines))
         
         with open(f"{SAVE_DIR}/crypto_yields.txt", "w", encoding="utf-8") as f:
             f.write(content)
+        run_ledger.note_file(f"{SAVE_DIR}/crypto_yields.txt")
+        doc_index.record(f"{SAVE_DIR}/crypto_yields.txt")
         print("✅ 온체인 데이터 저장 완료.")
         
     except Exception as e:
@@ -13,6 +13,7 @@ project_root = os.path.dirname(os.path.dirname(current_dir))
 sys.path.append(project_root)
 
 from src.config import paths
+from src.core import run_ledger, doc_index
 
 # 저장 경로 (리포트 폴더에 저장하면 Analyst가 자동으로 읽음)
 SAVE_DIR = paths.REPORTS_DATA_DIR
@@ -72,6 +73,7 @@ def collect_emails():
                     res, msg_data = mail.fetch(num, "(RFC822)")
                     for response_part in msg_data:
                         if isinstance(response_part, tuple):
+                            run_ledger.note_download(len(response_part[1]))
                             msg = email.message_from_bytes(response_part[1])
                             
                             # 제목 추출
@@ -92,6 +94,7 @@ def collect_emails():
                             summary = f"\n### 📩 From: {sender}\n**Subject:** {subject}\n**Content Snippet:** {clean_text(body)[:500]}..."
                             report_content.append(summary)
                             found_count += 1
+                            run_ledger.note_items()
                             print(f"   ✅ [수집] {target}: {subject[:30]}...")
                 except Exception as e:
                     print(f"   ⚠️ 메일 파싱 에러: {e}")
@@ -104,6 +107,8 @@ def collect_emails():
             save_path = os.path.join(SAVE_DIR, "email_briefing.txt")
             with open(save_path, "w", encoding="utf-8") as f:
                 f.write("\n".join(report_content))
+            run_ledger.note_file(save_path)
+            doc_index.record(save_path)
             print(f"🎉 총 {found_count}건의 투자 메일을 리포트로 저장했습니다.")
         else:
             print("☁️ 새로운 투자 메일이 없습니다.")
@@ -1,7 +1,11 @@
 import os
+import sys
 from datetime import datetime
 from duckduckgo_search import DDGS
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from src.core import run_ledger, doc_index
+
 # [설정]
 SAVE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "data", "ipo_data")
 if not os.path.exists(SAVE_DIR):
@@ -38,6 +42,7 @@ def collect_global_ipo_news():
                         link = r['href']
                         body = r['body']
                         report_lines.append(f"- [{title}]({link})\n  : {body}")
+                    run_ledger.note_items(len(results))
             except Exception as e:
                 print(f"   ⚠️ {region} 검색 실패: {e}")
 
@@ -49,6 +54,8 @@ def collect_global_ipo_news():
         save_path = os.path.join(SAVE_DIR, "global_ipo_news.txt")
         with open(save_path, "w", encoding="utf-8") as f:
             f.write(content)
+        run_ledger.note_file(save_path)
+        doc_index.record(save_path)
             
         print(f"🎉 글로벌 IPO 트렌드 수집 완료: {save_path}")
     else:
@@ -1,4 +1,5 @@
 import os
+import sys
 from datetime import datetime
 from duckduckgo_search import DDGS
 
@@ -8,6 +9,9 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(os.path.dirname(current_dir))
 SAVE_DIR = os.path.join(project_root, "data", "guru_data")
 
+sys.path.append(project_root)
+from src.core import run_ledger, doc_index
+
 if not os.path.exists(SAVE_DIR):
     os.makedirs(SAVE_DIR)
 
@@ -51,6 +55,7 @@ def collect_guru_insights():
                         link = r['href']
                         body = r['body']
                         report_lines.append(f"- [{title}]({link})\n  : {body}")
+                    run_ledger.note_items(len(results))
             except Exception as e:
                 print(f"   ⚠️ {name} 검색 실패: {e}")
 
@@ -64,6 +69,7 @@ def collect_guru_insights():
                     report_lines.append(f"\n### 🏦 {source}")
                     for r in results:
                         report_lines.append(f"- {r['title']}: {r['body']}")
+                    run_ledger.note_items(len(results))
             except: continue
 
     if report_lines:
@@ -74,6 +80,8 @@ def collect_guru_insights():
         save_path = os.path.join(SAVE_DIR, "guru_insights.txt")
         with open(save_path, "w", encoding="utf-8") as f:
             f.write(content)
+        run_ledger.note_file(save_path)
+        doc_index.record(save_path)
             
         print(f"🎉 거장들의 인사이트 수집 완료: {save_path}")
     else:
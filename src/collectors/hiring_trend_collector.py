@@ -1,9 +1,17 @@
-import requests
 import os
+import sys
 import json
 import time
 
-from config import paths
+# 프로젝트 루트 설정 (collectors -> src -> ProjectRoot)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(current_dir))
+
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from src.config import paths
+from src.core import http_client
 SAVE_DIR = paths.TREND_DATA_DIR
 if not os.path.exists(SAVE_DIR): os.makedirs(SAVE_DIR)
 
@@ -40,7 +48,7 @@ def collect_hiring_trends():
     }
     
     try:
-        res = requests.get(url, params=params, headers=headers, timeout=5)
+        res = http_client.get(url, params=params, headers=headers, timeout=5)
         
         if res.status_code != 200:
             print(f"❌ 사람인 API 연결 실패: {res.status_code}")
@@ -1,8 +1,11 @@
-import requests
 from bs4 import BeautifulSoup
 import os
+import sys
 from datetime import datetime
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from src.core import run_ledger, http_client, doc_index
+
 # [설정]
 SAVE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "data", "ipo_data")
 if not os.path.exists(SAVE_DIR):
@@ -18,7 +21,7 @@ def collect_korea_ipo():
     url = "http://www.38.co.kr/html/fund/index.htm?o=k"
     
     try:
-        res = requests.get(url, headers=HEADERS, timeout=10)
+        res = http_client.get(url, headers=HEADERS, timeout=10)
         res.encoding = 'EUC-KR' # 38커뮤니케이션은 인코딩 주의
         soup = BeautifulSoup(res.text, "html.parser")
         
@@ -54,7 +57,7 @@ def collect_us_ipo():
     url = "https://stockanalysis.com/ipos/calendar/"
     
     try:
-        res = requests.get(url, headers=HEADERS, timeout=10)
+        res = http_client.get(url, headers=HEADERS, timeout=10)
         soup = BeautifulSoup(res.text, "html.parser")
         
         # 테이블 찾기 (클래스명은 사이트 업데이트에 따라 변할 수 있어 보편적으로 탐색)
@@ -97,6 +100,9 @@ def run_collector():
         save_path = os.path.join(SAVE_DIR, "ipo_calendar.txt")
         with open(save_path, "w", encoding="utf-8") as f:
             f.write(content)
+        run_ledger.note_file(save_path)
+        doc_index.record(save_path)
+        run_ledger.note_items(len(all_ipos))
             
         print(f"🎉 IPO 데이터 수집 완료: {len(all_ipos)}건 저장됨.")
         print(f"📂 저장 경로: {save_path}")
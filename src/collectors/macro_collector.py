@@ -1,12 +1,6 @@
 import yfinance as yf
 import pandas as pd
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
-import time
 import os
 import sys
 from datetime import datetime
@@ -17,51 +11,79 @@ sys.path.append(project_root)
 
 # --- [설정] ---
 from src.config import paths
+from src.core import run_ledger, ohlc_store, browser_pool, page_ready, doc_index
 SAVE_DIR = paths.REPORTS_DATA_DIR
 TODAY_STR = datetime.now().strftime("%Y-%m-%d")
 
-# 1. 시장 지표 수집 (yfinance: history 모드)
+# 1. 시장 지표 수집 (yfinance: 일괄 다운로드 + 로컬 OHLC 저장소)
+TICKERS = {
+    "미국 10년물 국채": "^TNX",
+    "달러 인덱스": "DX-Y.NYB",
+    "원/달러 환율": "KRW=X",
+    "WTI 원유": "CL=F",
+    "구리 선물": "HG=F",
+    "필라델피아 반도체": "^SOX",
+    "공포지수(VIX)": "^VIX"
+}
+
+# 저장소에 이력이 없는 심볼이 있을 때 처음 받아 둘 기간
+BACKFILL_PERIOD = "1y"
+
+def download_bars(symbols):
+    """
+    전체 심볼을 yf.download 1회로 받아 OHLC 저장소에 반영 (저장된 마지막 날짜 이후만)
+    반환값: 저장한 봉 개수
+    """
+    last = ohlc_store.last_dates(symbols)
+    if all(last.values()):
+        # 마지막 저장일부터 다시 받음 (장중에 저장된 마지막 봉 갱신 포함)
+        kwargs = {"start": min(last.values())}
+    else:
+        kwargs = {"period": BACKFILL_PERIOD}
+
+    df = yf.download(symbols, group_by="ticker", auto_adjust=False, progress=False, threads=True, **kwargs)
+    if df is None or df.empty:
+        return 0
+
+    bars = []
+    for symbol in symbols:
+        try:
+            sub = df[symbol] if isinstance(df.columns, pd.MultiIndex) else df
+        except KeyError:
+            continue
+        sub = sub.dropna(subset=["Close"])  # 시장별 휴장일은 NaN
+        for ts, row in sub.iterrows():
+            bars.append((symbol, ts.strftime("%Y-%m-%d"),
+                         float(row["Open"]), float(row["High"]), float(row["Low"]),
+                         float(row["Close"]), float(row.get("Volume", 0) or 0)))
+    return ohlc_store.upsert_bars(bars)
+
+def _fmt_pct(value):
+    return f"{value:+.2f}%" if value is not None else "-"
+
 def collect_market_indices():
     print("📉 주요 시장 지표 수집 중 (Yahoo Finance API)...")
     
-    tickers = {
-        "미국 10년물 국채": "^TNX",
-        "달러 인덱스": "DX-Y.NYB",
-        "원/달러 환율": "KRW=X",
-        "WTI 원유": "CL=F",
-        "구리 선물": "HG=F",
-        "필라델피아 반도체": "^SOX",
-        "공포지수(VIX)": "^VIX"
-    }
-    
+    try:
+        saved = download_bars(list(TICKERS.values()))
+        print(f"   💾 {saved}개 일봉 갱신")
+    except Exception as e:
+        # 다운로드가 실패해도 저장소에 있는 이력으로 리포트는 작성
+        print(f"   ❌ 일괄 다운로드 에러: {e}")
+
     results = []
-    
-    for name, symbol in tickers.items():
-        try:
-            # [수정] fast_info 대신 history 사용 (주말/휴일 대응)
-            ticker = yf.Ticker(symbol)
-            # 최근 5일치 데이터를 가져와서 마지막 날짜(어제/금요일) 데이터를 씀
-            hist = ticker.history(period="5d")
-            
-            if not hist.empty:
-                # 가장 최근 종가
-                price = hist['Close'].iloc[-1]
-                
-                # 전일 종가 (데이터가 2개 이상일 때만)
-                if len(hist) >= 2:
-                    prev_close = hist['Close'].iloc[-2]
-                    change_pct = ((price - prev_close) / prev_close) * 100
-                else:
-                    change_pct = 0.0
-                
-                res_str = f"[{name}] {price:,.2f} ({change_pct:+.2f}%)"
-                results.append(res_str)
-                print(f"   ✅ {res_str}")
-            else:
-                print(f"   ⚠️ 데이터 없음 (History Empty): {name}")
-                
-        except Exception as e:
-            print(f"   ❌ 에러 ({name}): {e}")
+    for name, symbol in TICKERS.items():
+        s = ohlc_store.summarize(symbol)
+        if not s:
+            print(f"   ⚠️ 데이터 없음 (History Empty): {name}")
+            continue
+
+        res_str = (f"[{name}] {s['price']:,.2f} ({_fmt_pct(s['chg_1d'])}) "
+                   f"| 5일 {_fmt_pct(s['chg_5d'])} | 20일 {_fmt_pct(s['chg_20d'])} "
+                   f"| 52주 {s['low_52w']:,.2f}~{s['high_52w']:,.2f}")
+        results.append(res_str)
+        run_ledger.note_items()
+        print(f"   ✅ {res_str}")
 
     return "\n".join(results)
 
@@ -70,40 +92,28 @@ def collect_economic_calendar():
     print("\n📅 경제 캘린더 수집 중 (Investing.com via Selenium)...")
     
     url = "https://www.investing.com/economic-calendar/"
-    
-    chrome_options = Options()
-    chrome_options.add_argument("--headless") 
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    
-    # [핵심 수정] 페이지 로드 전략 변경: 'eager'
-    # HTML 콘텐츠만 로드되면(이미지/CSS/광고 로딩 전) 바로 넘어감 -> 타임아웃 방지
-    chrome_options.page_load_strategy = 'eager'
-    
-    # 봇 탐지 회피
-    chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
 
     calendar_data = []
 
     try:
-        # webdriver_manager로 드라이버 자동 설치 및 실행
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-        
-        # 타임아웃 설정 (최대 30초)
-        driver.set_page_load_timeout(30)
-        
-        try:
-            driver.get(url)
-        except Exception as e:
-            print(f"   ⚠️ 페이지 로딩 시간 초과 (무시하고 진행): {e}")
-            # Eager 모드라 타임아웃 나도 HTML은 받아졌을 수 있음
+        # 공용 설정(browser_pool)으로 headless Chrome 실행 (eager 로딩 / UA / 30초 타임아웃 / 드라이버 경로 캐시)
+        with browser_pool.browser() as driver:
+            try:
+                driver.get(url)
+            except Exception as e:
+                print(f"   ⚠️ 페이지 로딩 시간 초과 (무시하고 진행): {e}")
+                # Eager 모드라 타임아웃 나도 HTML은 받아졌을 수 있음
 
-        time.sleep(3) # 약간의 렌더링 대기
+            # 고정 대기 대신 캘린더 행 수가 안정될 때까지 대기 (최대 15초)
+            # 실시간 티커/광고 때문에 DOM/네트워크는 계속 움직이므로 행 수만 봄
+            page_ready.wait_until_ready(driver, "macro_calendar",
+                                        count_script="document.querySelectorAll('#economicCalendarData tr.js-event-item').length",
+                                        conditions=("count",), timeout=15)
 
-        # HTML 파싱
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
-        driver.quit() # 브라우저 닫기
+            # HTML 파싱
+            page_source = driver.page_source
+        run_ledger.note_download(len(page_source.encode("utf-8")))
+        soup = BeautifulSoup(page_source, 'html.parser')
 
         # 테이블 찾기
         table = soup.find('table', id='economicCalendarData')
@@ -137,6 +147,7 @@ def collect_economic_calendar():
                 if currency in ['USD', 'KRW']:
                     info = f"[{time_str}] ({currency}) {event} | 예측: {forecast} / 실제: {actual}"
                     calendar_data.append(info)
+                    run_ledger.note_items()
                     print(f"   🌟 {info}")
                     found_count += 1
         
@@ -158,11 +169,17 @@ def save_report(market_text, calendar_text):
         f.write(market_text + "\n\n")
         f.write("[2. 오늘 주요 경제 일정 (별 3개)]\n")
         f.write(calendar_text + "\n")
+    run_ledger.note_file(filename)
+    doc_index.record(filename)
     print(f"\n✅ 매크로 리포트 저장 완료: {filename}")
 
+def run_macro_collector():
+    """시장 지표 + 경제 캘린더 수집 후 리포트 저장"""
+    market_data = collect_market_indices()
+    calendar_data = collect_economic_calendar()
+    save_report(market_data, calendar_data)
+
 if __name__ == "__main__":
     # 라이브러리 설치 안내
     # pip install yfinance selenium webdriver-manager beautifulsoup4
-    market_data = collect_market_indices()
-    calendar_data = collect_economic_calendar()
-    save_report(market_data, calendar_data)
\ No newline at end of file
+    run_macro_collector()
\ No newline at end of file
@@ -1,10 +1,13 @@
-import requests
-import xml.etree.ElementTree as ET
 import time
 import os
+import sys
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 PROJECT_ROOT = os.path.abspath(os.path.join(current_dir, "../../"))
+sys.path.append(PROJECT_ROOT)
+
+from src.core import run_ledger, fan_out, xml_stream, doc_index
+
 DATA_DIR = os.path.join(PROJECT_ROOT, "data", "assets")
 OUTPUT_FILE = os.path.join(DATA_DIR, "onbid_investment_list.txt")
 
@@ -23,46 +26,50 @@ def analyze_investment_type(name, category, detail):
     tags.append("[💸매각]")
     return tags
 
-def run_collector():
-    print("="*60)
-    print("🚀 온비드 수집기 (1줄 요약 모드)")
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-        f.write(f"DATE: {time.strftime('%Y-%m-%d')}\n\n")
+URL = "http://openapi.onbid.co.kr/openapi/services/ThingInfoInquireSvc/getUnifyUsageCltr"
+PAGE_SIZE = 100
 
-    total_collected = 0
-    for region in TARGET_REGIONS:
-        print(f"📡 {region} 스캔 중...")
-        # 파라미터 최적화
-        final_url = "http://openapi.onbid.co.kr/openapi/services/ThingInfoInquireSvc/getUnifyUsageCltr"
-        params = {"serviceKey": API_KEY, "pageNo": "1", "numOfRows": "50", "DPSL_MTD_CD": "0001", "SIDO": region}
-        
-        try:
-            res = requests.get(final_url, params=params, timeout=30)
-            if res.status_code != 200: continue
+def fetch_region(region):
+    """시도 1곳의 공매 물건 -> 1줄 요약 목록"""
+    print(f"📡 {region} 스캔 중...")
+    params = {"serviceKey": API_KEY, "DPSL_MTD_CD": "0001", "SIDO": region}
+    
+    lines = []
+    try:
+        # totalCount까지 전 페이지를 스트리밍 파싱 (물건이 많아도 XML 트리를 통째로 들고 있지 않음)
+        for item in xml_stream.iter_pages(URL, params, page_size=PAGE_SIZE, timeout=30):
+            cltr_nm = item.findtext('CLTR_NM') or ""
+            price = item.findtext('MIN_BID_PRC') or "0"
+            ctgr = item.findtext('CTGR_FULL_NM') or ""
+            addr = item.findtext('LDNM_ADRS') or ""
             
-            root = ET.fromstring(res.text)
-            if root.find('.//resultCode').text != '00': continue
+            tags = analyze_investment_type(cltr_nm, ctgr, item.findtext('GOODS_NM') or "")
+            tag_str = " ".join(tags)
             
-            items = root.findall('.//item')
-            if not items: continue
+            # [핵심] 1줄 포맷팅
+            lines.append(f"- {tag_str} {cltr_nm} | 💰{int(price):,}원 | 📍{addr}")
+            run_ledger.note_items()
+    except Exception as e:
+        print(f"   ⚠️ {region} 에러: {e}")
+    return lines
 
-            with open(OUTPUT_FILE, "a", encoding="utf-8") as f:
-                for item in items:
-                    cltr_nm = item.find('CLTR_NM').text or ""
-                    price = item.find('MIN_BID_PRC').text or "0"
-                    ctgr = item.find('CTGR_FULL_NM').text or ""
-                    addr = item.find('LDNM_ADRS').text or ""
-                    
-                    tags = analyze_investment_type(cltr_nm, ctgr, item.find('GOODS_NM').text or "")
-                    tag_str = " ".join(tags)
-                    
-                    # [핵심] 1줄 포맷팅
-                    line = f"- {tag_str} {cltr_nm} | 💰{int(price):,}원 | 📍{addr}"
-                    f.write(line + "\n")
-                    total_collected += 1
-            time.sleep(0.5)
-        except: pass
+def run_collector(max_workers=None):
+    print("="*60)
+    print("🚀 온비드 수집기 (1줄 요약 모드)")
+
+    # 시도별 동시 수집 -> TARGET_REGIONS 순서대로 병합
+    results = fan_out.map_ordered(fetch_region, TARGET_REGIONS, max_workers)
+
+    total_collected = 0
+    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
+        f.write(f"DATE: {time.strftime('%Y-%m-%d')}\n\n")
+        for lines in results:
+            for line in lines or []:
+                f.write(line + "\n")
+                total_collected += 1
 
+    run_ledger.note_file(OUTPUT_FILE)
+    doc_index.record(OUTPUT_FILE)
     print(f"🎉 총 {total_collected}건 저장 완료: {OUTPUT_FILE}")
 
 if __name__ == "__main__":
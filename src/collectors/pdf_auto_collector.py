@@ -1,9 +1,6 @@
-import requests
 import json
-import io
 import sys
 import os
-from pypdf import PdfReader
 from pathlib import Path
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -11,6 +8,7 @@ project_root = os.path.dirname(os.path.dirname(os.path.dirname(current_dir)))
 sys.path.append(project_root)
 
 from src.config import paths
+from src.core import run_ledger, http_client, cursor_state, pdf_text, doc_index
 
 # --- [설정] ---
 SECRET_FILE = paths.SECRETS_FILE
@@ -44,58 +42,29 @@ def save_history(history_list):
     with open(HISTORY_FILE, 'w', encoding='utf-8') as f:
         json.dump(history_list, f, indent=4)
 
-def get_latest_report_info(headers):
-    """리포트 목록 API에서 최신 ID와 제목 가져오기"""
-    list_url = "https://api.saveticker.com/api/reports/list?page=1&page_size=1&sort=created_at_desc"
+PAGE_SIZE = 20
+
+def fetch_report_page(page, headers):
+    """리포트 목록 API 1페이지 (최신순, 실패 시 None)"""
+    list_url = f"https://api.saveticker.com/api/reports/list?page={page}&page_size={PAGE_SIZE}&sort=created_at_desc"
     try:
-        response = requests.get(list_url, headers=headers)
+        response = http_client.get(list_url, headers=headers, timeout=10)
         if response.status_code == 200:
             data = response.json()
             # 리스트 키 확인 (reports 혹은 report_list)
-            report_list = data.get('reports', []) or data.get('report_list', [])
-            
-            if report_list:
-                latest = report_list[0]
-                return latest['id'], latest['title']
+            return data.get('reports', []) or data.get('report_list', [])
     except Exception as e:
         print(f"⚠️ 목록 조회 에러: {e}")
-    return None, None
-
-def collect_pdf_report():
-    # 1. 준비
-    token = load_token()
-    if not token: return
-    
-    headers = {
-        "User-Agent": "Mozilla/5.0 ...",
-        "Authorization": token
-    }
-    
-    # 2. 이미 받은 ID 목록 불러오기
-    downloaded_ids = load_history()
-
-    # 3. 최신 리포트 확인
-    print("📡 최신 리포트 탐색 중...")
-    report_id, title = get_latest_report_info(headers)
-    
-    if not report_id:
-        print("❌ 리포트 정보를 가져오지 못했습니다.")
-        return
+    return None
 
-    # 4. [핵심] ID로 중복 체크 (파일명 비교 X)
-    if report_id in downloaded_ids:
-        print(f"⏭️ [Pass] 이미 수집한 리포트입니다. (ID: {report_id})")
-        return
-
-    print(f"🆕 새 리포트 발견! 수집을 시작합니다: {title}")
-
-    # 5. 상세 정보 및 다운로드 로직 (기존과 동일)
+def download_report(report_id, title, headers):
+    """리포트 1건 PDF 다운로드 -> 텍스트 저장. 성공 시 True"""
     detail_url = f"https://api.saveticker.com/api/reports/detail/{report_id}"
-    res = requests.get(detail_url, headers=headers)
+    res = http_client.get(detail_url, headers=headers, timeout=10)
     
     if res.status_code != 200:
         print("❌ 상세 조회 실패 (토큰 만료 가능성)")
-        return
+        return False
 
     data = res.json()
     pdf_relative_url = data.get('report', {}).get('pdf_url')
@@ -104,34 +73,77 @@ def collect_pdf_report():
         print("⚠️ PDF 파일이 없습니다.")
         # PDF가 없더라도 ID는 기록해서 다시 체크 안 하게 할지 결정 필요
         # 여기서는 저장 안 함 (다음에 다시 시도하도록)
-        return
+        return False
 
     pdf_url = f"https://api.saveticker.com{pdf_relative_url}"
-    pdf_res = requests.get(pdf_url, headers=headers)
+    # 변환 및 저장 (임시 파일로 스트리밍 다운로드, 받으면서 해시 계산)
+    safe_title = "".join([c for c in title if c.isalnum() or c in (' ', '-', '_')]).strip()
+    filename = f"{SAVE_DIR}/{safe_title}.txt"
     
-    if pdf_res.status_code == 200:
-        # 변환 및 저장
-        safe_title = "".join([c for c in title if c.isalnum() or c in (' ', '-', '_')]).strip()
-        filename = f"{SAVE_DIR}/{safe_title}.txt"
-        
-        pdf_file = io.BytesIO(pdf_res.content)
-        reader = PdfReader(pdf_file)
-        
-        full_text = f"Title: {title}\nID: {report_id}\nSource: {detail_url}\n{'-'*30}\n\n"
-        for page in reader.pages:
-            full_text += page.extract_text() + "\n"
-        
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(full_text)
-            
-        print(f"✅ 저장 완료: {filename}")
-        
-        # 6. [중요] 성공했으므로 ID 대장에 기록
-        downloaded_ids.append(report_id)
-        save_history(downloaded_ids)
+    with pdf_text.download(pdf_url, headers=headers, timeout=(10, 60)) as pdf:
+        if pdf is None:
+            return False
+        pages = pdf_text.extract_pages(pdf.path, sha=pdf.sha256)
+    full_text = f"Title: {title}\nID: {report_id}\nSource: {detail_url}\n{'-'*30}\n\n"
+    full_text += "".join(f"{text}\n" for text in pages)
+    
+    with open(filename, "w", encoding="utf-8") as f:
+        f.write(full_text)
+    run_ledger.note_file(filename)
+    doc_index.record(filename)
+    run_ledger.note_items()
         
-    else:
-        print("❌ PDF 다운로드 실패")
+    print(f"✅ 저장 완료: {filename}")
+    return True
+
+def collect_pdf_report():
+    # 1. 준비
+    token = load_token()
+    if not token: return
+    
+    # User-Agent 등 공통 헤더는 http_client 기본값 사용
+    headers = {
+        "Authorization": token
+    }
+    
+    # 2. 이미 받은 ID 목록 불러오기
+    downloaded_ids = load_history()
+
+    # 3. 지난 수집 지점 이후의 리포트 탐색 (페이지 순회)
+    print("📡 최신 리포트 탐색 중...")
+    reports, complete = cursor_state.walk_pages("reports", lambda page: fetch_report_page(page, headers), PAGE_SIZE)
+    
+    if not reports:
+        print("⏭️ [Pass] 새 리포트가 없습니다.")
+        return
+
+    failed_ids = []
+    for report in reports:
+        report_id, title = report['id'], report['title']
+
+        # 4. [핵심] ID로 중복 체크 (파일명 비교 X)
+        if report_id in downloaded_ids:
+            print(f"⏭️ [Pass] 이미 수집한 리포트입니다. (ID: {report_id})")
+            continue
+
+        print(f"🆕 새 리포트 발견! 수집을 시작합니다: {title}")
+
+        # 5. 상세 정보 및 다운로드
+        try:
+            ok = download_report(report_id, title, headers)
+        except Exception as e:
+            print(f"⚠️ 리포트 처리 에러: {title} ({e})")
+            ok = False
+
+        if ok:
+            # 6. [중요] 성공했으므로 ID 대장에 기록
+            downloaded_ids.append(report_id)
+            save_history(downloaded_ids)
+        else:
+            failed_ids.append(report_id)
+
+    # 7. 수위표 전진 (실패한 리포트는 다음 실행에서 다시 시도)
+    cursor_state.advance("reports", reports, failed_ids=failed_ids, complete=complete)
 
 if __name__ == "__main__":
     collect_pdf_report()
\ No newline at end of file
@@ -11,12 +11,11 @@ project_root = os.path.dirname(os.path.dirname(current_dir))
 sys.path.append(project_root)
 
 # 4. 모듈 임포트 (src.config로 접근)
-import requests
 import json
-import time
+import heapq
 from datetime import datetime, timedelta
-import xml.etree.ElementTree as ET
 from src.config import paths  # [수정] 경로 문제 해결
+from src.core import run_ledger, fan_out, xml_stream, doc_index
 
 # [설정]
 SAVE_DIR = paths.ASSET_DATA_DIR
@@ -38,7 +37,49 @@ def load_regions():
     with open(REGIONS_FILE, 'r', encoding='utf-8') as f:
         return json.load(f)
 
-def collect_commercial_real_estate():
+URL = "http://apis.data.go.kr/1613000/RTMSDataSvcNrgTrade/getRTMSDataSvcNrgTrade"
+PAGE_SIZE = 100
+
+def fetch_region(target, deal_ym):
+    """지역 1곳의 실거래 -> 리포트 줄 목록 (없으면 빈 리스트)"""
+    name = target['name']
+    code = target['code']
+    print(f"   🔎 수집 중: {name}...")
+
+    params = {"serviceKey": API_KEY, "LAWD_CD": code, "DEAL_YMD": deal_ym}
+
+    def iter_deals():
+        # totalCount까지 전 페이지를 스트리밍 파싱 (거래가 많아도 메모리는 일정)
+        for item in xml_stream.iter_pages(URL, params, page_size=PAGE_SIZE, verify=False, timeout=15):
+            price = get_text(item, 'dealAmount')
+            date = f"{get_text(item, 'dealMonth')}/{get_text(item, 'dealDay')}"
+            b_type = get_text(item, 'buildingType')
+            usage = get_text(item, 'buildingUse')
+            
+            if b_type == '일반':
+                area = get_text(item, 'plottageAr')
+                desc = f"🏢통건물 | {usage} | 대지 {area}㎡ | {price}만"
+            else:
+                floor = get_text(item, 'floor')
+                area = get_text(item, 'excluUseAr')
+                desc = f"🏬집합 | {usage}({floor}층) | 전용 {area}㎡ | {price}만"
+            
+            run_ledger.note_items()
+            yield f"{date} | {desc}"
+
+    try:
+        # 가격순 정렬 (문자열 길이 대용) 상위 10개만 유지 (너무 길면 안읽음)
+        region_deals = heapq.nlargest(10, iter_deals(), key=len)
+        if not region_deals:
+            return []
+        # 지역별 헤더 추가
+        return [f"\n### 📍 {name}"] + region_deals
+    
+    except Exception as e:
+        print(f"   ⚠️ {name} 에러: {e}")
+        return []
+
+def collect_commercial_real_estate(max_workers=None):
     print("🏗️ 상업용 부동산 멀티 수집 중...")
     
     targets = load_regions()
@@ -47,62 +88,17 @@ def collect_commercial_real_estate():
     deal_ym = last_month.strftime("%Y%m")
     
     full_report = [f"[통합 상업용 부동산 실거래 ({deal_ym})]\n{'='*40}"]
-    
-    url = "http://apis.data.go.kr/1613000/RTMSDataSvcNrgTrade/getRTMSDataSvcNrgTrade"
-
-    for target in targets:
-        name = target['name']
-        code = target['code']
-        print(f"   🔎 수집 중: {name}...")
 
-        params = {
-            "serviceKey": API_KEY, "LAWD_CD": code, "DEAL_YMD": deal_ym,
-            "numOfRows": "50", "pageNo": "1" # 지역별 50개 제한
-        }
-
-        try:
-            res = requests.get(url, params=params, verify=False)
-            if res.status_code != 200: continue
-
-            root = ET.fromstring(res.content)
-            items = root.findall('.//item')
-            
-            if not items:
-                continue
-
-            region_deals = []
-            for item in items:
-                price = get_text(item, 'dealAmount')
-                date = f"{get_text(item, 'dealMonth')}/{get_text(item, 'dealDay')}"
-                b_type = get_text(item, 'buildingType')
-                usage = get_text(item, 'buildingUse')
-                
-                if b_type == '일반':
-                    area = get_text(item, 'plottageAr')
-                    desc = f"🏢통건물 | {usage} | 대지 {area}㎡ | {price}만"
-                else:
-                    floor = get_text(item, 'floor')
-                    area = get_text(item, 'excluUseAr')
-                    desc = f"🏬집합 | {usage}({floor}층) | 전용 {area}㎡ | {price}만"
-                
-                region_deals.append(f"{date} | {desc}")
-
-            # 지역별 헤더 추가
-            if region_deals:
-                # 가격순 정렬 (문자열 길이 대용)
-                region_deals.sort(key=lambda x: len(x), reverse=True)
-                full_report.append(f"\n### 📍 {name}")
-                full_report.extend(region_deals[:10]) # 지역별 상위 10개만 기록 (너무 길면 안읽음)
-        
-        except Exception as e:
-            print(f"   ⚠️ {name} 에러: {e}")
-        
-        time.sleep(0.5)
+    # 지역별 동시 수집 -> regions.json 순서대로 병합
+    for lines in fan_out.map_ordered(lambda t: fetch_region(t, deal_ym), targets, max_workers):
+        full_report.extend(lines or [])
 
     # 최종 저장
     if len(full_report) > 1:
         with open(f"{SAVE_DIR}/commercial_real_estate.txt", "w", encoding="utf-8") as f:
             f.write("\n".join(full_report))
+        run_ledger.note_file(f"{SAVE_DIR}/commercial_real_estate.txt")
+        doc_index.record(f"{SAVE_DIR}/commercial_real_estate.txt")
         print(f"✅ 부동산 데이터 통합 저장 완료.")
     else:
         print("☁️ 수집된 거래 내역이 없습니다.")
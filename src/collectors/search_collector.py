@@ -1,17 +1,14 @@
-import requests
 import json
 import os
 import datetime
-import time
-import io
 import sys
-from pypdf import PdfReader # [추가] PDF 변환용
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(current_dir)))
 sys.path.append(project_root)
 
 from src.config import paths
+from src.core import run_ledger, http_client, pdf_text, doc_index
 
 # --- [설정] ---
 SECRET_FILE = paths.SECRETS_FILE
@@ -49,7 +46,7 @@ def google_search(query, api_key, cx):
         'num': 2 # 상위 2개만 (API 절약)
     }
     try:
-        res = requests.get(url, params=params)
+        res = http_client.get(url, params=params, timeout=10)
         if res.status_code == 200:
             return res.json().get('items', [])
         return []
@@ -61,39 +58,29 @@ def download_and_convert_pdf(url, title):
     """PDF 다운로드 후 텍스트로 변환하여 저장"""
     try:
         print(f"   📥 다운로드 중: {title}")
-        res = requests.get(url, headers=HEADERS, timeout=15)
-        
-        if res.status_code == 200:
-            # 1. 메모리 상에서 PDF 읽기
-            pdf_file = io.BytesIO(res.content)
-            reader = PdfReader(pdf_file)
-            
-            # 2. 텍스트 추출
-            full_text = f"Title: {title}\nURL: {url}\nDATE: {datetime.date.today()}\n{'-'*30}\n\n"
-            text_extracted = False
-            
-            for page in reader.pages:
-                extracted = page.extract_text()
-                if extracted:
-                    full_text += extracted + "\n"
-                    text_extracted = True
-            
-            if not text_extracted:
-                print("   ⚠️ 텍스트 추출 실패 (이미지 PDF일 가능성)")
+        # 1. 임시 파일로 스트리밍 다운로드 후 텍스트 추출 (이미 추출한 적 있는 PDF면 캐시에서)
+        with pdf_text.download(url, headers=HEADERS, timeout=(10, 60)) as pdf:
+            if pdf is None:
                 return False
+            body = pdf_text.extract_text(pdf.path, sha=pdf.sha256)
+        
+        if not body:
+            print("   ⚠️ 텍스트 추출 실패 (이미지 PDF일 가능성)")
+            return False
 
-            # 3. .txt 파일로 저장
-            safe_title = "".join([c for c in title if c.isalnum() or c in (' ', '-', '_')]).strip()
-            filename = f"{SAVE_DIR}/{safe_title}.txt" # 확장자를 txt로 변경
+        # 2. .txt 파일로 저장
+        full_text = f"Title: {title}\nURL: {url}\nDATE: {datetime.date.today()}\n{'-'*30}\n\n" + body
+        safe_title = "".join([c for c in title if c.isalnum() or c in (' ', '-', '_')]).strip()
+        filename = f"{SAVE_DIR}/{safe_title}.txt" # 확장자를 txt로 변경
+        
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write(full_text)
+        run_ledger.note_file(filename)
+        doc_index.record(filename)
+        run_ledger.note_items()
             
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(full_text)
-                
-            print(f"   ✅ 변환 및 저장 완료: {filename}")
-            return True
-        else:
-            print(f"   ❌ 다운로드 실패 ({res.status_code})")
-            return False
+        print(f"   ✅ 변환 및 저장 완료: {filename}")
+        return True
             
     except Exception as e:
         print(f"   ❌ 에러 발생: {e}")
@@ -141,8 +128,6 @@ def collect_reports():
                 downloaded_urls.append(link)
                 save_history(downloaded_urls)
                 new_count += 1
-            
-            time.sleep(2)
 
     if new_count > 0:
         print(f"\n🎉 총 {new_count}개의 글로벌 리포트를 새로 추가했습니다.")
@@ -1,4 +1,3 @@
-import requests
 import json
 import os
 import sys
@@ -9,6 +8,7 @@ project_root = os.path.dirname(os.path.dirname(os.path.dirname(current_dir)))
 sys.path.append(project_root)
 
 from src.config import paths
+from src.core import run_ledger, http_client
 
 # --- [설정] ---
 SAVE_DIR = paths.WEATHER_DATA_DIR
@@ -41,7 +41,8 @@ def get_weather_report():
         url = f"https://api.openweathermap.org/data/2.5/weather?lat={loc['lat']}&lon={loc['lon']}&appid={API_KEY}&units=metric"
         
         try:
-            res = requests.get(url).json()
+            response = http_client.get(url, timeout=10)
+            res = response.json()
             
             # 주요 데이터 추출
             weather_main = res['weather'][0]['main'] # Rain, Clear, Snow, Extreme 등
@@ -65,6 +66,7 @@ def get_weather_report():
             # 리포트 라인 생성
             line = f"- **{name} ({loc['desc']}):** {warning_flag} {weather_main} ({desc}), {temp}°C, 바람 {wind_speed}m/s"
             report_lines.append(line)
+            run_ledger.note_items()
             
         except Exception as e:
             print(f"⚠️ {name} 날씨 조회 실패: {e}")
@@ -77,6 +79,7 @@ def get_weather_report():
     # analyst.py가 읽기 쉽게 txt로 저장
     with open(SAVE_DIR / "current_weather.txt", "w", encoding="utf-8") as f:
         f.write(full_report)
+    run_ledger.note_file(SAVE_DIR / "current_weather.txt")
         
     print("✅ 기상 정보 업데이트 완료.")
     return full_report
@@ -23,11 +23,14 @@ TREND_DATA_DIR = DATA_DIR / "trends"
 IPO_DATA_DIR = DATA_DIR / "ipo_data"
 GURU_DATA_DIR = DATA_DIR / "guru_data"
 DB_DIR = DATA_DIR / "database"
+LOCK_DIR = DATA_DIR / "locks"
+HTTP_CACHE_DIR = DATA_DIR / "http_cache"
+PDF_TEXT_CACHE_DIR = DATA_DIR / "pdf_text"
 
 # 폴더 없으면 자동 생성
 for d in [DATA_DIR, AI_NEWS_DATA_DIR, WEATHER_DATA_DIR, ASSET_DATA_DIR, 
           COMMUNITY_DATA_DIR, NEWS_DATA_DIR, REPORTS_DATA_DIR, TREND_DATA_DIR, 
-          IPO_DATA_DIR, GURU_DATA_DIR, DB_DIR]:
+          IPO_DATA_DIR, GURU_DATA_DIR, DB_DIR, LOCK_DIR, HTTP_CACHE_DIR, PDF_TEXT_CACHE_DIR]:
     d.mkdir(parents=True, exist_ok=True)
 
 # ---------------------------------------------------------
@@ -45,4 +48,7 @@ SECRETS_FILE = CONFIG_DIR / "secrets.json"
 DB_FILE = DB_DIR / "my_chat_log.db"
 ANALYSIS_STATE_FILE = DATA_DIR / "analysis_state.json"
 DOWNLOAD_HISTORY_FILE = DATA_DIR / "download_history.json"
-SEARCH_HISTORY_FILE = DATA_DIR / "search_history.json"
\ No newline at end of file
+SEARCH_HISTORY_FILE = DATA_DIR / "search_history.json"
+COLLECTOR_FRESHNESS_FILE = DATA_DIR / "collector_freshness.json"
+COLLECTOR_CURSOR_FILE = DATA_DIR / "collector_cursors.json"
+BROWSER_DRIVER_CACHE_FILE = DATA_DIR / "chromedriver_path.json"
\ No newline at end of file
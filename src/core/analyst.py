@@ -1,5 +1,4 @@
 import sqlite3
-import glob
 import json
 import google.generativeai as genai
 from datetime import datetime, timedelta
@@ -7,7 +6,6 @@ import os
 import hashlib
 import time
 import sys
-from pypdf import PdfReader
 
 # ---------------------------------------------------------
 # [1] 경로 설정 수정 (여기가 범인!)
@@ -58,6 +56,24 @@ TECH_DIRS = [paths.NEWS_DATA_DIR, paths.AI_NEWS_DATA_DIR, paths.REPORTS_DATA_DIR
 WEATHER_FILE = paths.WEATHER_DATA_DIR / "current_weather.txt"
 STATE_FILE = paths.ANALYSIS_STATE_FILE
 
+# PDF는 앞부분(표지/목차/요약)만 쓰므로 출처 폴더별 예산만큼만 페이지를 추출
+# (max_chars: 글자 수, max_pages: 앞에서부터 읽을 최대 페이지)
+PDF_BUDGETS = {
+    "reports": {"max_chars": 1000, "max_pages": 5},   # 기관 전망 리포트: 목차 + 요약이 앞 몇 장에 있음
+}
+DEFAULT_PDF_BUDGET = {"max_chars": 1000, "max_pages": 3}
+
+# 단계별 프롬프트에 넣을 데이터 예산 (토큰, 추정치) -> 매일 프롬프트 크기/지연이 일정하도록
+STAGE_TOKEN_BUDGETS = {
+    "asset": int(os.getenv("ASSET_STAGE_TOKENS", "12000")),
+    "tech": int(os.getenv("TECH_STAGE_TOKENS", "16000")),
+    "questions": int(os.getenv("QUESTION_TOKENS", "1000")),
+    "guru": int(os.getenv("GURU_STAGE_TOKENS", "4000")),
+}
+
+# 관심사/최근 질문으로 검색해 단계별로 넣을 관련 패시지 수 (최신 파일보다 먼저 채움)
+RETRIEVAL_TOP_K = int(os.getenv("RETRIEVAL_TOP_K", "12"))
+
 def load_api_key():
     try:
         with open(paths.SECRETS_FILE, 'r', encoding='utf-8') as f:
@@ -73,6 +89,8 @@ if API_KEY:
 else:
     print("❌ API Key not found in secrets.json")
 
+from src.core import job_manager, run_ledger, pdf_text, doc_index, context_packer, search_index
+
 try:
     from src.collectors.calendar_agent import get_market_seasonality
 except ImportError:
@@ -93,54 +111,68 @@ CORE_INTERESTS = """
 # 1. 헬퍼 함수 (데이터 로드)
 # ---------------------------------------------------------
 
-def convert_pdf_to_text(pdf_path):
+def convert_pdf_to_text(pdf_path, max_chars=None, max_pages=None):
+    # 같은 PDF는 추출 캐시(내용 해시 기준)에서 바로 가져옴, 예산을 주면 그만큼만 앞에서부터 추출
     try:
-        reader = PdfReader(pdf_path)
-        text = ""
-        for page in reader.pages:
-            extracted = page.extract_text()
-            if extracted: text += extracted + "\n"
-        return text
+        if max_chars is None:
+            return pdf_text.extract_text(pdf_path)
+        return pdf_text.read_text(pdf_path, max_chars, max_pages)
     except: return ""
 
 def get_data_from_dirs(target_dirs):
-    """특정 폴더 리스트에서 데이터 로드"""
-    all_content = []
+    """
+    특정 폴더 리스트에서 최신 문서 로드 (폴더 순서 = 프롬프트 우선순위)
+    반환값: [{"source", "header", "text"}, ...] -> context_packer.pack()으로 예산에 맞춰 넣음
+    """
+    docs = []
     for folder in target_dirs:
         # folder is a Path object, convert to str for checking existence if needed, 
         # but Path.exists() works. 
         if not folder.exists(): continue
         
-        # Glob needs string path
-        files = glob.glob(str(folder / "*"))
-        files.sort(key=os.path.getmtime, reverse=True)
-        
+        # 문서 색인에서 최신순으로 (폴더 전체 glob + 파일별 stat 정렬 대신)
         count = 0
-        for filepath in files:
+        for doc in doc_index.iter_newest(folder):
             if count >= 3: break # 폴더별 3개 제한
             try:
+                filepath = doc["path"]
                 filename = os.path.basename(filepath)
-                # 텍스트 제한을 조금 여유있게 (Flash 모델 기준)
+                # 읽기 상한 (실제로 프롬프트에 들어가는 양은 단계별 토큰 예산이 정함)
                 limit = 100000 
                 
                 if filepath.endswith(".json") and "state" not in filename:
                     with open(filepath, 'r', encoding='utf-8') as f:
                         data = json.load(f)
-                        content = data.get('content', '')[:limit].replace('\n', ' ')
-                        all_content.append(f"[{folder.name}] {data.get('title','No Title')}: {content}")
+                        docs.append({"source": folder.name,
+                                     "header": f"[{folder.name}] {data.get('title','No Title')}:",
+                                     "text": data.get('content', '')[:limit]})
                     count += 1
                 elif filepath.endswith(".txt"):
                     with open(filepath, 'r', encoding='utf-8') as f:
-                        text = f.read()[:limit].replace('\n', ' ')
-                        all_content.append(f"[{folder.name}/{filename}] {text}")
+                        docs.append({"source": folder.name,
+                                     "header": f"[{folder.name}/{filename}]",
+                                     "text": f.read()[:limit]})
                     count += 1
                 elif filepath.endswith(".pdf"):
-                    text = convert_pdf_to_text(filepath)
+                    budget = PDF_BUDGETS.get(folder.name, DEFAULT_PDF_BUDGET)
+                    text = convert_pdf_to_text(filepath, **budget)
                     if text:
-                        all_content.append(f"[{folder.name}] PDF: {text[:1000].replace('\n', ' ')}")
+                        docs.append({"source": folder.name, "header": f"[{folder.name}] PDF:", "text": text})
                         count += 1
             except: continue
-    return "\n\n".join(all_content)
+    return docs
+
+def get_relevant_passages(query, target_dirs, k=None):
+    """
+    로컬 검색 색인(BM25)에서 query와 관련 높은 패시지 상위 k개 (get_data_from_dirs와 같은 형식)
+    색인 오류가 나도 분석은 최신 파일만으로 계속되도록 빈 목록을 돌려줍니다.
+    """
+    try:
+        hits = search_index.search(query, k or RETRIEVAL_TOP_K, sources=[d.name for d in target_dirs])
+    except Exception as e:
+        print(f"⚠️ [Search] 검색 실패: {e}")
+        return []
+    return [{"source": hit["source"], "header": hit["header"], "text": hit["text"]} for hit in hits]
 
 def get_recent_questions(days=1):
     conn = sqlite3.connect(DB_FILE)
@@ -202,10 +234,17 @@ def generate_daily_briefing():
 
     try:
         # 데이터 로드 (섹터별 분리)
-        asset_raw = get_data_from_dirs(ASSET_DIRS)
-        tech_raw = get_data_from_dirs(TECH_DIRS)
         recent_qs = get_recent_questions()
-        qs_text = recent_qs if recent_qs else CORE_INTERESTS
+        qs_text = context_packer.cut_to_tokens(recent_qs, STAGE_TOKEN_BUDGETS["questions"]) if recent_qs else CORE_INTERESTS
+        query = f"{recent_qs or ''}\n{CORE_INTERESTS}"
+
+        # 데이터 로드 후 단계별 토큰 예산에 맞춰 압축 (중복/보일러플레이트 제거)
+        # 관심사 검색 결과를 먼저, 그 뒤에 폴더별 최신 파일 순으로 채움
+        asset_raw, _ = context_packer.pack(get_data_from_dirs(ASSET_DIRS), STAGE_TOKEN_BUDGETS["asset"], "asset")
+        tech_raw, _ = context_packer.pack(get_relevant_passages(query, TECH_DIRS) + get_data_from_dirs(TECH_DIRS),
+                                          STAGE_TOKEN_BUDGETS["tech"], "tech")
+        guru_raw, _ = context_packer.pack(get_relevant_passages(query, [GURU_DATA_DIR], k=6) + get_data_from_dirs([GURU_DATA_DIR]),
+                                          STAGE_TOKEN_BUDGETS["guru"], "guru")
         
         # -----------------------------------------------------
         # Stage 1: 자산(부동산/공매) 분석
@@ -239,6 +278,9 @@ def generate_daily_briefing():
 
         [나의 관심사/최근 질문]
         {qs_text}
+
+        [데이터]
+        {tech_raw}
         
         [분석 목표]
         1. 채용 공고(Hiring)에서 가장 많이 요구하는 기술 스택 추출
@@ -261,7 +303,7 @@ def generate_daily_briefing():
         당신은 나의 **'Full-Stack 투자 전략 이사'**입니다.
         
         **[추가 데이터: 거장들의 시선(Gurus)]**
-        {tech_insight} 
+        {guru_raw} 
 
         
 
@@ -318,6 +360,24 @@ def generate_daily_briefing():
         error_msg = f"분석 중 오류 발생: {str(e)}"
         print(f"❌ {error_msg}")
         update_analysis_state("failed", error_msg)
+        # 작업 관리자/실행 기록이 실패로 남기도록 다시 던짐
+        raise
+
+def run_daily_briefing_job():
+    """
+    스케줄/수동/CLI 어디서 호출해도 분석은 한 번에 하나만 (실행 중이면 그 실행에 합류)
+    실패하면 예외를 던져 실행 기록(run ledger)에 실패로 남고, 다른 프로세스의 실행에 합류했으면 "joined"로 남습니다.
+    """
+    job = job_manager.run_exclusive("analysis", generate_daily_briefing)
+    status = job["status"] if job else None
+    if status == "failed":
+        raise RuntimeError(job["error"] or "analysis failed")
+    if status == "unknown":
+        print("🔗 [Job] 다른 프로세스의 분석 실행을 기다렸습니다 (결과는 그 프로세스의 기록 참고).")
+        run_ledger.note_outcome("joined", "waited on another process; outcome unknown")
+    elif status != "completed":
+        raise RuntimeError(f"analysis job did not finish (status: {status})")
+    return job
 
 if __name__ == "__main__":
-    generate_daily_briefing()
+    run_daily_briefing_job()
@@ -0,0 +1,56 @@
+import os
+import sys
+import asyncio
+
+# 프로젝트 루트 설정 (core -> src -> ProjectRoot)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(current_dir))
+
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from src.core import http_client
+
+# ---------------------------------------------------------
+# [1] 기본 설정
+# ---------------------------------------------------------
+# 동시에 진행할 상세 요청 수
+DEFAULT_CONCURRENCY = int(os.getenv("DETAIL_FETCH_CONCURRENCY", "5"))
+
+# ---------------------------------------------------------
+# [2] 동시 상세 수집
+# ---------------------------------------------------------
+async def _fetch_all(items, on_result, concurrency, **get_kwargs):
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def fetch(key, url):
+        async with semaphore:
+            try:
+                # http_client는 동기(requests) 기반 -> 스레드에서 실행 (contextvars도 함께 전달됨)
+                # 호스트별 요청 속도는 http_client 안의 rate_limiter가 조절
+                res = await asyncio.to_thread(http_client.get, url, **get_kwargs)
+                return key, res, None
+            except Exception as e:
+                return key, None, e
+
+    tasks = [asyncio.create_task(fetch(key, url)) for key, url in items]
+    done = 0
+    # 도착하는 순서대로 바로 처리 (저장) -> 느린 요청 하나가 나머지 저장을 막지 않음
+    for next_done in asyncio.as_completed(tasks):
+        key, res, error = await next_done
+        try:
+            if on_result(key, res, error):
+                done += 1
+        except Exception as e:
+            print(f"   ⚠️ 결과 처리 중 에러: {key} ({e})")
+    return done
+
+def fetch_all(items, on_result, concurrency=None, **get_kwargs):
+    """
+    items: [(key, url), ...] 를 동시에 GET 합니다.
+    응답이 도착할 때마다 on_result(key, response, error)를 호출하고, True를 반환한 개수를 돌려줍니다.
+    동시 요청 수는 concurrency, 호스트당 요청 속도는 rate_limiter 설정으로 제한됩니다.
+    """
+    if not items: return 0
+    concurrency = concurrency or DEFAULT_CONCURRENCY
+    return asyncio.run(_fetch_all(list(items), on_result, concurrency, **get_kwargs))
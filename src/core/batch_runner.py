@@ -0,0 +1,167 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from src.core.collector_registry import run_plugin
+
+# 동시에 실행할 최대 작업 수 (환경변수로 조정 가능)
+DEFAULT_MAX_WORKERS = int(os.environ.get("BATCH_MAX_WORKERS", "4"))
+
+# 배치 전체 제한 시간(초): 넘기면 남은 수집기는 건너뛰고 있는 데이터로 분석
+DEFAULT_DEADLINE = int(os.environ.get("BATCH_DEADLINE_SEC", "1800"))
+
+# 격벽(bulkhead): 같은 자원을 쓰는 작업은 이 개수까지만 동시에 실행
+# (Chrome 하나가 멈춰도 다른 수집기 워커를 잡아먹지 않도록)
+BULKHEAD_LIMITS = {
+    "browser": 1,     # Selenium/Chrome (메모리 큼)
+    "pdf": 1,         # PDF 다운로드 + 텍스트 추출 (CPU/메모리 큼)
+    "data_go_kr": 2,  # 공공데이터포털 (같은 API 키 쿼터)
+}
+
+# ---------------------------------------------------------
+# [1] 배치 작업 정의 (DAG)
+# ---------------------------------------------------------
+# 작업 이름 = collector_registry.COLLECTOR_PLUGINS 의 플러그인 이름
+# step: 소속 단계 (워커가 부족할 때 낮은 단계부터 먼저 실행)
+# depends_on: 먼저 끝나야 하는 작업 이름 목록 (서로 독립이면 동시에 실행)
+# bulkhead: 소속 격벽 (BULKHEAD_LIMITS 참고)
+# always_run: 배치 제한 시간이 지나도 실행 (부분 결과 모드)
+BATCH_JOBS = {
+    # [1. 기초 환경 & 거시 경제]
+    "weather": {"step": 1, "depends_on": []},
+    "macro": {"step": 1, "depends_on": [], "bulkhead": "browser"},
+
+    # [2. 실물 자산 & 트렌드]
+    "real_estate": {"step": 2, "depends_on": [], "bulkhead": "data_go_kr"},
+    "commercial_area": {"step": 2, "depends_on": [], "bulkhead": "data_go_kr"},
+    "onbid": {"step": 2, "depends_on": []},
+    "crypto_onchain": {"step": 2, "depends_on": []},
+    "pdf_auto": {"step": 2, "depends_on": [], "bulkhead": "pdf"},
+    "search": {"step": 2, "depends_on": [], "bulkhead": "pdf"},
+    "ipo": {"step": 2, "depends_on": []},
+    "global_ipo": {"step": 2, "depends_on": []},
+
+    # [3. 뉴스 & 여론 & 거장]
+    "news": {"step": 3, "depends_on": []},
+    "community": {"step": 3, "depends_on": []},
+    "email": {"step": 3, "depends_on": []},
+    "guru": {"step": 3, "depends_on": []},
+}
+
+# [4. 종합 분석] 모든 수집기가 끝난(또는 시간 초과로 건너뛴) 뒤에만 시작
+BATCH_JOBS["analyst"] = {
+    "step": 4,
+    "depends_on": list(BATCH_JOBS.keys()),
+    "always_run": True,
+}
+
+# ---------------------------------------------------------
+# [2] 단일 작업 실행
+# ---------------------------------------------------------
+def run_job(name, job, skip_fresh=True, timeout=None):
+    """작업 이름과 같은 플러그인을 장기 실행 워커(또는 격리 프로세스)에서 실행"""
+    return run_plugin(name, skip_fresh=skip_fresh, timeout=timeout)
+
+# ---------------------------------------------------------
+# [3] DAG 실행기
+# ---------------------------------------------------------
+def validate_jobs(jobs):
+    """존재하지 않는 선행 작업이나 순환 의존성이 있으면 ValueError"""
+    for name, job in jobs.items():
+        for dep in job.get("depends_on", []):
+            if dep not in jobs:
+                raise ValueError(f"'{name}'의 선행 작업 '{dep}'이(가) 정의되어 있지 않습니다.")
+
+    visiting, done = set(), set()
+
+    def visit(name):
+        if name in done: return
+        if name in visiting:
+            raise ValueError(f"순환 의존성 발견: {name}")
+        visiting.add(name)
+        for dep in jobs[name].get("depends_on", []):
+            visit(dep)
+        visiting.discard(name)
+        done.add(name)
+
+    for name in jobs:
+        visit(name)
+
+def run_batch(jobs=None, max_workers=None, runner=run_job, skip_fresh=True, deadline=None):
+    """
+    선행 작업이 모두 끝난 작업부터 최대 max_workers개씩 동시에 실행합니다.
+    선행 작업이 실패해도 후속 작업은 실행됩니다 (Analyst는 있는 데이터로 분석).
+    skip_fresh=True면 결과가 아직 신선한(TTL 이내) 수집기는 건너뜁니다.
+    deadline(초)이 지나면 아직 시작하지 못한 작업은 건너뛰고, 실행 중인 작업의 제한 시간도
+    남은 시간으로 줄입니다. always_run 작업(Analyst)은 그래도 실행됩니다.
+    반환값: {작업 이름: True/False}
+    """
+    jobs = BATCH_JOBS if jobs is None else jobs
+    max_workers = max_workers or DEFAULT_MAX_WORKERS
+    deadline = deadline or DEFAULT_DEADLINE
+    validate_jobs(jobs)
+
+    batch_end = time.monotonic() + deadline
+    results = {}
+    pending = dict(jobs)
+    running = {}
+    bulkhead_usage = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while pending or running:
+            remaining = batch_end - time.monotonic()
+
+            # 1. 제한 시간이 지났으면 아직 시작 못 한 일반 작업은 건너뜀 (부분 결과 모드)
+            if remaining <= 0:
+                for name in [n for n, job in pending.items() if not job.get("always_run")]:
+                    print(f"⏰ [Batch] Deadline passed, skipped: {name}")
+                    pending.pop(name)
+                    results[name] = False
+
+            # 2. 선행 작업이 모두 끝난 작업을 단계(step) 순으로 제출
+            ready = [name for name, job in pending.items()
+                     if all(dep in results for dep in job.get("depends_on", []))]
+            ready.sort(key=lambda name: (pending[name].get("step", 0), name))
+
+            skipped_late = False
+            for name in ready:
+                if len(running) >= max_workers: break
+
+                bulkhead = pending[name].get("bulkhead")
+                if bulkhead and bulkhead_usage.get(bulkhead, 0) >= BULKHEAD_LIMITS.get(bulkhead, max_workers):
+                    continue
+
+                # 일반 작업은 배치 남은 시간 안에서만 실행 (always_run은 자기 제한 시간 사용)
+                # 제출 직전에 다시 계산 -> 마감 이후엔 시작하지 않고, 직전이면 남은 시간만 줌
+                remaining = batch_end - time.monotonic()
+                if not pending[name].get("always_run") and remaining <= 0:
+                    print(f"⏰ [Batch] Deadline passed, skipped: {name}")
+                    pending.pop(name)
+                    results[name] = False
+                    skipped_late = True
+                    continue
+                job = pending.pop(name)
+                timeout = None if job.get("always_run") else remaining
+                future = executor.submit(runner, name, job, skip_fresh, timeout)
+                running[future] = name
+                if bulkhead:
+                    bulkhead_usage[bulkhead] = bulkhead_usage.get(bulkhead, 0) + 1
+
+            if not running:
+                # 방금 마감으로 건너뛴 작업이 있으면 그 후속 작업(Analyst)이 준비됐을 수 있으므로 한 번 더
+                if skipped_late: continue
+                break
+
+            # 3. 하나라도 끝나면 다시 스케줄링 (제한 시간 확인을 위해 주기적으로 깨어남)
+            finished, _ = wait(running, timeout=max(remaining, 1), return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                bulkhead = jobs[name].get("bulkhead")
+                if bulkhead:
+                    bulkhead_usage[bulkhead] -= 1
+                try:
+                    results[name] = bool(future.result())
+                except Exception as e:
+                    print(f"⚠️ [Batch] {name} 실행 중 예외: {e}")
+                    results[name] = False
+
+    return results
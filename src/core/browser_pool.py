@@ -0,0 +1,154 @@
+import os
+import re
+import sys
+import json
+import subprocess
+import threading
+from contextlib import contextmanager
+
+# 프로젝트 루트 설정 (core -> src -> ProjectRoot)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(current_dir))
+
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from src.config import paths
+
+# ---------------------------------------------------------
+# [1] 설정
+# ---------------------------------------------------------
+# 동시에 띄울 수 있는 Chrome 수 (배치의 browser 칸막이와 맞춤)
+POOL_SIZE = int(os.getenv("BROWSER_POOL_SIZE", "1"))
+
+PAGE_LOAD_TIMEOUT = 30
+
+# 화면을 보면서 디버깅하려면 BROWSER_HEADLESS=0
+HEADLESS = os.getenv("BROWSER_HEADLESS", "1") != "0"
+
+USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+              "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+
+DRIVER_CACHE_FILE = paths.BROWSER_DRIVER_CACHE_FILE
+
+_slots = threading.BoundedSemaphore(POOL_SIZE)
+_lock = threading.Lock()
+_driver_path = None
+
+# ---------------------------------------------------------
+# [2] 드라이버 경로 (한 번만 해석하고 디스크에 기억)
+# ---------------------------------------------------------
+# 설치된 Chrome 버전을 물어볼 명령 (Windows는 레지스트리)
+CHROME_VERSION_COMMANDS = [
+    ["google-chrome", "--version"],
+    ["google-chrome-stable", "--version"],
+    ["chromium", "--version"],
+    ["chromium-browser", "--version"],
+    ["/Applications/Google Chrome.app/Contents/MacOS/Google Chrome", "--version"],
+    ["reg", "query", r"HKEY_CURRENT_USER\Software\Google\Chrome\BLBeacon", "/v", "version"],
+]
+
+def chrome_major_version():
+    """설치된 Chrome의 메이저 버전 ('120'), 알 수 없으면 None"""
+    for cmd in CHROME_VERSION_COMMANDS:
+        try:
+            out = subprocess.run(cmd, capture_output=True, text=True, timeout=10).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+        match = re.search(r'(\d+)\.\d+\.\d+', out)
+        if match:
+            return match.group(1)
+    return None
+
+def get_driver_path():
+    """
+    chromedriver 경로. CHROMEDRIVER_PATH 환경변수 > 저장된 경로 > ChromeDriverManager 설치 순.
+    ChromeDriverManager는 네트워크로 버전을 확인하므로 최초 1회만 호출합니다.
+    저장된 경로는 설치 당시 Chrome 메이저 버전과 함께 기억하고, Chrome이 업데이트되면 다시 받습니다.
+    """
+    global _driver_path
+    with _lock:
+        if _driver_path and os.path.exists(_driver_path):
+            return _driver_path
+
+        env_path = os.getenv("CHROMEDRIVER_PATH")
+        if env_path and os.path.exists(env_path):
+            _driver_path = env_path
+            return _driver_path
+
+        chrome_major = chrome_major_version()
+        try:
+            with open(DRIVER_CACHE_FILE, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get("path") and os.path.exists(cached["path"]) and cached.get("chrome_major") == chrome_major:
+                _driver_path = cached["path"]
+                return _driver_path
+        except (OSError, ValueError, AttributeError):
+            pass
+
+        from webdriver_manager.chrome import ChromeDriverManager
+        print(f"🧩 [Browser] chromedriver 확인 중 (Chrome {chrome_major or '?'})...")
+        _driver_path = ChromeDriverManager().install()
+        with open(DRIVER_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({"path": _driver_path, "chrome_major": chrome_major}, f)
+        return _driver_path
+
+def forget_driver_path():
+    """저장된 드라이버 경로를 버림 (Chrome과 버전이 안 맞아 세션 생성이 실패했을 때)"""
+    global _driver_path
+    with _lock:
+        _driver_path = None
+        try:
+            os.remove(DRIVER_CACHE_FILE)
+        except OSError:
+            pass
+
+# ---------------------------------------------------------
+# [3] 세션
+# ---------------------------------------------------------
+# Selenium 수집기는 모두 짧게 한 번 돌고 끝나는 프로세스(macro는 isolate, ai_news/deep_scan은 단독 스크립트)라
+# 세션을 살려 두고 재사용할 곳이 없음 -> 빌릴 때 띄우고 반납할 때 종료. 드라이버 경로 해석만 캐시
+def _new_driver():
+    from selenium import webdriver
+    from selenium.common.exceptions import SessionNotCreatedException
+    from selenium.webdriver.chrome.service import Service
+
+    options = webdriver.ChromeOptions()
+    if HEADLESS:
+        options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--log-level=3")
+    options.add_argument(f"user-agent={USER_AGENT}")
+    # HTML만 준비되면 넘어감 (이미지/광고 로딩 대기 X), 필요한 요소는 각 수집기가 직접 기다림
+    options.page_load_strategy = 'eager'
+
+    try:
+        driver = webdriver.Chrome(service=Service(get_driver_path()), options=options)
+    except SessionNotCreatedException as e:
+        # 대부분 Chrome 자동 업데이트 후 드라이버 버전 불일치 -> 드라이버를 다시 받아 1회 재시도
+        print(f"⚠️ [Browser] 세션 생성 실패, chromedriver 다시 확인: {str(e).splitlines()[0]}")
+        forget_driver_path()
+        driver = webdriver.Chrome(service=Service(get_driver_path()), options=options)
+    driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+    return driver
+
+@contextmanager
+def browser(timeout=None):
+    """
+    with browser_pool.browser() as driver: 로 headless Chrome을 씁니다 (블록이 끝나면 종료).
+    동시에 POOL_SIZE개를 넘으면 다른 사용이 끝날 때까지 기다립니다(timeout 초).
+    """
+    if not _slots.acquire(timeout=timeout):
+        raise TimeoutError("사용 가능한 브라우저 세션이 없습니다.")
+    driver = None
+    try:
+        driver = _new_driver()
+        yield driver
+    finally:
+        if driver is not None:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        _slots.release()
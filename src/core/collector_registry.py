@@ -0,0 +1,363 @@
+import os
+import sys
+import subprocess
+import importlib
+import json
+import signal
+import tempfile
+import threading
+import contextvars
+import time
+from datetime import datetime
+
+# 프로젝트 루트 설정 (core -> src -> ProjectRoot)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(os.path.dirname(current_dir))
+
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from src.config import paths
+from src.core import run_ledger
+
+FRESHNESS_FILE = paths.COLLECTOR_FRESHNESS_FILE
+
+# ---------------------------------------------------------
+# [1] 수집기 플러그인 등록부
+# ---------------------------------------------------------
+# module/entry: 인자 없이 호출하는 진입 함수 (모든 플러그인 공통 인터페이스)
+# isolate: True면 별도 프로세스에서 실행 (Chrome 등 무거운/불안정한 의존성)
+# cadence: 개별 스케줄 (APScheduler 트리거 종류, 트리거 인자)
+# ttl_hours: 마지막 성공 후 이 시간 안에는 결과가 신선하다고 보고 실행을 건너뜀
+# timeout: 실행 제한 시간(초), 없으면 DEFAULT_TIMEOUT
+COLLECTOR_PLUGINS = {
+    # 날씨는 몇 시간만 지나도 의미가 없어짐 -> 자주 갱신
+    "weather": {"module": "src.collectors.weather_collector", "entry": "get_weather_report",
+                "cadence": ("interval", {"hours": 3}), "ttl_hours": 2},
+    "macro": {"module": "src.collectors.macro_collector", "entry": "run_macro_collector", "isolate": True,
+              "cadence": ("cron", {"day_of_week": "mon-fri", "hour": 6, "minute": 30}), "ttl_hours": 12,
+              "timeout": 180},
+    # 지난달 실거래/상권 데이터는 하루 만에 바뀌지 않음 -> 주 1회
+    "real_estate": {"module": "src.collectors.real_estate_collector", "entry": "collect_commercial_real_estate",
+                    "cadence": ("cron", {"day_of_week": "mon", "hour": 6, "minute": 0}), "ttl_hours": 24 * 6},
+    "commercial_area": {"module": "src.collectors.commercial_area_collector", "entry": "collect_commercial_trend",
+                        "cadence": ("cron", {"day_of_week": "mon", "hour": 6, "minute": 10}), "ttl_hours": 24 * 6},
+    "onbid": {"module": "src.collectors.onbid_collector", "entry": "run_collector",
+              "cadence": ("cron", {"hour": 6, "minute": 20}), "ttl_hours": 20},
+    "crypto_onchain": {"module": "src.collectors.crypto_onchain_collector", "entry": "collect_defi_yields",
+                       "cadence": ("interval", {"hours": 6}), "ttl_hours": 5},
+    "pdf_auto": {"module": "src.collectors.pdf_auto_collector", "entry": "collect_pdf_report",
+                 "cadence": ("interval", {"hours": 4}), "ttl_hours": 3},
+    # 글로벌 리포트는 주간 체크 (Google CSE 쿼터 절약)
+    "search": {"module": "src.collectors.search_collector", "entry": "collect_reports",
+               "cadence": ("cron", {"day_of_week": "mon", "hour": 6, "minute": 30}), "ttl_hours": 24 * 6,
+               "timeout": 600},
+    "ipo": {"module": "src.collectors.ipo_collector", "entry": "run_collector",
+            "cadence": ("cron", {"hour": 6, "minute": 40}), "ttl_hours": 20},
+    "global_ipo": {"module": "src.collectors.global_ipo_collector", "entry": "collect_global_ipo_news",
+                   "cadence": ("cron", {"hour": 6, "minute": 45}), "ttl_hours": 20},
+    # 뉴스/커뮤니티는 수시로 올라오므로 짧은 주기
+    "news": {"module": "src.collectors.collector", "entry": "run_collector",
+             "cadence": ("interval", {"minutes": 30}), "ttl_hours": 0.25},
+    "community": {"module": "src.collectors.community_collector", "entry": "run_community_collector",
+                  "cadence": ("interval", {"hours": 1}), "ttl_hours": 0.5},
+    "email": {"module": "src.collectors.email_collector", "entry": "collect_emails",
+              "cadence": ("cron", {"hour": 6, "minute": 50}), "ttl_hours": 12,
+              "timeout": 120},
+    "guru": {"module": "src.collectors.guru_collector", "entry": "collect_guru_insights",
+             "cadence": ("cron", {"hour": 6, "minute": 50}), "ttl_hours": 20},
+    # Analyst는 개별 스케줄 없이 배치(07:00)에서만 실행, 항상 새로 분석
+    "analyst": {"module": "src.core.analyst", "entry": "run_daily_briefing_job", "timeout": 900},
+}
+
+DEFAULT_TIMEOUT = int(os.environ.get("COLLECTOR_TIMEOUT_SEC", "300"))
+
+# COLLECTOR_ISOLATION=all 이면 모든 플러그인을 별도 프로세스로 실행 (디버깅/비교용)
+ISOLATION_MODE = os.environ.get("COLLECTOR_ISOLATION", "plugin")
+
+# 한 번 불러온 진입 함수와 import 소요 시간 (워커 프로세스 수명 동안 유지)
+_loaded = {}
+IMPORT_TIMES = {}
+
+# 같은 플러그인이 배치와 개별 스케줄에서 동시에 돌지 않도록 플러그인별 잠금
+_run_locks = {name: threading.Lock() for name in COLLECTOR_PLUGINS}
+
+# 제한 시간이 지나 기다리기를 포기했지만 스레드는 아직 돌고 있는 실행 {name: 포기한 시각}
+_abandoned = {}
+_freshness_lock = threading.Lock()
+
+# ---------------------------------------------------------
+# [2] 신선도(TTL) 관리
+# ---------------------------------------------------------
+def load_freshness():
+    """플러그인별 마지막 성공 시각 {name: 'YYYY-MM-DD HH:MM:SS'}"""
+    if not os.path.exists(FRESHNESS_FILE):
+        return {}
+    try:
+        with open(FRESHNESS_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except:
+        return {}
+
+def mark_fresh(name):
+    """성공한 실행 시각 기록"""
+    with _freshness_lock:
+        state = load_freshness()
+        state[name] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with open(FRESHNESS_FILE, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False, indent=2)
+
+def is_fresh(name):
+    """마지막 성공 후 ttl_hours가 지나지 않았으면 True"""
+    ttl_hours = COLLECTOR_PLUGINS[name].get("ttl_hours")
+    if not ttl_hours:
+        return False
+
+    last_run = load_freshness().get(name)
+    if not last_run:
+        return False
+
+    age = datetime.now() - datetime.strptime(last_run, "%Y-%m-%d %H:%M:%S")
+    return age.total_seconds() < ttl_hours * 3600
+
+# ---------------------------------------------------------
+# [3] 로드 & 실행
+# ---------------------------------------------------------
+def load_plugin(name):
+    """플러그인 모듈을 import 하고 진입 함수를 반환 (최초 1회만 import)"""
+    if name in _loaded:
+        return _loaded[name]
+
+    spec = COLLECTOR_PLUGINS[name]
+    start = time.perf_counter()
+    module = importlib.import_module(spec["module"])
+    IMPORT_TIMES[name] = time.perf_counter() - start
+
+    entry = getattr(module, spec["entry"])
+    _loaded[name] = entry
+    return entry
+
+def _kind(name):
+    return "analyst" if name == "analyst" else "collector"
+
+def get_timeout(name):
+    """플러그인별 실행 제한 시간(초)"""
+    return COLLECTOR_PLUGINS[name].get("timeout", DEFAULT_TIMEOUT)
+
+def run_in_process(name, record=True, timeout=None, release=None):
+    """
+    현재 프로세스(장기 실행 워커)에서 플러그인 실행 (성공 시 True).
+    스레드는 강제 종료할 수 없으므로 timeout이 지나면 기다리기를 포기하고 실패로 기록합니다.
+    release: 호출 측 플러그인 잠금 해제 함수. 정상 종료면 반환 직전에, 포기한 경우에는
+             스레드가 실제로 끝날 때 호출 -> 남은 스레드가 도는 동안 같은 플러그인이 다시 시작되지 않음
+    """
+    print(f"\n🚀 [Plugin] Executing: {name}")
+    handoff = threading.Lock()
+    state = {"done": False, "abandoned": False}
+
+    def finish():
+        # 스레드 종료와 '기다리기 포기' 판정 중 나중에 일어난 쪽이 잠금을 풂
+        with handoff:
+            state["done"] = True
+            abandoned = state["abandoned"]
+        if abandoned:
+            _abandoned.pop(name, None)
+            print(f"🏁 [Plugin] Abandoned run exited: {name}")
+            if release:
+                release()
+
+    with run_ledger.track_run(name, _kind(name), record=record) as run:
+        outcome = {}
+
+        def target():
+            try:
+                load_plugin(name)()
+                outcome["ok"] = True
+            except Exception as e:
+                outcome["error"] = e
+            finally:
+                finish()
+
+        # 실행 기록 집계값(contextvar)이 작업 스레드에도 이어지도록 컨텍스트 복사
+        ctx = contextvars.copy_context()
+        worker = threading.Thread(target=ctx.run, args=(target,), name=f"plugin-{name}", daemon=True)
+        worker.start()
+        worker.join(timeout)
+
+        with handoff:
+            if not state["done"]:
+                state["abandoned"] = True
+                _abandoned[name] = datetime.now().strftime("%H:%M:%S")
+
+        try:
+            if state["abandoned"]:
+                print(f"⏰ [Plugin] Timeout ({timeout}s), abandoned (lock held until it exits): {name}")
+                run["status"], run["exit_code"], run["error"] = "timeout", -1, f"deadline {timeout}s exceeded"
+                return False
+            if "error" in outcome:
+                print(f"❌ [Plugin] Error in {name}: {outcome['error']}")
+                run["status"], run["exit_code"], run["error"] = "failed", 1, str(outcome["error"])
+                return False
+            print(f"✅ [Plugin] Finished: {name}")
+            return True
+        finally:
+            if not record:
+                run_ledger.dump_child_stats()
+            if release and not state["abandoned"]:
+                release()
+
+def kill_process_group(proc):
+    """자식 프로세스와 그 하위 프로세스(Chrome 등)까지 모두 종료"""
+    try:
+        if os.name == "nt":
+            subprocess.run(["taskkill", "/F", "/T", "/PID", str(proc.pid)],
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        else:
+            os.killpg(proc.pid, signal.SIGKILL)
+    except Exception:
+        proc.kill()
+
+def run_isolated(name, timeout=None):
+    """플러그인을 별도 파이썬 프로세스에서 실행 (성공 시 True, timeout이 지나면 프로세스 그룹 종료)"""
+    print(f"\n🚀 [Plugin] Executing (isolated): {name}")
+
+    # 자식 프로세스가 집계값(다운로드 바이트, 파일 수 등)을 이 파일로 돌려줌
+    fd, stats_file = tempfile.mkstemp(prefix=f"run_{name}_", suffix=".json")
+    os.close(fd)
+
+    env = os.environ.copy()
+    env["PYTHONPATH"] = PROJECT_ROOT
+    env[run_ledger.STATS_FILE_ENV] = stats_file
+
+    # 새 프로세스 그룹으로 띄워야 타임아웃 때 하위 프로세스까지 한 번에 정리 가능
+    if os.name == "nt":
+        group_kwargs = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    else:
+        group_kwargs = {"start_new_session": True}
+
+    with run_ledger.track_run(name, _kind(name)) as run:
+        try:
+            proc = subprocess.Popen([sys.executable, "-m", "src.core.collector_registry", name],
+                                    env=env, cwd=PROJECT_ROOT, **group_kwargs)
+            try:
+                returncode = proc.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                kill_process_group(proc)
+                proc.wait()
+                print(f"⏰ [Plugin] Timeout ({timeout}s), killed: {name}")
+                run["status"], run["exit_code"], run["error"] = "timeout", proc.returncode, f"deadline {timeout}s exceeded"
+                return False
+
+            if returncode != 0:
+                print(f"❌ [Plugin] Error in {name}: exit status {returncode}")
+                run["status"], run["exit_code"], run["error"] = "failed", returncode, f"exit status {returncode}"
+                return False
+
+            print(f"✅ [Plugin] Finished (isolated): {name}")
+            return True
+        except Exception as e:
+            print(f"⚠️ [Plugin] Unexpected error: {e}")
+            run["status"], run["exit_code"], run["error"] = "failed", 1, str(e)
+            return False
+        finally:
+            try:
+                with open(stats_file, 'r', encoding='utf-8') as f:
+                    run_ledger.merge_child_stats(json.load(f))
+            except Exception:
+                pass
+            os.remove(stats_file)
+
+def run_plugin(name, skip_fresh=False, timeout=None):
+    """
+    등록된 설정에 따라 in-process 또는 격리 실행.
+    skip_fresh=True면 TTL 안에 성공한 적이 있는 플러그인은 건너뜀 (성공으로 간주).
+    timeout을 주지 않으면 플러그인별 제한 시간(timeout)을 사용.
+    """
+    if name not in COLLECTOR_PLUGINS:
+        print(f"⚠️ [Skip] 등록되지 않은 플러그인: {name}")
+        return False
+
+    timeout = get_timeout(name) if timeout is None else min(timeout, get_timeout(name))
+
+    # 이미 실행 중이면 (제한 시간 안에서) 끝날 때까지 기다린 뒤 신선도를 다시 판단
+    # 기다린 시간은 실행 제한 시간에서 뺌 (잠금 대기 + 실행이 합쳐서 timeout을 넘지 않도록)
+    waited_from = time.monotonic()
+    if not _run_locks[name].acquire(timeout=timeout):
+        if name in _abandoned:
+            print(f"⏰ [Plugin] Still running (timed out at {_abandoned[name]}, not exited yet), skipped: {name}")
+        else:
+            print(f"⏰ [Plugin] Still running elsewhere, skipped: {name}")
+        return False
+    timeout -= time.monotonic() - waited_from
+    if timeout <= 0:
+        _run_locks[name].release()
+        print(f"⏰ [Plugin] No time left after waiting for the previous run, skipped: {name}")
+        return False
+
+    # in-process 실행은 잠금 해제를 run_in_process에 넘김 (시간 초과 시 스레드가 끝날 때 해제)
+    lock_handed_off = False
+    try:
+        if skip_fresh and is_fresh(name):
+            print(f"💤 [Plugin] Fresh, skipped: {name}")
+            return True
+
+        if ISOLATION_MODE == "all" or COLLECTOR_PLUGINS[name].get("isolate"):
+            ok = run_isolated(name, timeout=timeout)
+        else:
+            lock_handed_off = True
+            ok = run_in_process(name, timeout=timeout, release=_run_locks[name].release)
+
+        if ok:
+            mark_fresh(name)
+        return ok
+    finally:
+        if not lock_handed_off:
+            _run_locks[name].release()
+
+def get_abandoned():
+    """시간 초과로 기다리기를 포기했지만 아직 끝나지 않은 in-process 실행 {name: 포기한 시각}"""
+    return dict(_abandoned)
+
+# ---------------------------------------------------------
+# [4] import 비용 측정
+# ---------------------------------------------------------
+def measure_cold_start(name):
+    """새 인터프리터에서 플러그인 모듈을 import 하는 데 걸리는 시간 (기동 비용 포함)"""
+    env = os.environ.copy()
+    env["PYTHONPATH"] = PROJECT_ROOT
+    code = f"import importlib; importlib.import_module({COLLECTOR_PLUGINS[name]['module']!r})"
+
+    start = time.perf_counter()
+    res = subprocess.run([sys.executable, "-c", code], env=env, cwd=PROJECT_ROOT,
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    elapsed = time.perf_counter() - start
+    return elapsed if res.returncode == 0 else None
+
+def benchmark_imports():
+    """플러그인별 (서브프로세스 기동+import) vs (워커 내 두 번째 호출) 비용 비교"""
+    print(f"{'plugin':<18}{'subprocess':>12}{'in-process':>12}")
+    for name in COLLECTOR_PLUGINS:
+        cold = measure_cold_start(name)
+        try:
+            load_plugin(name)
+            start = time.perf_counter()
+            load_plugin(name)
+            warm = time.perf_counter() - start
+        except Exception:
+            warm = None
+        cold_str = f"{cold:.3f}s" if cold is not None else "error"
+        warm_str = f"{warm:.6f}s" if warm is not None else "error"
+        print(f"{name:<18}{cold_str:>12}{warm_str:>12}")
+
+if __name__ == "__main__":
+    # 격리 실행용 진입점: python -m src.core.collector_registry <plugin>
+    # 비용 측정: python -m src.core.collector_registry --bench
+    if len(sys.argv) < 2:
+        print("Usage: python -m src.core.collector_registry <plugin>|--bench")
+        sys.exit(2)
+
+    if sys.argv[1] == "--bench":
+        benchmark_imports()
+    else:
+        # 실행 기록은 부모 프로세스가 남기므로 여기서는 집계값만 전달
+        sys.exit(0 if run_in_process(sys.argv[1], record=False) else 1)
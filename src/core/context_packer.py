@@ -0,0 +1,184 @@
+import re
+import hashlib
+
+# 한글/한자/가나는 글자당 약 1토큰, 그 외(영문/숫자/기호)는 약 4글자당 1토큰으로 추정
+_WIDE_CHARS = re.compile(r'[ᄀ-ᇿ㄰-㆏가-힣぀-ヿ一-鿿]')
+
+# 구독/좋아요 안내 문구의 끝맺음 (하기, 눌러주세요, 부탁드립니다 ...)
+_CTA_ACTION = r'(하기|누르기|눌러\s*주세요|부탁\s*(드립니다|드려요|해요|합니다)|해\s*주세요|바랍니다)'
+
+# 프롬프트에 넣어 봐야 의미 없는 짧은 꼬리말 (저작권 고지, 구독 안내, 페이지 번호, 단독 URL 등)
+# 문장 하나 전체가 이 형태일 때만 지움 -> 본문에서 'copyright 소송', '좋아요 수' 같은 표현은 그대로 둠
+BOILERPLATE_PATTERNS = [
+    r'(ⓒ|©|\(c\)\s*\d{4}).{0,80}',                                               # ⓒ 연합뉴스 무단전재 및 재배포 금지
+                                                                                # ('(c) 항목' 같은 목록 기호는 연도가 붙을 때만)
+    r'copyright\s*(ⓒ|©|\(c\))?\s*(\d{4}|by\b).{0,80}',                            # Copyright 2026 Reuters.
+    r'저작권자\s*[ⓒ©(:].{0,80}',
+    r'(\S+\s*){0,3}무단\s*(전재|복제|배포).{0,30}',                                # 연합뉴스 무단전재 및 재배포 금지
+    r'.{0,40}all rights reserved.{0,40}',
+    # 구독/좋아요 안내는 정해진 모양만 (구독하기, 구독과 좋아요 부탁드립니다, 좋아요 눌러주세요, 알림 설정)
+    # -> '좋아요 수가 급증했다' 같은 본문 문장은 남김
+    (r'(구독\s*(하기|신청)?|알림\s*설정|앱\s*다운로드)(\s*(과|와|및|,|&|\+|/)\s*(구독|좋아요|알림\s*설정))*\s*'
+     + _CTA_ACTION + r'?[.!~]*'),
+    r'좋아요(\s*(과|와|및|,|&|\+|/)\s*(구독|알림\s*설정))+\s*' + _CTA_ACTION + r'?[.!~]*',
+    r'좋아요\s*' + _CTA_ACTION + r'[.!~]*',
+    r'(\S+\s+){0,2}[\w.+-]+@[\w-]+\.[\w.]+',                                     # 홍길동 기자 hong@yna.co.kr
+    r'(page\s*)?\d+\s*((/|of)\s*\d+)?',                                        # 페이지 번호
+    r'https?://\S+',                                                            # URL만 있는 줄
+    r'.{0,20}(for professional investors only|not for distribution|important disclosures).{0,60}',
+]
+_BOILERPLATE = re.compile("|".join(f"(?:{p})" for p in BOILERPLATE_PATTERNS), re.IGNORECASE)
+
+# 본문 문장 끝에 마침표 없이 붙은 꼬리말 (... 밝혔다 ⓒ 연합뉴스 무단전재)
+_FOOTER_TAIL = re.compile(r'(\s*(ⓒ|©|\(c\)\s*\d{4})[^.!?]{0,60}|\s+(\S+\s*){0,2}무단\s*(전재|복제|배포)[^.!?]{0,30}'
+                          r'|\s+(\S+\s+){0,2}[\w.+-]+@[\w-]+\.[\w.]+)$', re.IGNORECASE)
+
+# 문장 경계는 문장부호 뒤 공백만 ('다 같이', '모두 다 팔았다'처럼 문장 중간의 '다 '에서 자르지 않음)
+_SENTENCE_END = re.compile(r'(?<=[.!?])\s+')
+
+# 이보다 짧은 문단은 중복 검사 대상에서 제외 ("-", "요약" 같은 흔한 짧은 줄)
+DEDUPE_MIN_CHARS = 20
+
+# 줄바꿈 없는 긴 텍스트는 문장 단위로 이 길이 이하 조각으로 나눠 예산을 조금씩 채움
+MAX_PASSAGE_CHARS = 600
+
+# ---------------------------------------------------------
+# [1] 토큰 추정 / 자르기
+# ---------------------------------------------------------
+def estimate_tokens(text):
+    if not text: return 0
+    wide = len(_WIDE_CHARS.findall(text))
+    return wide + (len(text) - wide + 3) // 4
+
+def cut_to_tokens(text, max_tokens):
+    """추정 토큰 수가 max_tokens 이하가 되도록 뒤를 잘라냄"""
+    if max_tokens <= 0: return ""
+    tokens = estimate_tokens(text)
+    if tokens <= max_tokens: return text
+    end = int(len(text) * max_tokens / tokens)
+    while end > 0 and estimate_tokens(text[:end]) > max_tokens:
+        end = int(end * 0.9)
+    return text[:end]
+
+# ---------------------------------------------------------
+# [2] 문단 정리 (보일러플레이트 제거 + 중복 제거)
+# ---------------------------------------------------------
+def _fingerprint(passage):
+    normalized = re.sub(r'\W+', ' ', passage.lower()).strip()
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+def _split_long(line):
+    if len(line) <= MAX_PASSAGE_CHARS:
+        return [line]
+    chunks, current = [], ""
+    for sentence in _SENTENCE_END.split(line):
+        while len(sentence) > MAX_PASSAGE_CHARS:
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(sentence[:MAX_PASSAGE_CHARS])
+            sentence = sentence[MAX_PASSAGE_CHARS:]
+        if current and len(current) + 1 + len(sentence) > MAX_PASSAGE_CHARS:
+            chunks.append(current)
+            current = ""
+        current = f"{current} {sentence}" if current else sentence
+    if current:
+        chunks.append(current)
+    return chunks
+
+def strip_boilerplate(passage):
+    """꼬리말 형태의 문장만 빼고 나머지 문장은 그대로 이어 붙임"""
+    kept = []
+    for sentence in _SENTENCE_END.split(passage):
+        sentence = sentence.strip()
+        if not sentence or _BOILERPLATE.fullmatch(sentence): continue
+        sentence = _FOOTER_TAIL.sub("", sentence)
+        if sentence and not _BOILERPLATE.fullmatch(sentence):
+            kept.append(sentence)
+    return " ".join(kept)
+
+def clean_passages(text, seen=None):
+    """
+    텍스트를 줄(문단) 단위로 나눠 꼬리말 문장과 이미 본 문단을 뺀 목록을 돌려줍니다.
+    seen(set)을 여러 문서에 같이 넘기면 문서 간 중복(같은 기사 재수집, 리포트 반복 문구)도 제거됩니다.
+    """
+    seen = set() if seen is None else seen
+    passages = []
+    for line in text.splitlines():
+        line = " ".join(line.split())
+        if not line: continue
+        for passage in _split_long(line):
+            passage = strip_boilerplate(passage)
+            if not re.search(r'\w\w', passage): continue
+            if len(passage) >= DEDUPE_MIN_CHARS:
+                key = _fingerprint(passage)
+                if key in seen: continue
+                seen.add(key)
+            passages.append(passage)
+    return passages
+
+# ---------------------------------------------------------
+# [3] 예산 채우기
+# ---------------------------------------------------------
+def pack(docs, budget, label="context"):
+    """
+    docs: [{"source", "header", "text"}, ...] 우선순위 순 (앞일수록 먼저 채움)
+    budget: 이 단계 데이터에 쓸 최대 토큰 (추정치)
+    1차로 문서마다 같은 몫(budget / 문서 수)까지 채우고, 남은 예산은 2차로 우선순위 순으로 더 채웁니다.
+    반환값: (프롬프트용 텍스트, {source: 사용 토큰})
+    """
+    seen = set()
+    entries = []
+    for doc in docs:
+        passages = clean_passages(doc.get("text", ""), seen)
+        if not passages: continue
+        entries.append({"source": doc["source"], "header": doc["header"], "passages": passages,
+                        "kept": [], "next": 0, "tokens": 0, "header_tokens": estimate_tokens(doc["header"]) + 1})
+    if not entries:
+        return "", {}
+
+    # 헤더 토큰은 실제로 문단이 하나라도 들어간 문서에만 청구 (첫 문단을 넣을 때 같이 계산)
+    remaining = budget
+
+    def fill(entry, allowance, last_pass):
+        nonlocal remaining
+        passages = entry["passages"]
+        while entry["next"] < len(passages) and allowance > 0 and remaining > 0:
+            passage = passages[entry["next"]]
+            header_cost = 0 if entry["kept"] else entry["header_tokens"]
+            cost = estimate_tokens(passage) + 1 + header_cost
+            if cost > min(allowance, remaining):
+                if not last_pass:
+                    return
+                # 마지막 채우기에서 남은 예산이 문단보다 작으면 앞부분만 넣고 마감
+                part = cut_to_tokens(passage, min(allowance, remaining) - 1 - header_cost)
+                if part:
+                    entry["kept"].append(part)
+                    cost = estimate_tokens(part) + 1 + header_cost
+                    entry["tokens"] += cost
+                    remaining -= cost
+                entry["next"] = len(passages)
+                return
+            entry["kept"].append(passage)
+            entry["tokens"] += cost
+            allowance -= cost
+            remaining -= cost
+            entry["next"] += 1
+
+    share = max(remaining, 0) // len(entries)
+    for entry in entries:
+        fill(entry, share, last_pass=False)
+    for entry in entries:
+        fill(entry, remaining, last_pass=True)
+
+    lines = []
+    usage = {}
+    for entry in entries:
+        if not entry["kept"]: continue
+        lines.append(f"{entry['header']} {' '.join(entry['kept'])}")
+        usage[entry["source"]] = usage.get(entry["source"], 0) + entry["tokens"]
+
+    used = sum(usage.values())
+    detail = ", ".join(f"{source} {tokens}" for source, tokens in usage.items())
+    print(f"   🧮 [{label}] 토큰 {used:,}/{budget:,} ({detail})")
+    return "\n\n".join(lines), usage
@@ -0,0 +1,111 @@
+import os
+import sys
+import json
+import threading
+
+# 프로젝트 루트 설정 (core -> src -> ProjectRoot)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(current_dir))
+
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from src.config import paths
+
+CURSOR_FILE = paths.COLLECTOR_CURSOR_FILE
+
+# 수위표(high-water mark)가 없을 때(첫 실행) 과거 데이터를 얼마나 거슬러 갈지
+FIRST_RUN_PAGES = int(os.getenv("CURSOR_FIRST_RUN_PAGES", "1"))
+# 수위표가 있어도 한 번에 넘길 수 있는 최대 페이지 (API 이상 시 무한 순회 방지)
+MAX_PAGES = int(os.getenv("CURSOR_MAX_PAGES", "20"))
+
+_lock = threading.Lock()
+
+# ---------------------------------------------------------
+# [1] 수위표 저장소
+# {source: {"created_at": 가장 최근 처리한 글의 created_at, "ids": 그 시각에 처리한 id 목록}}
+# ---------------------------------------------------------
+def _load_all():
+    if not os.path.exists(CURSOR_FILE): return {}
+    try:
+        with open(CURSOR_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+def load_mark(source):
+    with _lock:
+        return _load_all().get(source)
+
+def save_mark(source, mark):
+    with _lock:
+        marks = _load_all()
+        marks[source] = mark
+        with open(CURSOR_FILE, 'w', encoding='utf-8') as f:
+            json.dump(marks, f, ensure_ascii=False, indent=4)
+
+def is_seen(item, mark):
+    """수위표 이하(이미 처리한 구간)의 글인지"""
+    if not mark: return False
+    created_at = str(item.get('created_at', ''))
+    if created_at < mark["created_at"]: return True
+    # 같은 시각에 올라온 글은 id로 구분
+    return created_at == mark["created_at"] and str(item.get('id')) in mark["ids"]
+
+# ---------------------------------------------------------
+# [2] 페이지 순회 (최신순 목록을 수위표에 닿을 때까지)
+# ---------------------------------------------------------
+def walk_pages(source, fetch_page, page_size):
+    """
+    fetch_page(page) -> 최신순 글 목록 (실패 시 None)
+    수위표에 닿거나 마지막 페이지에 도달하면 멈추고, (새 글 최신순 목록, 빈틈 없이 다 봤는지)를 반환합니다.
+    중간 페이지 실패나 MAX_PAGES 초과로 수위표까지 못 갔으면 complete=False -> advance가 수위표를 그대로 둠
+    """
+    mark = load_mark(source)
+    max_pages = MAX_PAGES if mark else FIRST_RUN_PAGES
+
+    new_items = []
+    for page in range(1, max_pages + 1):
+        items = fetch_page(page)
+        if items is None:
+            print(f"   ⚠️ [{source}] {page}페이지 실패, 수위표 유지 (다음 실행에서 빈 구간 재시도)")
+            return new_items, False
+
+        for item in items:
+            if is_seen(item, mark):
+                print(f"   📍 [{source}] 지난 수집 지점 도달 ({page}페이지, 새 글 {len(new_items)}개)")
+                return new_items, True
+            new_items.append(item)
+
+        if len(items) < page_size:
+            return new_items, True
+
+    if mark:
+        print(f"   ⚠️ [{source}] {max_pages}페이지까지 지난 수집 지점을 찾지 못했습니다. 수위표 유지")
+        return new_items, False
+    # 첫 실행은 FIRST_RUN_PAGES만큼만 보는 것이 의도된 범위
+    return new_items, True
+
+def advance(source, new_items, failed_ids=(), complete=True):
+    """
+    처리 결과로 수위표를 전진시킵니다.
+    실패한 글이 있으면 그보다 오래된 글까지만 전진 -> 다음 실행에서 실패분을 다시 가져옴
+    complete=False(walk_pages가 수위표까지 못 감)면 전진하지 않음 -> 못 받은 페이지의 글을 잃지 않도록
+    """
+    if not complete: return
+    failed = {str(i) for i in failed_ids}
+    done = list(new_items)
+    for idx, item in enumerate(new_items):
+        if str(item.get('id')) in failed:
+            done = new_items[idx + 1:]
+    if not done: return
+
+    newest = str(done[0].get('created_at', ''))
+    ids = [str(i.get('id')) for i in done if str(i.get('created_at', '')) == newest]
+
+    mark = load_mark(source)
+    if mark and mark["created_at"] == newest:
+        ids = sorted(set(ids) | set(mark["ids"]))
+    elif mark and mark["created_at"] > newest:
+        return
+    save_mark(source, {"created_at": newest, "ids": ids})
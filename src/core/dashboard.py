@@ -75,6 +75,20 @@ def load_latest_insight():
         return row
     except: return None
 
+def load_run_ledger(days=30):
+    """수집기/분석기 실행 기록 로드 (최근 days일)"""
+    try:
+        since = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+        conn = sqlite3.connect(DB_FILE)
+        df = pd.read_sql_query("SELECT * FROM collector_runs WHERE started_at >= ? ORDER BY started_at",
+                               conn, params=(since,))
+        conn.close()
+        if not df.empty:
+            df['started_at'] = pd.to_datetime(df['started_at'])
+            df['date'] = df['started_at'].dt.date
+        return df
+    except: return pd.DataFrame()
+
 def process_sessions(df_24h):
     """채팅 세션 분석"""
     if df_24h.empty: return pd.DataFrame()
@@ -91,8 +105,8 @@ def process_sessions(df_24h):
 st.title("🧠 Personal Intelligence & Trading HQ")
 st.caption(f"Last Updated: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
 
-# 탭 메뉴 구성 (3개)
-tab1, tab2, tab3 = st.tabs(["📊 전략 브리핑", "💰 AI 트레이딩 (OKX)", "🗂️ 사고 기록"])
+# 탭 메뉴 구성 (4개)
+tab1, tab2, tab3, tab4 = st.tabs(["📊 전략 브리핑", "💰 AI 트레이딩 (OKX)", "🗂️ 사고 기록", "⏱️ 수집 현황"])
 
 # =========================================================
 # Tab 1: 전략 브리핑 (Analyst Insight)
@@ -122,7 +136,9 @@ with tab1:
                 # Docker 내부 통신: backend 컨테이너 이름 사용 권장 (또는 localhost)
                 # Streamlit 컨테이너 -> Backend 컨테이너 통신은 http://backend:8000
                 res = requests.post("http://backend:8000/run-analysis")
-                if res.status_code == 200:
+                if res.status_code == 200 and res.json().get("joined"):
+                    st.toast("🔗 이미 실행 중인 분석이 있습니다. 끝나면 새로고침하세요.")
+                elif res.status_code == 200:
                     st.toast("✅ 분석을 시작했습니다! 잠시 후 새로고침하세요.")
                 else:
                     st.error(f"서버 오류: {res.status_code}")
@@ -257,4 +273,42 @@ with tab3:
             day_data = df[df['date'] == sel_date]
             for _, row in day_data.iterrows():
                 with st.expander(f"{row['created_at'].strftime('%H:%M')} | {row['question'][:50]}..."):
-                    st.write(row['answer'])
\ No newline at end of file
+                    st.write(row['answer'])
+
+# =========================================================
+# Tab 4: 수집 현황 (Run Ledger)
+# =========================================================
+with tab4:
+    st.header("⏱️ 수집기별 실행 현황 (최근 30일)")
+    runs = load_run_ledger()
+
+    if runs.empty:
+        st.info("아직 기록된 실행이 없습니다. 배치가 한 번 돌고 나면 표시됩니다.")
+    else:
+        # 1. 수집기별 요약 (p50/p95, 실패 횟수)
+        summary = runs.groupby('name').agg(
+            runs=('duration', 'count'),
+            p50=('duration', lambda s: s.quantile(0.5)),
+            p95=('duration', lambda s: s.quantile(0.95)),
+            failures=('status', lambda s: (s != 'success').sum()),
+            mb=('bytes_downloaded', lambda s: s.sum() / 1e6),
+            items=('item_count', 'sum'),
+        ).reset_index().sort_values('p95', ascending=False)
+        st.dataframe(summary.round(2), use_container_width=True, hide_index=True)
+
+        # 2. 일별 p50/p95 추이
+        daily = runs.groupby(['date', 'name'])['duration'].agg(
+            p50=lambda s: s.quantile(0.5), p95=lambda s: s.quantile(0.95)
+        ).reset_index()
+        metric = st.radio("지표", ["p50", "p95"], horizontal=True)
+        fig = px.line(daily, x='date', y=metric, color='name', markers=True,
+                      labels={'date': '날짜', metric: f'{metric} 소요 시간(초)', 'name': '수집기'})
+        fig.update_layout(height=400)
+        st.plotly_chart(fig, use_container_width=True)
+
+        # 3. 최근 실패 기록
+        failed = runs[runs['status'] != 'success'].sort_values('started_at', ascending=False).head(20)
+        if not failed.empty:
+            st.subheader("❌ 최근 실패")
+            st.dataframe(failed[['started_at', 'name', 'exit_code', 'duration', 'error']],
+                         use_container_width=True, hide_index=True)
@@ -0,0 +1,201 @@
+import os
+import sys
+import json
+import sqlite3
+import hashlib
+from pathlib import Path
+from datetime import datetime
+
+# 프로젝트 루트 설정 (core -> src -> ProjectRoot)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(current_dir))
+
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from src.config import paths
+
+DB_FILE = str(paths.DB_FILE)
+
+# 색인에 올리는 파일 형식 (분석기가 읽는 것만)
+INDEXED_SUFFIXES = (".json", ".txt", ".pdf")
+
+_HASH_CHUNK = 1024 * 1024
+
+# ---------------------------------------------------------
+# [1] 테이블
+# ---------------------------------------------------------
+def init_index(conn=None):
+    own_conn = conn is None
+    if own_conn:
+        conn = sqlite3.connect(DB_FILE)
+    conn.execute('''CREATE TABLE IF NOT EXISTS documents
+                    (path TEXT PRIMARY KEY,
+                     source TEXT,
+                     mtime REAL,
+                     size INTEGER,
+                     content_hash TEXT,
+                     title TEXT,
+                     created_at TEXT)''')
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_documents_source ON documents (source, mtime DESC)")
+    # 폴더별 마지막으로 맞춰 둔 디렉터리 mtime (다르면 색인 밖에서 파일이 추가/삭제된 것)
+    conn.execute('''CREATE TABLE IF NOT EXISTS document_dirs
+                    (source TEXT PRIMARY KEY,
+                     dir TEXT,
+                     mtime REAL)''')
+    if own_conn:
+        conn.commit()
+        conn.close()
+
+def _connect():
+    conn = sqlite3.connect(DB_FILE, timeout=30)
+    init_index(conn)
+    return conn
+
+# ---------------------------------------------------------
+# [2] 등록 (수집기가 파일을 쓴 직후 호출)
+# ---------------------------------------------------------
+def _file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _guess_title(path):
+    if path.suffix == ".json":
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if isinstance(data, dict) and data.get("title"):
+                return str(data["title"])
+        except (OSError, ValueError):
+            pass
+    return path.stem
+
+def _row(path, title=None):
+    stat = path.stat()
+    return (str(path), path.parent.name, stat.st_mtime, stat.st_size, _file_hash(path),
+            title or _guess_title(path), datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M:%S"))
+
+def _upsert(conn, row):
+    # created_at은 처음 등록한 값 유지 (같은 경로를 덮어쓴 경우)
+    conn.execute('''INSERT INTO documents (path, source, mtime, size, content_hash, title, created_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(path) DO UPDATE SET
+                        mtime = excluded.mtime, size = excluded.size,
+                        content_hash = excluded.content_hash, title = excluded.title''', row)
+
+def _mark_dir(conn, folder):
+    conn.execute("INSERT OR REPLACE INTO document_dirs VALUES (?, ?, ?)",
+                 (folder.name, str(folder), folder.stat().st_mtime))
+
+def record(path, title=None):
+    """
+    저장한 파일 1개를 색인에 등록/갱신 (출처 = 상위 폴더 이름).
+    색인 실패가 수집을 멈추지 않도록 예외는 출력만 합니다.
+    """
+    path = Path(path).resolve()
+    try:
+        row = _row(path, title)
+        conn = _connect()
+        try:
+            # 폴더 mtime은 여기서 기록하지 않음 (손으로 넣은 파일도 같은 mtime에 묻혀 sync_dir가 건너뛰게 됨)
+            # -> 다음 sync_dir가 한 번 훑어 보며 기록 (이미 등록된 파일은 stat만 비교)
+            _upsert(conn, row)
+            conn.commit()
+        finally:
+            conn.close()
+
+        # 검색 색인 대상 폴더(뉴스/리포트 등)면 본문도 바로 색인 (분석 시점에 몰아서 하지 않도록)
+        from src.core import search_index
+        try:
+            search_index.index_file(path, row[4])
+        except Exception as e:
+            # 검색 색인은 catch_up에서 다시 시도됨
+            print(f"⚠️ [Index] 검색 색인 실패: {path.name} ({e})")
+    except (OSError, ValueError, sqlite3.Error) as e:
+        print(f"⚠️ [Index] 문서 색인 실패: {path.name} ({e})")
+
+# ---------------------------------------------------------
+# [3] 폴더 동기화 (색인 밖에서 생긴 변경만 반영)
+# ---------------------------------------------------------
+def sync_dir(folder, force=False):
+    """
+    폴더의 mtime이 마지막 동기화 때와 같으면 아무것도 하지 않습니다 (stat 1회).
+    다르면(수동으로 넣은 PDF, 색인을 쓰지 않는 수집기, 삭제 등) 폴더를 한 번 훑어 맞춥니다.
+    """
+    folder = Path(folder).resolve()
+    if not folder.exists(): return
+
+    conn = _connect()
+    try:
+        known = conn.execute("SELECT mtime FROM document_dirs WHERE source = ?", (folder.name,)).fetchone()
+        if not force and known and known[0] == folder.stat().st_mtime:
+            return
+
+        indexed = dict(conn.execute("SELECT path, mtime FROM documents WHERE source = ?", (folder.name,)))
+        on_disk = set()
+        added = 0
+        for entry in os.scandir(folder):
+            if not entry.is_file() or not entry.name.endswith(INDEXED_SUFFIXES): continue
+            on_disk.add(entry.path)
+            if indexed.get(entry.path) == entry.stat().st_mtime: continue
+            _upsert(conn, _row(Path(entry.path)))
+            added += 1
+
+        removed = [p for p in indexed if p not in on_disk]
+        conn.executemany("DELETE FROM documents WHERE path = ?", [(p,) for p in removed])
+        _mark_dir(conn, folder)
+        conn.commit()
+        if added or removed:
+            print(f"🗂️ [Index] {folder.name}: {added}개 등록 / {len(removed)}개 제거")
+    finally:
+        conn.close()
+
+# ---------------------------------------------------------
+# [4] 조회
+# ---------------------------------------------------------
+def iter_newest(folder, batch=20):
+    """
+    폴더(출처)의 문서를 최신순으로 하나씩 {path, title, mtime, size, content_hash, created_at}.
+    (source, mtime) 색인으로 필요한 만큼만 읽으며, 사라진 파일은 색인에서 지우고 건너뜁니다.
+    """
+    folder = Path(folder).resolve()
+    sync_dir(folder)
+
+    offset = 0
+    while True:
+        conn = _connect()
+        try:
+            rows = conn.execute('''SELECT path, title, mtime, size, content_hash, created_at
+                                   FROM documents WHERE source = ?
+                                   ORDER BY mtime DESC LIMIT ? OFFSET ?''',
+                                (folder.name, batch, offset)).fetchall()
+        finally:
+            conn.close()
+        if not rows: return
+        offset += len(rows)
+
+        for path, title, mtime, size, content_hash, created_at in rows:
+            if not os.path.exists(path):
+                forget(path)
+                offset -= 1
+                continue
+            yield {"path": path, "title": title, "mtime": mtime, "size": size,
+                   "content_hash": content_hash, "created_at": created_at}
+
+def newest(folder, limit=3):
+    docs = []
+    for doc in iter_newest(folder, batch=limit):
+        docs.append(doc)
+        if len(docs) >= limit: break
+    return docs
+
+def forget(path):
+    conn = _connect()
+    try:
+        conn.execute("DELETE FROM documents WHERE path = ?", (str(path),))
+        conn.commit()
+    finally:
+        conn.close()
@@ -0,0 +1,36 @@
+import os
+import sys
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+
+# 프로젝트 루트 설정 (core -> src -> ProjectRoot)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(current_dir))
+
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+# 지역 단위 동시 수집 워커 수 (API별 초당 요청 수는 rate_limiter가 따로 제한)
+DEFAULT_WORKERS = int(os.getenv("REGION_FANOUT_WORKERS", "4"))
+
+def map_ordered(func, items, max_workers=None):
+    """
+    items 각각에 func를 동시에 실행하고, 결과를 입력 순서 그대로 리스트로 반환합니다.
+    (완료 순서와 상관없이 리포트 순서가 항상 같도록)
+    예외가 난 항목은 출력 후 None으로 채웁니다.
+    """
+    items = list(items)
+    if not items: return []
+    max_workers = max(1, min(max_workers or DEFAULT_WORKERS, len(items)))
+
+    def call(item):
+        try:
+            return func(item)
+        except Exception as e:
+            print(f"   ⚠️ 병렬 작업 에러: {item} ({e})")
+            return None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        # 실행 기록(run_ledger) 집계가 워커 스레드에서도 이어지도록 컨텍스트를 복사해 실행
+        futures = [pool.submit(contextvars.copy_context().run, call, item) for item in items]
+        return [f.result() for f in futures]
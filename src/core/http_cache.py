@@ -0,0 +1,213 @@
+import os
+import re
+import sys
+import json
+import time
+import hashlib
+import threading
+from urllib.parse import urlencode
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# 프로젝트 루트 설정 (core -> src -> ProjectRoot)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(current_dir))
+
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from src.config import paths
+
+CACHE_DIR = paths.HTTP_CACHE_DIR
+
+# HTTP_CACHE=0 이면 캐시를 끄고 항상 네트워크로 요청
+ENABLED = os.getenv("HTTP_CACHE", "1") != "0"
+
+# 캐시 전체 용량 상한 (넘으면 가장 오래 안 쓴 항목부터 삭제)
+MAX_BYTES = int(float(os.getenv("HTTP_CACHE_MAX_MB", "200")) * 1024 * 1024)
+
+# 출처(호스트)별 TTL 초. 여기에 없는 호스트는 캐시하지 않음 (saveticker 목록 등 항상 최신이어야 하는 곳)
+SOURCE_TTLS = {
+    "apis.data.go.kr": 6 * 3600,       # 부동산 실거래가 / 상권 정보 (월 단위 데이터)
+    "openapi.onbid.co.kr": 3600,       # 공매 물건
+    "yields.llama.fi": 3600,           # DefiLlama /pools (수십 MB)
+    "www.38.co.kr": 3600,              # 국내 공모주 일정
+    "stockanalysis.com": 3600,         # 미국 IPO 캘린더
+    "api.openweathermap.org": 1800,    # 날씨
+}
+
+# 저장해 둘 응답 헤더
+KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Cache-Control")
+
+# 공공 API는 인증/호출 한도 오류도 HTTP 200 본문으로 돌려줌 -> 이런 본문은 캐시에 저장하지 않음
+ERROR_ENVELOPES = [
+    rb'<OpenAPI_ServiceResponse',                                               # data.go.kr 게이트웨이 오류
+    rb'LIMITED[ _]NUMBER[ _]OF[ _]SERVICE[ _]REQUESTS',                         # 호출 한도 초과
+    rb'SERVICE[ _]KEY[ _]IS[ _]NOT[ _]REGISTERED',
+    rb'SERVICE[ _]ACCESS[ _]DENIED',
+    rb'<resultCode>\s*(?!(INFO-)?0+\s*<)[^<]*</resultCode>',                    # 정상(00/000) 외 결과 코드
+    rb'"resultCode"\s*:\s*"(?!(INFO-)?0+")[^"]*"',
+]
+_ERROR_ENVELOPE = re.compile(b"|".join(b"(?:" + p + b")" for p in ERROR_ENVELOPES))
+
+# 오류 본문 검사는 앞부분만 봄 (오류 응답은 짧고, 정상 응답의 결과 코드도 헤더에 먼저 나옴)
+ENVELOPE_SCAN_BYTES = 4096
+
+_lock = threading.Lock()
+
+# ---------------------------------------------------------
+# [1] 캐시 키 & 저장소
+# ---------------------------------------------------------
+def cache_key(url, params=None):
+    """URL + 정렬된 쿼리 파라미터 기준 키"""
+    raw = url
+    if params:
+        raw += "?" + urlencode(sorted((str(k), str(v)) for k, v in dict(params).items()))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+def _paths(key):
+    return CACHE_DIR / f"{key}.json", CACHE_DIR / f"{key}.body"
+
+def _atomic_write(path, data, mode="wb"):
+    tmp = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp, mode, **({} if "b" in mode else {"encoding": "utf-8"})) as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+def load(key):
+    """(meta, body) 또는 None. 읽을 때 body의 mtime을 갱신해 LRU 순서로 사용"""
+    meta_path, body_path = _paths(key)
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        with open(body_path, 'rb') as f:
+            body = f.read()
+        os.utime(body_path)
+        return meta, body
+    except (OSError, ValueError):
+        return None
+
+def is_error_body(body):
+    """본문 앞부분이 알려진 오류 응답 형태(인증 실패, 호출 한도 초과, 오류 결과 코드)인지"""
+    return bool(_ERROR_ENVELOPE.search(body[:ENVELOPE_SCAN_BYTES]))
+
+def store(key, url, res):
+    """200 응답 저장 후 용량 초과분 정리"""
+    meta = {
+        "url": url,
+        "stored_at": time.time(),
+        "encoding": res.encoding,
+        "headers": {h: res.headers[h] for h in KEPT_HEADERS if h in res.headers},
+    }
+    meta_path, body_path = _paths(key)
+    try:
+        _atomic_write(body_path, res.content)
+        _atomic_write(meta_path, json.dumps(meta, ensure_ascii=False), mode="w")
+    except OSError as e:
+        print(f"⚠️ HTTP Cache 저장 실패: {e}")
+        return
+    evict()
+
+def fresh_body_path(key, ttl):
+    """TTL 안의 저장본이 있으면 본문 파일 경로 (스트리밍 파서가 파일에서 바로 읽도록), 없으면 None"""
+    meta_path, body_path = _paths(key)
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        if not is_fresh(meta, ttl): return None
+        os.utime(body_path)
+        return body_path
+    except (OSError, ValueError):
+        return None
+
+def temp_body_path(key):
+    """스트리밍 응답을 받아 적을 임시 파일 경로"""
+    return CACHE_DIR / f"{key}.{threading.get_ident()}.part"
+
+def store_file(key, url, tmp_path, headers, encoding=None):
+    """스트리밍으로 다 받은 임시 파일을 캐시 항목으로 등록 (오류 응답이면 버림)"""
+    try:
+        with open(tmp_path, 'rb') as f:
+            if is_error_body(f.read(ENVELOPE_SCAN_BYTES)):
+                os.remove(tmp_path)
+                return
+    except OSError:
+        return
+    meta = {
+        "url": url,
+        "stored_at": time.time(),
+        "encoding": encoding,
+        "headers": {h: headers[h] for h in KEPT_HEADERS if h in headers},
+    }
+    meta_path, body_path = _paths(key)
+    try:
+        os.replace(tmp_path, body_path)
+        _atomic_write(meta_path, json.dumps(meta, ensure_ascii=False), mode="w")
+    except OSError as e:
+        print(f"⚠️ HTTP Cache 저장 실패: {e}")
+        return
+    evict()
+
+def touch(key, meta, res):
+    """304 응답: 본문은 그대로, 저장 시각과 검증 헤더만 갱신"""
+    meta["stored_at"] = time.time()
+    for h in ("ETag", "Last-Modified", "Cache-Control"):
+        if h in res.headers:
+            meta["headers"][h] = res.headers[h]
+    try:
+        _atomic_write(_paths(key)[0], json.dumps(meta, ensure_ascii=False), mode="w")
+    except OSError:
+        pass
+
+def evict(max_bytes=None):
+    """전체 용량이 상한을 넘으면 가장 오래 사용하지 않은(mtime) 항목부터 삭제"""
+    max_bytes = MAX_BYTES if max_bytes is None else max_bytes
+    with _lock:
+        entries = []
+        for body_path in CACHE_DIR.glob("*.body"):
+            try:
+                st = body_path.stat()
+                entries.append((st.st_mtime, st.st_size, body_path))
+            except OSError:
+                continue
+
+        total = sum(size for _, size, _ in entries)
+        if total <= max_bytes: return
+
+        for _, size, body_path in sorted(entries):
+            if total <= max_bytes: break
+            for p in (body_path, body_path.with_suffix(".json")):
+                try: p.unlink()
+                except OSError: pass
+            total -= size
+
+# ---------------------------------------------------------
+# [2] 조건부 요청 지원
+# ---------------------------------------------------------
+def ttl_for(host):
+    return SOURCE_TTLS.get(host)
+
+def is_fresh(meta, ttl):
+    return time.time() - meta.get("stored_at", 0) < ttl
+
+def conditional_headers(meta):
+    """저장된 ETag / Last-Modified로 If-None-Match / If-Modified-Since 헤더 생성"""
+    headers = {}
+    if meta["headers"].get("ETag"):
+        headers["If-None-Match"] = meta["headers"]["ETag"]
+    if meta["headers"].get("Last-Modified"):
+        headers["If-Modified-Since"] = meta["headers"]["Last-Modified"]
+    return headers
+
+def to_response(meta, body):
+    """캐시 항목을 requests.Response로 복원 (res.from_cache == True)"""
+    res = requests.Response()
+    res.status_code = 200
+    res._content = body
+    res.headers = CaseInsensitiveDict(meta["headers"])
+    res.encoding = meta.get("encoding")
+    res.url = meta["url"]
+    res.reason = "OK"
+    res.from_cache = True
+    return res
@@ -0,0 +1,242 @@
+import os
+import sys
+import threading
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# 프로젝트 루트 설정 (core -> src -> ProjectRoot)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(current_dir))
+
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from src.core import run_ledger, http_cache, rate_limiter
+
+# ---------------------------------------------------------
+# [1] 기본 설정
+# ---------------------------------------------------------
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    "Accept-Encoding": "gzip, deflate",
+}
+
+# (연결, 읽기) 타임아웃 초
+DEFAULT_TIMEOUT = (10, 30)
+
+# 호스트당 keep-alive 연결 수 (동시 상세 수집을 고려해 여유 있게)
+POOL_MAXSIZE = 10
+
+# 일시적 오류(5xx, 연결 끊김)는 지수 백오프로 재시도
+# 429/Retry-After는 여기서 처리하지 않고 rate_limiter가 호스트 속도를 낮춘 뒤 다시 보냄
+RETRY_POLICY = Retry(
+    total=3,
+    connect=3,
+    read=2,
+    backoff_factor=0.5,
+    status_forcelist=[500, 502, 503, 504],
+    allowed_methods=["GET", "HEAD"],
+    respect_retry_after_header=False,
+    raise_on_status=False,
+)
+
+# 429 응답 시 속도를 낮춰 다시 보내는 횟수
+RATE_LIMIT_RETRIES = 3
+
+# 호스트별 세션 (같은 호스트 요청은 같은 연결 풀을 재사용)
+_sessions = {}
+# 재시도 없는 호스트별 세션 (실패하면 바로 다른 경로로 넘어가야 하는 탐색용 요청)
+_probe_sessions = {}
+# 호스트별 캐시 사용 현황 {host: {"hit", "revalidated", "miss"}}
+_cache_stats = {}
+_lock = threading.Lock()
+
+# ---------------------------------------------------------
+# [2] 세션 & 요청
+# ---------------------------------------------------------
+def get_session(host, retry=True):
+    """호스트 전용 세션 (최초 1회 생성 후 재사용). retry=False면 5xx/연결 실패를 재시도하지 않는 세션"""
+    sessions = _sessions if retry else _probe_sessions
+    with _lock:
+        session = sessions.get(host)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(DEFAULT_HEADERS)
+            adapter = HTTPAdapter(pool_connections=2, pool_maxsize=POOL_MAXSIZE,
+                                  max_retries=RETRY_POLICY if retry else 0)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            sessions[host] = session
+        return session
+
+def _count_cache(host, key):
+    with _lock:
+        stats = _cache_stats.setdefault(host, {"hit": 0, "revalidated": 0, "miss": 0})
+        stats[key] += 1
+
+def _send(session, host, url, retries=RATE_LIMIT_RETRIES, **kwargs):
+    """호스트별 토큰 버킷에서 허가를 받은 뒤 요청. 429면 감속 후 재시도"""
+    for attempt in range(retries + 1):
+        rate_limiter.acquire(host)
+        res = session.get(url, **kwargs)
+        if not rate_limiter.feedback(host, res) or attempt == retries:
+            return res
+        res.close()
+
+def get(url, params=None, headers=None, timeout=DEFAULT_TIMEOUT, cache_ttl=None, cache_if=None, retry=True, **kwargs):
+    """
+    공용 GET. 호스트별 keep-alive 풀, 기본 헤더/타임아웃, 재시도, gzip 해제가 적용됩니다.
+    stream=True가 아니면 내려받은 바이트 수를 실행 기록(run_ledger)에 남깁니다.
+
+    cache_ttl(초): 디스크 캐시 유효 시간. None이면 출처별 기본값(http_cache.SOURCE_TTLS), 0이면 캐시 안 함.
+    유효 시간이 지난 항목은 ETag / Last-Modified로 조건부 요청을 보내 304면 저장본을 재사용합니다.
+    cache_if(res): 200 응답을 저장할지 판단하는 함수 (본문 검증용). 알려진 오류 본문은 이와 별개로 저장하지 않습니다.
+    retry=False: 5xx/연결 실패/429를 재시도하지 않고 첫 응답(또는 예외)을 그대로 돌려줌 (있을지 모르는 엔드포인트 탐색용)
+    """
+    host = urlsplit(url).netloc
+    session = get_session(host, retry)
+    retries = RATE_LIMIT_RETRIES if retry else 0
+
+    ttl = http_cache.ttl_for(host) if cache_ttl is None else cache_ttl
+    if not ttl or not http_cache.ENABLED or kwargs.get("stream"):
+        res = _send(session, host, url, retries, params=params, headers=headers, timeout=timeout, **kwargs)
+        if not kwargs.get("stream"):
+            run_ledger.note_download(res)
+        return res
+
+    key = http_cache.cache_key(url, params)
+    cached = http_cache.load(key)
+    if cached and http_cache.is_fresh(cached[0], ttl):
+        _count_cache(host, "hit")
+        return http_cache.to_response(*cached)
+
+    request_headers = dict(headers or {})
+    if cached:
+        request_headers.update(http_cache.conditional_headers(cached[0]))
+
+    res = _send(session, host, url, retries, params=params, headers=request_headers, timeout=timeout, **kwargs)
+    run_ledger.note_download(res)
+
+    if res.status_code == 304 and cached:
+        _count_cache(host, "revalidated")
+        http_cache.touch(key, cached[0], res)
+        return http_cache.to_response(*cached)
+
+    _count_cache(host, "miss")
+    if res.status_code == 200 and not http_cache.is_error_body(res.content) and (cache_if is None or cache_if(res)):
+        http_cache.store(key, url, res)
+    return res
+
+# ---------------------------------------------------------
+# [3] 큰 응답 스트리밍 (메모리에 통째로 올리지 않음)
+# ---------------------------------------------------------
+class StreamReader:
+    """
+    스트리밍 응답(또는 캐시 파일)을 파일처럼 읽는 객체.
+    읽은 바이트 수를 세고, 캐시 대상이면 읽는 그대로 임시 캐시 파일에도 적습니다.
+    본문이 캐시하면 안 되는 내용(오류 코드 등)이면 호출 측에서 cacheable = False로 표시합니다.
+    """
+
+    def __init__(self, raw, status_code=200, headers=None, sink=None, from_cache=False):
+        self.raw = raw
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.sink = sink
+        self.from_cache = from_cache
+        self.cacheable = True
+        self.bytes = 0
+
+    def read(self, size=-1):
+        chunk = self.raw.read(size)
+        self.bytes += len(chunk)
+        if self.sink is not None:
+            self.sink.write(chunk)
+        return chunk
+
+@contextmanager
+def open_stream(url, params=None, timeout=DEFAULT_TIMEOUT, cache_ttl=None, **kwargs):
+    """
+    with open_stream(url) as reader: 로 본문을 조금씩 읽습니다 (gzip 해제 포함).
+    캐시 대상이면 유효한 저장본은 파일에서 바로 읽고, 새로 받은 본문은 with 블록이 정상 종료되고
+    reader.cacheable이 True일 때만 캐시에 등록합니다 (중간에 멈추면 남은 본문을 마저 받아 저장).
+    """
+    host = urlsplit(url).netloc
+    ttl = http_cache.ttl_for(host) if cache_ttl is None else cache_ttl
+    key = http_cache.cache_key(url, params) if (ttl and http_cache.ENABLED) else None
+
+    if key:
+        body_path = http_cache.fresh_body_path(key, ttl)
+        if body_path:
+            _count_cache(host, "hit")
+            with open(body_path, 'rb') as f:
+                yield StreamReader(f, from_cache=True)
+            return
+
+    res = get(url, params=params, timeout=timeout, stream=True, **kwargs)
+    tmp_path = sink = None
+    try:
+        if res.status_code == 200:
+            res.raw.decode_content = True
+            if key:
+                tmp_path = http_cache.temp_body_path(key)
+                sink = open(tmp_path, 'wb')
+        reader = StreamReader(res.raw, res.status_code, res.headers, sink)
+
+        completed = False
+        try:
+            yield reader
+            completed = True
+            if sink and reader.cacheable:
+                while reader.read(64 * 1024): pass
+        finally:
+            run_ledger.note_download(reader.bytes)
+            if sink:
+                sink.close()
+                if completed and reader.cacheable:
+                    _count_cache(host, "miss")
+                    http_cache.store_file(key, url, tmp_path, res.headers, res.encoding)
+                else:
+                    os.remove(tmp_path)
+    finally:
+        res.close()
+
+# ---------------------------------------------------------
+# [4] 연결 재사용 통계
+# ---------------------------------------------------------
+def get_stats():
+    """호스트별 {requests, connections_opened, connections_reused}"""
+    stats = {}
+    with _lock:
+        sessions = list(_sessions.items()) + list(_probe_sessions.items())
+
+    for host, session in sessions:
+        adapter = session.get_adapter("https://")
+        opened = requests_count = 0
+        for key in list(adapter.poolmanager.pools.keys()):
+            pool = adapter.poolmanager.pools.get(key)
+            if pool is None: continue
+            opened += pool.num_connections
+            requests_count += pool.num_requests
+        s = stats.setdefault(host, {"requests": 0, "connections_opened": 0, "connections_reused": 0})
+        s["requests"] += requests_count
+        s["connections_opened"] += opened
+        s["connections_reused"] = max(s["requests"] - s["connections_opened"], 0)
+    return stats
+
+def get_cache_stats():
+    """호스트별 {hit, revalidated, miss}"""
+    with _lock:
+        return {host: dict(s) for host, s in _cache_stats.items()}
+
+def log_stats():
+    for host, s in get_stats().items():
+        print(f"   🔌 {host}: 요청 {s['requests']}회 / 새 연결 {s['connections_opened']} / 재사용 {s['connections_reused']}")
+    for host, s in rate_limiter.get_stats().items():
+        if s["throttled"]:
+            print(f"   🚦 {host}: 429 {s['throttled']}회 / 현재 속도 {s['rate']}회/초 (최대 {s['max_rate']})")
+    for host, s in get_cache_stats().items():
+        print(f"   💾 {host}: 캐시 적중 {s['hit']} / 304 재검증 {s['revalidated']} / 새로 받음 {s['miss']}")
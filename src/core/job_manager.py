@@ -0,0 +1,157 @@
+import os
+import sys
+import time
+import uuid
+import threading
+from datetime import datetime
+
+# 프로젝트 루트 설정 (core -> src -> ProjectRoot)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(current_dir))
+
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from src.config import paths
+
+LOCK_DIR = paths.LOCK_DIR
+MAX_JOB_HISTORY = 50
+
+# 같은 프로세스 안의 작업 상태 {job_id: job}, 실행 중인 작업 {name: job_id}
+_jobs = {}
+_active = {}
+_events = {}
+_lock = threading.Lock()
+
+# ---------------------------------------------------------
+# [1] 프로세스 간 파일 잠금 (스케줄러/수동 실행/CLI가 서로 다른 프로세스여도 직렬화)
+# ---------------------------------------------------------
+def _try_file_lock(f):
+    """잠금을 잡으면 True, 다른 프로세스가 잡고 있으면 False"""
+    try:
+        if os.name == "nt":
+            import msvcrt
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        return False
+
+def _release_file_lock(f):
+    try:
+        if os.name == "nt":
+            import msvcrt
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    except OSError:
+        pass
+
+# ---------------------------------------------------------
+# [2] 단일 실행(single-flight) 작업
+# ---------------------------------------------------------
+def _update(job_id, **fields):
+    with _lock:
+        _jobs[job_id].update(fields)
+
+def _run(job_id, name, func):
+    lock_path = LOCK_DIR / f"{name}.lock"
+    with open(lock_path, "a+") as f:
+        if not _try_file_lock(f):
+            # 다른 프로세스에서 이미 실행 중 -> 새로 실행하지 않고 그 실행이 끝나기를 기다림
+            # 그 실행의 성공/실패는 이 프로세스에서 알 수 없으므로 'unknown'으로 남김 (completed로 보고하지 않음)
+            print(f"🔒 [Job] '{name}' 다른 프로세스에서 실행 중. 완료를 기다립니다...")
+            _update(job_id, status="waiting")
+            while not _try_file_lock(f):
+                time.sleep(2)
+            _release_file_lock(f)
+            _update(job_id, status="unknown", joined_external=True,
+                    finished_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+            return
+
+        try:
+            _update(job_id, status="running")
+            func()
+            _update(job_id, status="completed", finished_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        except Exception as e:
+            print(f"❌ [Job] '{name}' 실패: {e}")
+            _update(job_id, status="failed", error=str(e),
+                    finished_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        finally:
+            _release_file_lock(f)
+
+def _finish(job_id, name):
+    with _lock:
+        if _active.get(name) == job_id:
+            del _active[name]
+        event = _events.pop(job_id, None)
+
+        # 오래된 기록 정리
+        if len(_jobs) > MAX_JOB_HISTORY:
+            done = [jid for jid, job in _jobs.items() if jid not in _active.values()]
+            for jid in done[:len(_jobs) - MAX_JOB_HISTORY]:
+                del _jobs[jid]
+    if event:
+        event.set()
+
+def submit(name, func):
+    """
+    작업을 백그라운드로 시작합니다. 같은 이름의 작업이 이미 실행 중이면 새로 시작하지 않고 합류합니다.
+    반환값: (job_id, joined)
+    """
+    with _lock:
+        if name in _active:
+            return _active[name], True
+
+        job_id = uuid.uuid4().hex[:12]
+        _jobs[job_id] = {
+            "id": job_id,
+            "name": name,
+            "status": "queued",
+            "started_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "finished_at": None,
+            "error": None,
+        }
+        _active[name] = job_id
+        _events[job_id] = threading.Event()
+
+    def target():
+        try:
+            _run(job_id, name, func)
+        finally:
+            _finish(job_id, name)
+
+    threading.Thread(target=target, name=f"job-{name}", daemon=True).start()
+    return job_id, False
+
+def run_exclusive(name, func, timeout=None):
+    """
+    submit 후 (새로 시작했든 합류했든) 작업이 끝날 때까지 기다림. 작업 상태(dict)를 반환
+    status: completed / failed(error에 사유) / unknown(다른 프로세스의 실행을 기다렸을 뿐이라 결과 모름)
+            / 그 외(running 등)는 timeout 안에 끝나지 않은 것
+    """
+    job_id, joined = submit(name, func)
+    if joined:
+        print(f"🔗 [Job] 실행 중인 '{name}' 작업({job_id})에 합류합니다.")
+    wait(job_id, timeout)
+    return get_job(job_id)
+
+def wait(job_id, timeout=None):
+    with _lock:
+        event = _events.get(job_id)
+    if event:
+        event.wait(timeout)
+
+def get_job(job_id):
+    with _lock:
+        job = _jobs.get(job_id)
+        return dict(job) if job else None
+
+def get_active_job(name):
+    with _lock:
+        job_id = _active.get(name)
+        return dict(_jobs[job_id]) if job_id else None
@@ -0,0 +1,74 @@
+import re
+import json
+import codecs
+
+CHUNK_SIZE = 64 * 1024
+
+# 버퍼 앞부분(이미 디코딩한 영역)이 이만큼 쌓이면 잘라냄
+TRIM_THRESHOLD = 256 * 1024
+
+_WS = " \t\r\n"
+
+def iter_array(source, key):
+    """
+    {"...": ..., key: [ {...}, {...}, ... ]} 형태의 큰 JSON에서 key 배열의 원소를 하나씩 디코딩해 내보냅니다.
+    source는 read(size)가 되는 바이트 스트림 (http_client.open_stream 등).
+    원소 하나 크기 정도의 버퍼만 유지하므로 전체 목록을 메모리에 만들지 않습니다.
+    """
+    decoder = json.JSONDecoder()
+    text = codecs.getincrementaldecoder("utf-8")()
+    start_pattern = re.compile(r'"%s"\s*:\s*\[' % re.escape(key))
+    buf = ""
+    eof = False
+
+    def fill():
+        nonlocal buf, eof
+        chunk = source.read(CHUNK_SIZE)
+        if not chunk:
+            eof = True
+            buf += text.decode(b"", final=True)
+        else:
+            buf += text.decode(chunk)
+
+    # 1. 배열 시작 위치 찾기
+    while True:
+        match = start_pattern.search(buf)
+        if match:
+            pos = match.end()
+            break
+        if eof:
+            raise ValueError(f"JSON에서 '{key}' 배열을 찾지 못했습니다.")
+        # 키가 청크 경계에 걸릴 수 있으므로 끝부분은 남겨 둠
+        buf = buf[-(len(key) + 16):]
+        fill()
+
+    # 2. 원소 단위 디코딩 (불완전하면 더 읽고 다시 시도)
+    while True:
+        while pos < len(buf) and buf[pos] in _WS + ",":
+            pos += 1
+        if pos >= len(buf):
+            if eof:
+                raise ValueError(f"'{key}' 배열이 끝나지 않은 채 응답이 끝났습니다.")
+            fill()
+            continue
+        if buf[pos] == "]":
+            return
+
+        try:
+            item, end = decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            fill()
+            continue
+
+        # 원소가 버퍼 끝에서 딱 끝났다면 숫자 등이 잘렸을 수 있으므로 더 읽고 확인
+        if end == len(buf) and not eof and not isinstance(item, (dict, list, str)):
+            fill()
+            continue
+
+        yield item
+        pos = end
+        if pos > TRIM_THRESHOLD:
+            buf = buf[pos:]
+            pos = 0
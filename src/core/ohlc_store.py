@@ -0,0 +1,95 @@
+import os
+import sys
+import sqlite3
+from datetime import datetime, timedelta
+
+# 프로젝트 루트 설정 (core -> src -> ProjectRoot)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(current_dir))
+
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from src.config import paths
+
+DB_FILE = str(paths.DB_FILE)
+
+# ---------------------------------------------------------
+# [1] 테이블 (심볼 + 날짜 기본키, rowid 없는 압축형)
+# ---------------------------------------------------------
+def init_store(conn=None):
+    own_conn = conn is None
+    if own_conn:
+        conn = sqlite3.connect(DB_FILE)
+    conn.execute('''CREATE TABLE IF NOT EXISTS ohlc_bars
+                    (symbol TEXT,
+                     date TEXT,
+                     open REAL,
+                     high REAL,
+                     low REAL,
+                     close REAL,
+                     volume REAL,
+                     PRIMARY KEY (symbol, date)) WITHOUT ROWID''')
+    if own_conn:
+        conn.commit()
+        conn.close()
+
+# ---------------------------------------------------------
+# [2] 저장 / 증분 기준
+# ---------------------------------------------------------
+def last_dates(symbols):
+    """심볼별 마지막 저장 날짜 {symbol: 'YYYY-MM-DD' 또는 None}"""
+    conn = sqlite3.connect(DB_FILE)
+    try:
+        init_store(conn)
+        rows = conn.execute("SELECT symbol, MAX(date) FROM ohlc_bars GROUP BY symbol").fetchall()
+    finally:
+        conn.close()
+    found = dict(rows)
+    return {s: found.get(s) for s in symbols}
+
+def upsert_bars(bars):
+    """bars: [(symbol, date, open, high, low, close, volume), ...] (같은 날짜는 덮어씀: 장중 값 갱신)"""
+    if not bars: return 0
+    conn = sqlite3.connect(DB_FILE, timeout=30)
+    try:
+        init_store(conn)
+        conn.executemany("INSERT OR REPLACE INTO ohlc_bars VALUES (?, ?, ?, ?, ?, ?, ?)", bars)
+        conn.commit()
+    finally:
+        conn.close()
+    return len(bars)
+
+# ---------------------------------------------------------
+# [3] 조회
+# ---------------------------------------------------------
+def get_closes(symbol, days=400):
+    """최근 days일 종가 [(date, close), ...] 날짜 오름차순"""
+    since = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+    conn = sqlite3.connect(DB_FILE)
+    try:
+        init_store(conn)
+        return conn.execute('''SELECT date, close FROM ohlc_bars
+                               WHERE symbol = ? AND date >= ? AND close IS NOT NULL
+                               ORDER BY date''', (symbol, since)).fetchall()
+    finally:
+        conn.close()
+
+def summarize(symbol):
+    """종가 이력 요약: 최근가, 1일/5일/20일 변화율, 52주 고저 (이력 없으면 None)"""
+    closes = [c for _, c in get_closes(symbol, days=370)]
+    if not closes: return None
+
+    def change(n):
+        if len(closes) <= n: return None
+        base = closes[-1 - n]
+        return (closes[-1] - base) / base * 100 if base else None
+
+    return {
+        "price": closes[-1],
+        "chg_1d": change(1),
+        "chg_5d": change(5),
+        "chg_20d": change(20),
+        "high_52w": max(closes[-252:]),
+        "low_52w": min(closes[-252:]),
+    }
@@ -0,0 +1,108 @@
+import os
+import sys
+import time
+
+# 프로젝트 루트 설정 (core -> src -> ProjectRoot)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(current_dir))
+
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from src.core import run_ledger
+
+POLL_INTERVAL = 0.25
+
+# 고를 수 있는 준비 조건 (count: 항목 수 안정 / network: 리소스 로딩 멈춤 / dom: DOM 구조 변경 멈춤)
+CONDITIONS = ("count", "network", "dom")
+
+# DOM 변경 시각을 기록하는 관찰자 (페이지당 1회 설치)
+# 노드 추가/삭제만 봄 -> 시세 티커/광고처럼 텍스트·속성만 계속 바뀌는 요소는 '조용함'을 깨지 않음
+_INSTALL_OBSERVER = """
+if (!window.__readyObserver) {
+    window.__lastMutation = performance.now();
+    window.__readyObserver = new MutationObserver(function () { window.__lastMutation = performance.now(); });
+    window.__readyObserver.observe(document, {childList: true, subtree: true});
+}
+"""
+
+_PROBE = """
+return {
+    quiet: performance.now() - (window.__lastMutation || 0),
+    resources: performance.getEntriesByType('resource').length,
+    state: document.readyState,
+    count: %s
+};
+"""
+
+# ---------------------------------------------------------
+# [1] 준비 상태 대기
+# ---------------------------------------------------------
+def wait_until_ready(driver, label, count_script=None, min_count=1, stable_for=1.0, quiet_for=1.0, timeout=30,
+                     conditions=None):
+    """
+    고정 sleep 대신 페이지가 실제로 준비될 때까지 기다립니다. conditions에 고른 조건이 모두 만족되면 준비 완료:
+      - "count": count_script(JS 식)의 값이 min_count 이상이고 stable_for초 동안 변하지 않음
+      - "network": 로드된 리소스 수가 quiet_for초 동안 늘지 않음
+      - "dom": quiet_for초 동안 노드 추가/삭제(MutationObserver)가 없음
+    conditions를 안 주면 count_script가 있을 때 ("count",), 없으면 ("network", "dom").
+    (실시간 티커/광고가 도는 페이지는 network/dom이 좀처럼 조용해지지 않으므로 항목 수만 보는 편이 빠름)
+    timeout(초)이 지나면 그 상태 그대로 진행합니다. 걸린 시간은 실행 기록(page_waits)에 남깁니다.
+    반환값: 준비 완료면 True, 시간 초과면 False
+    """
+    if conditions is None:
+        conditions = ("count",) if count_script else ("network", "dom")
+    unknown = set(conditions) - set(CONDITIONS)
+    if unknown:
+        raise ValueError(f"알 수 없는 준비 조건: {sorted(unknown)}")
+    if "count" in conditions and not count_script:
+        raise ValueError("'count' 조건에는 count_script가 필요합니다.")
+
+    start = time.perf_counter()
+    probe = _PROBE % (f"(function () {{ return {count_script}; }})()" if count_script else "null")
+
+    last_count = last_resources = None
+    count_since = resources_since = start
+    count = None
+    ready = False
+
+    if "dom" in conditions:
+        try:
+            driver.execute_script(_INSTALL_OBSERVER)
+        except Exception:
+            pass
+
+    while True:
+        now = time.perf_counter()
+        try:
+            state = driver.execute_script(probe) or {}
+        except Exception:
+            state = {}
+
+        count = state.get("count")
+        if count != last_count:
+            last_count, count_since = count, now
+        if state.get("resources") != last_resources:
+            last_resources, resources_since = state.get("resources"), now
+
+        passed = {
+            "count": count is not None and count >= min_count and now - count_since >= stable_for,
+            "network": state.get("state") in ("interactive", "complete") and now - resources_since >= quiet_for,
+            "dom": (state.get("quiet") or 0) >= quiet_for * 1000,
+        }
+
+        if all(passed[c] for c in conditions):
+            ready = True
+            break
+        if now - start >= timeout:
+            break
+        time.sleep(POLL_INTERVAL)
+
+    elapsed = time.perf_counter() - start
+    outcome = "ready" if ready else "timeout"
+    run_ledger.record_page_wait(label, elapsed, outcome, count)
+    if ready:
+        print(f"   ⏱️ [{label}] 페이지 준비 완료 {elapsed:.1f}초" + (f" (항목 {count}개)" if count is not None else ""))
+    else:
+        print(f"   ⚠️ [{label}] {timeout}초 내 준비되지 않음, 현재 상태로 진행" + (f" (항목 {count}개)" if count is not None else ""))
+    return ready
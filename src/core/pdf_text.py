@@ -0,0 +1,300 @@
+import os
+import sys
+import json
+import time
+import hashlib
+import tempfile
+import threading
+import multiprocessing
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+
+import pypdf
+from pypdf import PdfReader
+
+# 프로젝트 루트 설정 (core -> src -> ProjectRoot)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(current_dir))
+
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from src.config import paths
+from src.core import http_client
+
+CACHE_DIR = paths.PDF_TEXT_CACHE_DIR
+
+# 추출 방식이 바뀌면 끝자리 숫자를 올림 (pypdf 버전이 바뀌어도 자동으로 다시 추출)
+EXTRACTOR_VERSION = f"pypdf-{pypdf.__version__}/1"
+
+# PDF_TEXT_CACHE=0 이면 캐시를 끄고 매번 다시 추출
+ENABLED = os.getenv("PDF_TEXT_CACHE", "1") != "0"
+
+# 이 페이지 수 이상이면 페이지 구간을 나눠 프로세스 풀에서 병렬 추출 (작은 PDF는 프로세스 기동 비용이 더 큼)
+PARALLEL_MIN_PAGES = int(os.getenv("PDF_PARALLEL_MIN_PAGES", "16"))
+WORKERS = int(os.getenv("PDF_EXTRACT_WORKERS", str(max(1, min(4, (os.cpu_count() or 2) - 1)))))
+
+# 워커는 spawn으로 띄움 (스케줄러/서버 스레드가 잡고 있던 lock(logging, sqlite, requests 풀)을
+# fork로 복사하면 자식이 영영 기다릴 수 있음)
+_MP_CONTEXT = multiprocessing.get_context("spawn")
+
+# 한 워커가 한 번에 맡는 페이지 수 (작을수록 순서대로 빨리 흘러나오고, 클수록 PDF 재오픈 비용이 줄어듦)
+PAGES_PER_TASK = 8
+
+# 다운로드 크기 상한 (넘으면 중단) / 한 번에 읽는 크기
+MAX_DOWNLOAD_BYTES = int(float(os.getenv("PDF_MAX_MB", "80")) * 1024 * 1024)
+DOWNLOAD_CHUNK = 256 * 1024
+
+_HASH_CHUNK = 1024 * 1024
+
+# ---------------------------------------------------------
+# [1] 캐시 키 (PDF 내용 SHA-256 + 추출기 버전)
+# ---------------------------------------------------------
+def content_hash(source):
+    """source: PDF 바이트 또는 파일 경로"""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return hashlib.sha256(source).hexdigest()
+    digest = hashlib.sha256()
+    with open(source, 'rb') as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _cache_path(sha, partial=False):
+    version_tag = hashlib.sha256(EXTRACTOR_VERSION.encode("utf-8")).hexdigest()[:8]
+    return CACHE_DIR / f"{sha}_{version_tag}{'.head' if partial else ''}.jsonl"
+
+def iter_cached(sha, partial=False):
+    """
+    캐시된 페이지 텍스트를 앞 페이지부터 하나씩 (없거나 버전이 다르면 아무것도 내보내지 않음)
+    파일 형식: 첫 줄 헤더 {"sha256", "extractor"}, 이후 한 줄에 한 페이지 {"page", "text", "sec"}
+    partial=True면 예산만큼만 읽다 멈춘 앞부분 페이지 캐시(.head)를 읽습니다.
+    """
+    try:
+        f = open(_cache_path(sha, partial), 'r', encoding='utf-8')
+    except OSError:
+        return
+    with f:
+        try:
+            header = json.loads(f.readline())
+        except ValueError:
+            return
+        if header.get("extractor") != EXTRACTOR_VERSION:
+            return
+        for line in f:
+            yield json.loads(line)["text"]
+
+def is_cached(sha):
+    try:
+        with open(_cache_path(sha), 'r', encoding='utf-8') as f:
+            return json.loads(f.readline()).get("extractor") == EXTRACTOR_VERSION
+    except (OSError, ValueError):
+        return False
+
+def load_pages(sha):
+    """캐시된 페이지별 텍스트 [str, ...] (없거나 버전이 다르면 None)"""
+    if not is_cached(sha):
+        return None
+    return list(iter_cached(sha))
+
+# ---------------------------------------------------------
+# [2] 페이지 구간 추출 (프로세스 풀 워커에서도 실행되므로 모듈 최상위 함수)
+# ---------------------------------------------------------
+def _extract_range(pdf_path, start, stop):
+    """[start, stop) 페이지 -> [(text, 걸린 초), ...]"""
+    reader = PdfReader(pdf_path)
+    results = []
+    for index in range(start, stop):
+        began = time.perf_counter()
+        text = reader.pages[index].extract_text() or ""
+        results.append((text, time.perf_counter() - began))
+    return results
+
+def _iter_serial(pdf_path, start, page_count):
+    # 한 페이지씩 추출해 바로 내보냄 (호출 측이 멈추면 뒷페이지는 건드리지 않음)
+    reader = PdfReader(pdf_path)
+    for index in range(start, page_count):
+        began = time.perf_counter()
+        text = reader.pages[index].extract_text() or ""
+        yield text, time.perf_counter() - began
+
+def _iter_parallel(pdf_path, start, page_count, workers):
+    # 구간별로 제출하고 앞 구간부터 기다림 -> 뒤 구간이 먼저 끝나도 출력은 항상 페이지 순서
+    ranges = [(i, min(i + PAGES_PER_TASK, page_count)) for i in range(start, page_count, PAGES_PER_TASK)]
+    with ProcessPoolExecutor(max_workers=min(workers, len(ranges)), mp_context=_MP_CONTEXT) as pool:
+        futures = [pool.submit(_extract_range, pdf_path, start, stop) for start, stop in ranges]
+        try:
+            for future in futures:
+                yield from future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+def _iter_extract(pdf_path, workers, start=0):
+    """start 페이지부터 (text, sec)를 페이지 순서대로. 풀을 쓸 수 없는 환경이면 직렬로 대체"""
+    page_count = len(PdfReader(pdf_path).pages)
+    if workers <= 1 or page_count - start < PARALLEL_MIN_PAGES:
+        yield from _iter_serial(pdf_path, start, page_count)
+        return
+
+    done = start
+    try:
+        for item in _iter_parallel(pdf_path, start, page_count, workers):
+            done += 1
+            yield item
+    except (OSError, RuntimeError) as e:
+        # BrokenProcessPool 등 (RuntimeError 하위) -> 남은 페이지는 현재 프로세스에서
+        print(f"⚠️ [PDF] 병렬 추출 실패, 직렬로 계속: {e}")
+        yield from _iter_serial(pdf_path, done, page_count)
+
+# ---------------------------------------------------------
+# [3] 추출 (캐시 우선, 받은 순서대로 디스크에 기록)
+# ---------------------------------------------------------
+def iter_pages(source, workers=None, sha=None):
+    """
+    PDF 페이지 텍스트를 앞 페이지부터 하나씩 내보냅니다. 같은 내용의 PDF는 파일명/URL이 달라도 한 번만 파싱합니다.
+    source: PDF 바이트 또는 파일 경로 (파싱 실패 시 예외는 호출 측으로)
+    캐시가 없으면 큰 PDF는 페이지 구간을 프로세스 풀에 나눠 추출하고, 끝난 페이지부터 순서대로 캐시 파일에 씁니다.
+    호출 측이 중간에 멈추면 그때까지 추출한 앞부분을 .head 캐시로 남겨, 다음에는 그 뒤부터 이어서 추출합니다.
+    sha: 이미 계산한 내용 해시 (download()에서 받으며 계산한 값, 주면 다시 읽지 않음)
+    """
+    if ENABLED:
+        sha = sha or content_hash(source)
+    else:
+        sha = None
+    if sha and is_cached(sha):
+        yield from iter_cached(sha)
+        return
+
+    # 예산 단위로 읽다 멈춘 적이 있으면 그 앞부분부터 (여기서 멈추면 추출 없이 끝남)
+    head = list(iter_cached(sha, partial=True)) if sha else []
+    yield from head
+
+    workers = WORKERS if workers is None else workers
+    temp_pdf = None
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        # 워커 프로세스마다 바이트를 넘기지 않도록 임시 파일로 한 번만 기록
+        temp_pdf = CACHE_DIR / f"{sha or content_hash(source)}.{os.getpid()}.{threading.get_ident()}.pdf.tmp"
+        with open(temp_pdf, 'wb') as f:
+            f.write(source)
+        pdf_path = str(temp_pdf)
+    else:
+        pdf_path = str(source)
+
+    part = out = None
+    if sha:
+        part = f"{_cache_path(sha)}.{os.getpid()}.{threading.get_ident()}.tmp"
+        out = open(part, 'w', encoding='utf-8')
+        out.write(json.dumps({"sha256": sha, "extractor": EXTRACTOR_VERSION}) + "\n")
+        for index, text in enumerate(head):
+            out.write(json.dumps({"page": index, "text": text, "sec": None}, ensure_ascii=False) + "\n")
+
+    timings = []
+    began = time.perf_counter()
+    completed = False
+    try:
+        for text, sec in _iter_extract(pdf_path, workers, start=len(head)):
+            if out:
+                out.write(json.dumps({"page": len(head) + len(timings), "text": text, "sec": round(sec, 4)},
+                                     ensure_ascii=False) + "\n")
+            timings.append(sec)
+            yield text
+        completed = True
+    finally:
+        if out:
+            out.close()
+            if completed:
+                os.replace(part, _cache_path(sha))
+                _remove(_cache_path(sha, partial=True))
+            elif timings:
+                # 앞에서부터 끊김 없이 추출한 페이지들 -> 다음 예산 읽기에서 재사용
+                os.replace(part, _cache_path(sha, partial=True))
+            else:
+                _remove(part)
+        if temp_pdf is not None:
+            _remove(temp_pdf)
+
+    if timings:
+        slowest = max(range(len(timings)), key=timings.__getitem__)
+        print(f"   📄 [PDF] {len(timings)}페이지 추출 {time.perf_counter() - began:.1f}초 "
+              f"(페이지 합계 {sum(timings):.1f}초, 최장 p.{len(head) + slowest + 1} {timings[slowest]:.2f}초)")
+
+def extract_pages(source, workers=None, sha=None):
+    """PDF의 페이지별 텍스트 목록 [str, ...]"""
+    return list(iter_pages(source, workers, sha))
+
+def join_pages(pages):
+    """텍스트가 있는 페이지만 줄바꿈으로 이어 붙임"""
+    return "".join(f"{text}\n" for text in pages if text)
+
+def extract_text(source, sha=None):
+    return join_pages(extract_pages(source, sha=sha))
+
+def read_text(source, max_chars, max_pages=None, sha=None):
+    """
+    앞 페이지부터 max_chars 글자(또는 max_pages 페이지)가 찰 때까지만 추출해 이어 붙입니다.
+    요약 몇 줄만 필요한 곳에서 수백 페이지를 다 추출하지 않도록 (멈춘 지점까지는 캐시됨)
+    """
+    parts = []
+    total = 0
+    if max_pages is not None and max_pages <= 0:
+        return ""
+    pages = iter_pages(source, workers=1, sha=sha)
+    try:
+        # 예산에 닿은 페이지에서 바로 멈춤 (다음 페이지를 꺼내면 그 페이지까지 추출/캐시됨)
+        for index, text in enumerate(pages):
+            if text:
+                parts.append(f"{text}\n")
+                total += len(text) + 1
+            if total >= max_chars or (max_pages is not None and index + 1 >= max_pages):
+                break
+    finally:
+        pages.close()
+    return "".join(parts)[:max_chars]
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+# ---------------------------------------------------------
+# [4] 다운로드 (본문을 메모리에 올리지 않고 임시 파일로, 받으면서 해시 계산)
+# ---------------------------------------------------------
+class DownloadedPdf:
+    def __init__(self, path, sha256, size):
+        self.path = path
+        self.sha256 = sha256
+        self.size = size
+
+@contextmanager
+def download(url, max_bytes=None, **get_kwargs):
+    """
+    with pdf_text.download(url, headers=...) as pdf: 로 PDF를 임시 파일에 받아 씁니다.
+    청크 단위로 받으며 SHA-256을 함께 계산하므로 메모리에는 한 청크만 올라갑니다.
+    실패하거나 max_bytes(기본 PDF_MAX_MB)를 넘으면 None을 내보냅니다. 임시 파일은 블록이 끝나면 삭제됩니다.
+    """
+    max_bytes = max_bytes or MAX_DOWNLOAD_BYTES
+    fd, tmp_path = tempfile.mkstemp(suffix=".pdf", prefix="download_", dir=CACHE_DIR)
+    try:
+        result = None
+        with os.fdopen(fd, 'wb') as f, http_client.open_stream(url, cache_ttl=0, **get_kwargs) as reader:
+            if reader.status_code != 200:
+                print(f"   ❌ PDF 다운로드 실패 ({reader.status_code})")
+            elif int(reader.headers.get("Content-Length") or 0) > max_bytes:
+                print(f"   ⚠️ PDF가 너무 큼 ({int(reader.headers['Content-Length']) // (1024 * 1024)}MB), 건너뜀")
+            else:
+                digest = hashlib.sha256()
+                size = 0
+                for chunk in iter(lambda: reader.read(DOWNLOAD_CHUNK), b""):
+                    size += len(chunk)
+                    if size > max_bytes:
+                        print(f"   ⚠️ PDF가 {max_bytes // (1024 * 1024)}MB를 넘어 다운로드 중단")
+                        break
+                    digest.update(chunk)
+                    f.write(chunk)
+                else:
+                    result = DownloadedPdf(tmp_path, digest.hexdigest(), size)
+        yield result
+    finally:
+        _remove(tmp_path)
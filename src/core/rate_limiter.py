@@ -0,0 +1,134 @@
+import os
+import sys
+import time
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+# 프로젝트 루트 설정 (core -> src -> ProjectRoot)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(current_dir))
+
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+# ---------------------------------------------------------
+# [1] API별 허용 속도 (초당 요청 수, 순간 허용량)
+# ---------------------------------------------------------
+HOST_LIMITS = {
+    "api.saveticker.com": (5, 5),
+    "apis.data.go.kr": (5, 5),           # 공공데이터포털 (개발계정 기준 여유 있게)
+    "openapi.onbid.co.kr": (2, 2),
+    "www.googleapis.com": (1, 3),        # Custom Search: 분당 100회
+    "api.openweathermap.org": (1, 5),    # 무료: 분당 60회
+}
+
+# 목록에 없는 호스트 (검색 결과 PDF 등 임의 사이트)
+DEFAULT_LIMIT = (2, 2)
+
+# 429를 받으면 속도를 절반으로, 이후 성공할 때마다 원래 속도의 5%씩 회복
+BACKOFF_FACTOR = 0.5
+RECOVERY_STEP = 0.05
+MIN_RATE = 0.1
+
+# ---------------------------------------------------------
+# [2] 토큰 버킷
+# ---------------------------------------------------------
+class TokenBucket:
+    """
+    여러 스레드가 공유하는 토큰 버킷.
+    acquire()는 토큰을 미리 예약하고(음수 = 대기열) 자기 차례까지 잠금 밖에서 기다립니다.
+    """
+
+    def __init__(self, rate, burst):
+        self.max_rate = float(rate)
+        self.rate = float(rate)
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self.updated = time.monotonic()  # 이 시각부터 토큰이 다시 찬다 (429 대기 중이면 미래 시각)
+        self.throttled = 0
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        if now > self.updated:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+    def acquire(self):
+        """허가 1개를 받을 때까지 대기. 기다린 시간(초)을 반환"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens -= 1
+            wait = max(self.updated - now, 0)
+            if self.tokens < 0:
+                wait += -self.tokens / self.rate
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def penalize(self, retry_after=None):
+        """429: 속도를 낮추고 Retry-After(없으면 한 토큰 간격) 동안 허가를 멈춤"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = max(self.rate * BACKOFF_FACTOR, MIN_RATE)
+            delay = retry_after if retry_after else 1 / self.rate
+            self.updated = max(self.updated, now + delay)
+            self.tokens = min(self.tokens, 0)
+            self.throttled += 1
+
+    def reward(self):
+        """정상 응답: 낮춰 둔 속도를 조금씩 원래대로"""
+        if self.rate >= self.max_rate: return
+        with self._lock:
+            self.rate = min(self.rate + self.max_rate * RECOVERY_STEP, self.max_rate)
+
+_buckets = {}
+_lock = threading.Lock()
+
+def get_bucket(host):
+    with _lock:
+        bucket = _buckets.get(host)
+        if bucket is None:
+            bucket = TokenBucket(*HOST_LIMITS.get(host, DEFAULT_LIMIT))
+            _buckets[host] = bucket
+        return bucket
+
+# ---------------------------------------------------------
+# [3] http_client에서 호출
+# ---------------------------------------------------------
+def parse_retry_after(value):
+    """Retry-After 헤더 (초 또는 HTTP 날짜) -> 초"""
+    if not value: return None
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+        return max((when - datetime.now(timezone.utc)).total_seconds(), 0)
+    except (TypeError, ValueError):
+        return None
+
+def acquire(host):
+    return get_bucket(host).acquire()
+
+def feedback(host, response):
+    """응답을 보고 속도 조절. 429면 True (호출 측에서 재시도)"""
+    bucket = get_bucket(host)
+    if response.status_code == 429:
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        bucket.penalize(retry_after)
+        print(f"   🚦 [{host}] 429 Too Many Requests -> {bucket.rate:.2f}회/초로 감속"
+              + (f", {retry_after:.0f}초 대기" if retry_after else ""))
+        return True
+    bucket.reward()
+    return False
+
+def get_stats():
+    """호스트별 {rate, max_rate, throttled}"""
+    with _lock:
+        buckets = list(_buckets.items())
+    return {host: {"rate": round(b.rate, 2), "max_rate": b.max_rate, "throttled": b.throttled}
+            for host, b in buckets}
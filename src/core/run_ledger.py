@@ -0,0 +1,232 @@
+import os
+import sys
+import json
+import sqlite3
+import threading
+import time
+import contextvars
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+# 프로젝트 루트 설정 (core -> src -> ProjectRoot)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(current_dir))
+
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from src.config import paths
+
+DB_FILE = str(paths.DB_FILE)
+
+# 격리 실행된 자식 프로세스가 집계값을 부모에게 돌려줄 때 쓰는 환경변수
+STATS_FILE_ENV = "RUN_LEDGER_STATS_FILE"
+
+# 현재 실행 중인 작업의 집계값 (스레드/비동기 작업 단위로 분리)
+_current_stats = contextvars.ContextVar("run_ledger_stats", default=None)
+_current_name = contextvars.ContextVar("run_ledger_name", default=None)
+_stats_lock = threading.Lock()
+
+# ---------------------------------------------------------
+# [1] 테이블
+# ---------------------------------------------------------
+def init_ledger(conn=None):
+    """실행 기록 테이블 생성"""
+    own_conn = conn is None
+    if own_conn:
+        conn = sqlite3.connect(DB_FILE)
+    conn.execute('''CREATE TABLE IF NOT EXISTS collector_runs
+                    (id INTEGER PRIMARY KEY AUTOINCREMENT,
+                     name TEXT,
+                     kind TEXT,
+                     started_at TEXT,
+                     ended_at TEXT,
+                     duration REAL,
+                     status TEXT,
+                     exit_code INTEGER,
+                     bytes_downloaded INTEGER,
+                     files_written INTEGER,
+                     item_count INTEGER,
+                     error TEXT)''')
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_collector_runs_name ON collector_runs (name, started_at)")
+    # Selenium 페이지가 실제로 준비되기까지 걸린 시간
+    conn.execute('''CREATE TABLE IF NOT EXISTS page_waits
+                    (id INTEGER PRIMARY KEY AUTOINCREMENT,
+                     label TEXT,
+                     run_name TEXT,
+                     recorded_at TEXT,
+                     wait_sec REAL,
+                     outcome TEXT,
+                     item_count INTEGER)''')
+    if own_conn:
+        conn.commit()
+        conn.close()
+
+# ---------------------------------------------------------
+# [2] 수집기 쪽에서 호출하는 집계 함수 (실행 중이 아니면 무시)
+# ---------------------------------------------------------
+def _add(key, value):
+    stats = _current_stats.get()
+    if stats is None: return
+    with _stats_lock:
+        stats[key] += value
+
+def note_download(response_or_bytes):
+    """내려받은 바이트 수 기록 (requests 응답 객체 또는 바이트 수)"""
+    if isinstance(response_or_bytes, int):
+        _add("bytes_downloaded", response_or_bytes)
+    else:
+        _add("bytes_downloaded", len(response_or_bytes.content))
+
+def note_file(path):
+    """저장한 파일 1개 기록"""
+    _add("files_written", 1)
+
+def note_items(count=1):
+    """수집한 항목 수 기록"""
+    _add("item_count", count)
+
+def note_outcome(status, error=None):
+    """
+    예외 없이 끝났지만 '성공'이 아닌 결과 기록 (예: 다른 프로세스의 실행에 합류해 결과를 모름 -> "joined")
+    실행이 실패/시간 초과로 기록되면 그쪽이 우선합니다.
+    """
+    stats = _current_stats.get()
+    if stats is None: return
+    with _stats_lock:
+        stats["outcome"] = (status, error)
+
+# ---------------------------------------------------------
+# [3] 실행 추적
+# ---------------------------------------------------------
+def _new_stats():
+    return {"bytes_downloaded": 0, "files_written": 0, "item_count": 0}
+
+def record_run(run):
+    """실행 결과 1건 저장 (기록 실패가 작업을 멈추지 않도록 예외는 출력만)"""
+    try:
+        conn = sqlite3.connect(DB_FILE, timeout=30)
+        init_ledger(conn)
+        conn.execute('''INSERT INTO collector_runs
+                        (name, kind, started_at, ended_at, duration, status, exit_code,
+                         bytes_downloaded, files_written, item_count, error)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''',
+                     (run["name"], run["kind"], run["started_at"], run["ended_at"], run["duration"],
+                      run["status"], run["exit_code"], run["bytes_downloaded"], run["files_written"],
+                      run["item_count"], run["error"]))
+        conn.commit()
+        conn.close()
+    except Exception as e:
+        print(f"⚠️ Run Ledger Error: {e}")
+
+def record_page_wait(label, wait_sec, outcome, item_count=None):
+    """페이지 준비 대기 1건 저장 (현재 실행 중인 수집기 이름과 함께)"""
+    run_name = _current_name.get()
+    try:
+        conn = sqlite3.connect(DB_FILE, timeout=30)
+        init_ledger(conn)
+        conn.execute('''INSERT INTO page_waits (label, run_name, recorded_at, wait_sec, outcome, item_count)
+                        VALUES (?, ?, ?, ?, ?, ?)''',
+                     (label, run_name, datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                      round(wait_sec, 3), outcome, item_count))
+        conn.commit()
+        conn.close()
+    except Exception as e:
+        print(f"⚠️ Run Ledger Error: {e}")
+
+@contextmanager
+def track_run(name, kind="collector", record=True):
+    """
+    with 블록 동안의 실행 시간과 집계값을 기록합니다.
+    블록 안에서 run["status"], run["exit_code"], run["error"]를 바꿔 결과를 알립니다.
+    record=False면 DB에 쓰지 않고 집계값만 모읍니다 (격리 실행 자식 프로세스용).
+    """
+    stats = _new_stats()
+    run = {"name": name, "kind": kind, "status": "success", "exit_code": 0, "error": None}
+    token = _current_stats.set(stats)
+    name_token = _current_name.set(name)
+    started_at = datetime.now()
+    start = time.perf_counter()
+    try:
+        yield run
+    except Exception as e:
+        run["status"], run["exit_code"], run["error"] = "failed", 1, str(e)
+        raise
+    finally:
+        _current_stats.reset(token)
+        _current_name.reset(name_token)
+        outcome = stats.pop("outcome", None)
+        run.update(stats)
+        if outcome and run["status"] == "success":
+            run["status"], run["error"] = outcome
+        run["started_at"] = started_at.strftime("%Y-%m-%d %H:%M:%S")
+        run["ended_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        run["duration"] = round(time.perf_counter() - start, 3)
+        if record:
+            record_run(run)
+
+def merge_child_stats(child_stats):
+    """격리 실행된 자식 프로세스의 집계값을 현재 실행에 합산"""
+    for key in ("bytes_downloaded", "files_written", "item_count"):
+        _add(key, int(child_stats.get(key, 0)))
+
+def dump_child_stats():
+    """자식 프로세스: 현재 집계값을 부모가 지정한 파일에 저장"""
+    stats_file = os.environ.get(STATS_FILE_ENV)
+    stats = _current_stats.get()
+    if not stats_file or stats is None: return
+    try:
+        with open(stats_file, 'w', encoding='utf-8') as f:
+            json.dump(stats, f)
+    except Exception as e:
+        print(f"⚠️ Stats Dump Error: {e}")
+
+# ---------------------------------------------------------
+# [4] 조회 (API / 대시보드)
+# ---------------------------------------------------------
+def percentile(values, pct):
+    """정렬된 값에서 선형 보간 백분위수"""
+    if not values: return None
+    values = sorted(values)
+    k = (len(values) - 1) * pct / 100
+    lo = int(k)
+    hi = min(lo + 1, len(values) - 1)
+    return values[lo] + (values[hi] - values[lo]) * (k - lo)
+
+def get_recent_runs(limit=50):
+    conn = sqlite3.connect(DB_FILE)
+    try:
+        init_ledger(conn)
+        conn.row_factory = sqlite3.Row
+        rows = conn.execute("SELECT * FROM collector_runs ORDER BY started_at DESC, id DESC LIMIT ?",
+                            (limit,)).fetchall()
+        return [dict(r) for r in rows]
+    finally:
+        conn.close()
+
+def get_duration_stats(days=30):
+    """수집기별 p50/p95 소요 시간 및 실패 횟수 (최근 days일)"""
+    since = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+    conn = sqlite3.connect(DB_FILE)
+    try:
+        init_ledger(conn)
+        rows = conn.execute('''SELECT name, duration, status FROM collector_runs
+                               WHERE started_at >= ? ORDER BY started_at''', (since,)).fetchall()
+    finally:
+        conn.close()
+
+    grouped = {}
+    for name, duration, status in rows:
+        g = grouped.setdefault(name, {"durations": [], "failures": 0})
+        g["durations"].append(duration or 0)
+        if status != "success": g["failures"] += 1
+
+    stats = {}
+    for name, g in grouped.items():
+        stats[name] = {
+            "runs": len(g["durations"]),
+            "failures": g["failures"],
+            "p50": round(percentile(g["durations"], 50), 2),
+            "p95": round(percentile(g["durations"], 95), 2),
+        }
+    return stats
@@ -1,92 +1,44 @@
-import os
-import sys
-import subprocess
 import time
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
-
-# 프로젝트 루트 설정
-current_dir = os.path.dirname(os.path.abspath(__file__))
-PROJECT_ROOT = os.path.dirname(os.path.dirname(current_dir))
-
-def run_script(script_path):
-    """스크립트를 서브프로세스로 실행"""
-    if not os.path.exists(script_path):
-         print(f"⚠️ [Skip] 파일이 없습니다: {script_path}")
-         return
-
-    rel_path = os.path.relpath(script_path, PROJECT_ROOT)
-    print(f"\n🚀 [Scheduler] Executing: {rel_path}")
-    
-    # PYTHONPATH 설정
-    env = os.environ.copy()
-    env["PYTHONPATH"] = PROJECT_ROOT
-    
-    try:
-        # sys.executable을 사용하여 현재 가상환경의 파이썬 사용
-        subprocess.run([sys.executable, script_path], check=True, env=env)
-        print(f"✅ [Scheduler] Finished: {rel_path}")
-    except subprocess.CalledProcessError as e:
-        print(f"❌ [Scheduler] Error in {rel_path}: {e}")
-    except Exception as e:
-        print(f"⚠️ [Scheduler] Unexpected error: {e}")
+from src.core.batch_runner import run_batch
+from src.core.collector_registry import COLLECTOR_PLUGINS, run_plugin, get_abandoned
+from src.core import http_client
 
 def run_full_batch():
-    """모든 수집기 및 분석기 실행 (run_all.py 로직)"""
+    """모든 수집기 및 분석기 실행 (의존성 순서대로 병렬 실행)"""
     print("="*60)
     print("⏰ [Scheduler] Starting Full Batch Job")
     print("="*60)
 
     start_time = time.time()
-    COLLECTORS_DIR = os.path.join(PROJECT_ROOT, "src", "collectors")
-    CORE_DIR = os.path.join(PROJECT_ROOT, "src", "core")
 
-    # [1. 기초 환경 & 거시 경제]
-    step1 = [
-        "weather_collector.py",
-        "macro_collector.py"
-    ]
+    # 독립적인 수집기는 동시에 실행되고, Analyst는 모든 수집기가 끝난 뒤 시작
+    # (개별 주기로 이미 갱신되어 TTL 안에 있는 수집기는 건너뜀)
+    results = run_batch()
 
-    # [2. 실물 자산 & 트렌드]
-    step2 = [
-        "real_estate_collector.py",
-        "commercial_area_collector.py",
-        "onbid_collector.py",
-        "crypto_onchain_collector.py",
-        "pdf_auto_collector.py",
-        "search_collector.py",
-        "ipo_collector.py",
-        "global_ipo_collector.py"
-    ]
+    failed = [name for name, ok in results.items() if not ok]
+    if failed:
+        print(f"\n⚠️ [Scheduler] 실패한 작업: {', '.join(failed)}")
 
-    # [3. 뉴스 & 여론 & 거장]
-    step3 = [
-        "collector.py",
-        "community_collector.py",
-        "email_collector.py",
-        "guru_collector.py"
-    ]
+    # 시간 초과로 포기했지만 스레드가 아직 도는 수집기 (끝날 때까지 잠금을 쥐고 있어 다음 실행이 건너뜀)
+    abandoned = get_abandoned()
+    if abandoned:
+        print(f"⚠️ [Scheduler] 시간 초과 후에도 실행 중: "
+              f"{', '.join(f'{name} ({since}에 포기)' for name, since in abandoned.items())}")
 
-    # 실행 순서
-    all_scripts = step1 + step2 + step3
-    
-    # Collector 실행
-    for script_name in all_scripts:
-        script_path = os.path.join(COLLECTORS_DIR, script_name)
-        run_script(script_path)
-        time.sleep(1) 
-
-    # [4. 종합 분석]
-    print("\n" + "-"*60)
-    print("🧠 [Scheduler] Running Analyst Agent")
-    print("-" * 60)
-    run_script(os.path.join(CORE_DIR, "analyst.py"))
+    # 호스트별 연결 재사용 현황 (keep-alive 효과 확인용)
+    http_client.log_stats()
 
     end_time = time.time()
     duration = end_time - start_time
     print(f"\n🎉 [Scheduler] Batch Job Completed in {duration:.2f}s")
 
+def run_collector_job(name):
+    """개별 수집기 스케줄 실행 (결과가 아직 신선하면 건너뜀)"""
+    run_plugin(name, skip_fresh=True)
+
 # 스케줄러 인스턴스 생성
 scheduler = BackgroundScheduler()
 
@@ -99,8 +51,22 @@ def start_scheduler():
             id="daily_batch_job",
             replace_existing=True
         )
+
+        # 2. 수집기별 개별 주기 (TTL 안이면 실행 시 건너뜀)
+        for name, spec in COLLECTOR_PLUGINS.items():
+            if "cadence" not in spec: continue
+            trigger, trigger_args = spec["cadence"]
+            scheduler.add_job(
+                run_collector_job,
+                trigger,
+                args=[name],
+                id=f"collector_{name}",
+                replace_existing=True,
+                coalesce=True,
+                **trigger_args
+            )
         
-        # 2. (선택사항) 앱 시작 시 1분 뒤에 한 번 실행 (테스트용, 필요 없으면 주석 처리)
+        # 3. (선택사항) 앱 시작 시 1분 뒤에 한 번 실행 (테스트용, 필요 없으면 주석 처리)
         # scheduler.add_job(
         #     run_full_batch,
         #     'date',
@@ -109,7 +75,7 @@ def start_scheduler():
         # )
 
         scheduler.start()
-        print("✅ Scheduler started. Daily batch scheduled at 07:00.")
+        print("✅ Scheduler started. Daily batch scheduled at 07:00 (+ per-collector cadences).")
 
 def shutdown_scheduler():
     if scheduler.running:
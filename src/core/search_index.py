@@ -0,0 +1,281 @@
+import os
+import re
+import sys
+import json
+import math
+import sqlite3
+from pathlib import Path
+from collections import Counter
+
+# 프로젝트 루트 설정 (core -> src -> ProjectRoot)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(current_dir))
+
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from src.config import paths
+from src.core import context_packer, doc_index
+
+DB_FILE = str(paths.DB_FILE)
+
+# 검색 색인 대상 폴더 (뉴스/AI 뉴스/리포트/커뮤니티/거장 노트). 자산 폴더는 매번 덮어쓰는 요약표라 제외
+INDEXED_DIRS = [paths.NEWS_DATA_DIR, paths.AI_NEWS_DATA_DIR, paths.REPORTS_DATA_DIR,
+                paths.COMMUNITY_DATA_DIR, paths.GURU_DATA_DIR]
+INDEXED_SOURCES = {d.name for d in INDEXED_DIRS}
+
+# 패시지(검색 단위) 최대 길이 / 파일당 읽는 상한
+PASSAGE_CHARS = 700
+MAX_DOC_CHARS = 200000
+PDF_INDEX_BUDGET = {"max_chars": 20000, "max_pages": 20}
+
+# 토크나이저 / 패시지 정리 방식이 바뀌면 올림 -> 기존 색인을 비우고 catch_up에서 전부 다시 색인
+INDEX_VERSION = "3"
+
+# BM25 파라미터
+K1 = 1.5
+B = 0.75
+
+# 한 문서에서 결과로 뽑을 최대 패시지 수 (한 기사가 결과를 독차지하지 않도록)
+MAX_PER_DOC = 2
+
+_STOPWORDS = {"the", "and", "for", "with", "that", "this", "are", "was", "from", "which", "have", "has",
+              "will", "not", "but", "you", "your", "our", "its", "into", "about", "than"}
+
+# ---------------------------------------------------------
+# [1] 토크나이저 (한글은 음절 2-gram, 영문/숫자는 단어)
+# ---------------------------------------------------------
+def tokenize(text):
+    """
+    형태소 분석기 없이 쓰는 한국어 대응 토크나이저.
+    '금리인하' / '금리 인하를' 이 같은 2-gram('금리', '인하')을 공유하므로 조사/띄어쓰기 차이에 강합니다.
+    """
+    tokens = []
+    for word in re.findall(r'[가-힣]+|[a-z0-9][a-z0-9+#]*', text.lower()):
+        if '가' <= word[0] <= '힣':
+            if len(word) == 1:
+                tokens.append(word)
+            else:
+                tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        elif len(word) >= 2 and word not in _STOPWORDS:
+            tokens.append(word)
+    return tokens
+
+# ---------------------------------------------------------
+# [2] 테이블
+# ---------------------------------------------------------
+def init_index(conn=None):
+    own_conn = conn is None
+    if own_conn:
+        conn = sqlite3.connect(DB_FILE)
+    conn.execute('''CREATE TABLE IF NOT EXISTS search_docs
+                    (path TEXT PRIMARY KEY,
+                     source TEXT,
+                     content_hash TEXT)''')
+    conn.execute('''CREATE TABLE IF NOT EXISTS search_passages
+                    (id INTEGER PRIMARY KEY AUTOINCREMENT,
+                     path TEXT,
+                     source TEXT,
+                     header TEXT,
+                     text TEXT,
+                     length INTEGER)''')
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_search_passages_path ON search_passages (path)")
+    conn.execute('''CREATE TABLE IF NOT EXISTS search_postings
+                    (term TEXT,
+                     passage_id INTEGER,
+                     tf INTEGER,
+                     PRIMARY KEY (term, passage_id)) WITHOUT ROWID''')
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_search_postings_passage ON search_postings (passage_id)")
+    conn.execute('''CREATE TABLE IF NOT EXISTS search_meta
+                    (key TEXT PRIMARY KEY,
+                     value TEXT)''')
+    _check_version(conn)
+    if own_conn:
+        conn.commit()
+        conn.close()
+
+def _check_version(conn):
+    # 내용 해시가 같으면 catch_up이 다시 보지 않으므로, 색인 방식이 바뀌었으면 통째로 비움
+    row = conn.execute("SELECT value FROM search_meta WHERE key = 'index_version'").fetchone()
+    if row and row[0] == INDEX_VERSION: return
+    conn.execute("DELETE FROM search_postings")
+    conn.execute("DELETE FROM search_passages")
+    conn.execute("DELETE FROM search_docs")
+    conn.execute("INSERT OR REPLACE INTO search_meta VALUES ('index_version', ?)", (INDEX_VERSION,))
+    conn.commit()
+    if row:
+        print(f"🔎 [Search] 색인 버전 변경 ({row[0]} -> {INDEX_VERSION}), 전체 재색인")
+
+def _connect():
+    conn = sqlite3.connect(DB_FILE, timeout=30)
+    init_index(conn)
+    return conn
+
+# ---------------------------------------------------------
+# [3] 문서 -> 패시지
+# ---------------------------------------------------------
+def _read_document(path):
+    """(제목, 본문) 폴더별 저장 형식에 맞춰 읽음"""
+    if path.suffix == ".json":
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            return data.get("title") or path.stem, str(data.get("content", ""))[:MAX_DOC_CHARS]
+        if isinstance(data, list):
+            # AI 뉴스 카드 묶음 [{title, content}, ...]
+            lines = [f"{item.get('title', '')}: {item.get('content', '')}" for item in data if isinstance(item, dict)]
+            return path.stem, "\n".join(lines)[:MAX_DOC_CHARS]
+        return path.stem, ""
+    if path.suffix == ".txt":
+        with open(path, 'r', encoding='utf-8') as f:
+            return path.stem, f.read(MAX_DOC_CHARS)
+    if path.suffix == ".pdf":
+        from src.core import pdf_text
+        return path.stem, pdf_text.read_text(path, **PDF_INDEX_BUDGET)
+    return path.stem, ""
+
+def split_passages(text):
+    """보일러플레이트/중복 줄을 뺀 뒤 PASSAGE_CHARS 이하로 묶음"""
+    passages, current = [], ""
+    for line in context_packer.clean_passages(text):
+        if current and len(current) + 1 + len(line) > PASSAGE_CHARS:
+            passages.append(current)
+            current = ""
+        current = f"{current} {line}" if current else line
+    if current:
+        passages.append(current)
+    return passages
+
+def _remove_path(conn, path):
+    conn.execute('''DELETE FROM search_postings WHERE passage_id IN
+                    (SELECT id FROM search_passages WHERE path = ?)''', (path,))
+    conn.execute("DELETE FROM search_passages WHERE path = ?", (path,))
+    conn.execute("DELETE FROM search_docs WHERE path = ?", (path,))
+
+# ---------------------------------------------------------
+# [4] 증분 색인 (doc_index.record가 파일 저장 직후 호출)
+# ---------------------------------------------------------
+def index_file(path, content_hash, conn=None):
+    """파일 1개를 (다시) 색인. 내용 해시가 같으면 건너뜀. 대상 폴더가 아니면 무시"""
+    path = Path(path)
+    source = path.parent.name
+    if source not in INDEXED_SOURCES: return False
+
+    own_conn = conn is None
+    if own_conn:
+        conn = _connect()
+    try:
+        known = conn.execute("SELECT content_hash FROM search_docs WHERE path = ?", (str(path),)).fetchone()
+        if known and known[0] == content_hash:
+            return False
+
+        try:
+            title, text = _read_document(path)
+        except OSError:
+            raise
+        except Exception as e:
+            # 깨진 PDF/JSON 등 -> 빈 본문으로 색인해 두고 내용이 바뀔 때까지 다시 읽지 않음
+            print(f"⚠️ [Search] 본문 읽기 실패, 빈 문서로 색인: {path.name} ({type(e).__name__}: {e})")
+            title, text = path.stem, ""
+        header = f"[{source}] {title}:"
+        title_terms = tokenize(title)
+
+        _remove_path(conn, str(path))
+        for passage in split_passages(text):
+            terms = Counter(title_terms + tokenize(passage))
+            if not terms: continue
+            cur = conn.execute("INSERT INTO search_passages (path, source, header, text, length) VALUES (?, ?, ?, ?, ?)",
+                               (str(path), source, header, passage, sum(terms.values())))
+            conn.executemany("INSERT INTO search_postings VALUES (?, ?, ?)",
+                             [(term, cur.lastrowid, tf) for term, tf in terms.items()])
+        conn.execute("INSERT INTO search_docs VALUES (?, ?, ?)", (str(path), source, content_hash))
+        if own_conn:
+            conn.commit()
+        return True
+    finally:
+        if own_conn:
+            conn.close()
+
+def catch_up(folders=None):
+    """
+    문서 색인(documents)과 비교해 새로 생기거나 바뀐 파일만 색인하고, 사라진 파일은 제거합니다.
+    (색인 도입 전에 쌓인 파일, 색인을 거치지 않고 들어온 파일 처리용)
+    """
+    folders = folders or INDEXED_DIRS
+    indexed = 0
+    conn = _connect()
+    try:
+        doc_index.init_index(conn)
+        for folder in folders:
+            folder = Path(folder)
+            if folder.name not in INDEXED_SOURCES: continue
+            doc_index.sync_dir(folder)
+
+            stale = conn.execute('''SELECT d.path, d.content_hash FROM documents d
+                                    LEFT JOIN search_docs s ON s.path = d.path
+                                    WHERE d.source = ? AND (s.path IS NULL OR s.content_hash != d.content_hash)''',
+                                 (folder.name,)).fetchall()
+            for path, content_hash in stale:
+                try:
+                    if index_file(path, content_hash, conn):
+                        indexed += 1
+                except Exception as e:
+                    # 파일 1개 문제로 검색 전체가 멈추지 않도록 건너뛰고 다음 파일 계속
+                    print(f"⚠️ [Search] 색인 실패: {os.path.basename(path)} ({e})")
+
+            gone = conn.execute('''SELECT s.path FROM search_docs s
+                                   LEFT JOIN documents d ON d.path = s.path
+                                   WHERE s.source = ? AND d.path IS NULL''', (folder.name,)).fetchall()
+            for (path,) in gone:
+                _remove_path(conn, path)
+            conn.commit()
+    finally:
+        conn.close()
+    if indexed:
+        print(f"🔎 [Search] 문서 {indexed}개 색인")
+    return indexed
+
+# ---------------------------------------------------------
+# [5] 검색 (BM25)
+# ---------------------------------------------------------
+def search(query, k=10, sources=None):
+    """
+    query와 관련도가 높은 패시지 상위 k개 [{"source", "header", "text", "path", "score"}, ...]
+    sources: 폴더 이름 목록으로 결과 제한 (예: ["news", "reports"])
+    """
+    terms = sorted(set(tokenize(query)))
+    if not terms: return []
+    catch_up([d for d in INDEXED_DIRS if sources is None or d.name in sources])
+
+    conn = _connect()
+    try:
+        total, avg_len = conn.execute("SELECT COUNT(*), AVG(length) FROM search_passages").fetchone()
+        if not total: return []
+
+        postings = []
+        for i in range(0, len(terms), 500):
+            chunk = terms[i:i + 500]
+            postings += conn.execute(f'''SELECT p.term, p.passage_id, p.tf, s.length, s.source
+                                         FROM search_postings p JOIN search_passages s ON s.id = p.passage_id
+                                         WHERE p.term IN ({",".join("?" * len(chunk))})''', chunk).fetchall()
+
+        df = Counter(term for term, *_ in postings)
+        scores = Counter()
+        for term, passage_id, tf, length, source in postings:
+            if sources is not None and source not in sources: continue
+            idf = math.log(1 + (total - df[term] + 0.5) / (df[term] + 0.5))
+            scores[passage_id] += idf * tf * (K1 + 1) / (tf + K1 * (1 - B + B * length / avg_len))
+
+        results = []
+        per_doc = Counter()
+        for passage_id, score in scores.most_common():
+            row = conn.execute("SELECT path, source, header, text FROM search_passages WHERE id = ?",
+                               (passage_id,)).fetchone()
+            if row is None or per_doc[row[0]] >= MAX_PER_DOC: continue
+            per_doc[row[0]] += 1
+            results.append({"path": row[0], "source": row[1], "header": row[2], "text": row[3],
+                            "score": round(score, 3)})
+            if len(results) >= k: break
+        return results
+    finally:
+        conn.close()
@@ -0,0 +1,87 @@
+import os
+import sys
+import xml.etree.ElementTree as ET
+
+# 프로젝트 루트 설정 (core -> src -> ProjectRoot)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(current_dir))
+
+if project_root not in sys.path:
+    sys.path.append(project_root)
+
+from src.core import http_client
+
+# 한 번에 요청할 행 수 / 안전장치로 넘길 수 있는 최대 페이지
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGES = int(os.getenv("XML_MAX_PAGES", "50"))
+
+# 응답 헤더/바디에서 따로 모아 둘 값 (공공데이터포털 / 온비드 공통 형식)
+HEADER_TAGS = ("resultCode", "resultMsg", "totalCount", "numOfRows", "pageNo")
+OK_CODES = ("00", "000")
+
+# ---------------------------------------------------------
+# [1] 점진 파싱 (트리를 통째로 만들지 않음)
+# ---------------------------------------------------------
+def iter_items(source, item_tag="item", header=None):
+    """
+    XML 스트림에서 <item>을 하나씩 내보냅니다.
+    호출 측이 다음 항목을 요청하면 방금 내보낸 요소는 부모에서 떼어내 메모리에서 정리합니다.
+    header(dict)를 주면 resultCode / totalCount 등의 값을 채워 줍니다.
+    """
+    stack = []
+    for event, elem in ET.iterparse(source, events=("start", "end")):
+        if event == "start":
+            stack.append(elem)
+            continue
+
+        stack.pop()
+        if elem.tag == item_tag:
+            yield elem
+            elem.clear()
+            if stack:
+                stack[-1].remove(elem)
+        elif header is not None and elem.tag in HEADER_TAGS:
+            header[elem.tag] = (elem.text or "").strip()
+
+# ---------------------------------------------------------
+# [2] 페이지 단위 요청 (스트리밍 + 디스크 캐시는 http_client.open_stream)
+# ---------------------------------------------------------
+def _iter_page(url, params, header, item_tag, **get_kwargs):
+    # 캐시 유효 -> 저장 파일에서, 아니면 네트워크 스트림에서 바로 점진 파싱 (받는 동안 캐시에도 기록)
+    with http_client.open_stream(url, params=params, **get_kwargs) as reader:
+        if reader.status_code != 200:
+            header["status"] = reader.status_code
+            reader.cacheable = False
+            return
+        yield from iter_items(reader, item_tag, header)
+        # 오류 코드 응답은 캐시하지 않음
+        if header.get("resultCode", "00") not in OK_CODES:
+            reader.cacheable = False
+
+def iter_pages(url, params, page_size=DEFAULT_PAGE_SIZE, item_tag="item", max_pages=None, **get_kwargs):
+    """
+    totalCount를 읽어 마지막 페이지까지 순회하며 <item> 요소를 하나씩 내보냅니다.
+    (pageNo / numOfRows는 여기서 채움, 요소는 다음 항목으로 넘어가면 정리되므로 바로 사용)
+    오류 코드나 HTTP 오류가 나면 그때까지 받은 항목만 내보내고 멈춥니다.
+    """
+    max_pages = max_pages or MAX_PAGES
+    for page in range(1, max_pages + 1):
+        header = {}
+        page_params = dict(params, pageNo=str(page), numOfRows=str(page_size))
+
+        count = 0
+        for item in _iter_page(url, page_params, header, item_tag, **get_kwargs):
+            count += 1
+            yield item
+
+        if "status" in header:
+            print(f"   ⚠️ {page}페이지 요청 실패 (Status: {header['status']})")
+            return
+        if header.get("resultCode", "00") not in OK_CODES:
+            print(f"   ⚠️ {page}페이지 오류 응답: {header.get('resultCode')} {header.get('resultMsg', '')}")
+            return
+
+        total = int(header.get("totalCount") or 0)
+        if count == 0 or page * page_size >= total:
+            return
+    print(f"   ⚠️ 최대 {max_pages}페이지까지만 수집했습니다.")
@@ -1,4 +1,4 @@
-from fastapi import FastAPI, BackgroundTasks, HTTPException
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from pydantic import BaseModel
@@ -7,6 +7,7 @@ import sqlite3
 from datetime import datetime
 from src.core.database import engine, Base
 from src.core.scheduler import start_scheduler, shutdown_scheduler, run_full_batch
+from src.core import run_ledger, job_manager
 from src.config import paths
 
 @asynccontextmanager
@@ -55,6 +56,7 @@ def init_ext_db():
                      (id INTEGER PRIMARY KEY AUTOINCREMENT,
                       created_at TEXT,
                       content TEXT)''')
+        run_ledger.init_ledger(conn)
         conn.commit()
         conn.close()
         print(f"✅ Extension Database initialized: {paths.DB_FILE}")
@@ -94,6 +96,18 @@ async def get_latest_insight():
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/runs")
+def get_runs(limit: int = 50, days: int = 30):
+    """수집기/분석기 실행 기록 및 수집기별 p50/p95 소요 시간"""
+    try:
+        return {
+            "status": "success",
+            "stats": run_ledger.get_duration_stats(days=days),
+            "runs": run_ledger.get_recent_runs(limit=limit),
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 # --------------------------------
 
 @app.get("/health")
@@ -108,7 +122,20 @@ def read_root():
 from src.core.analyst import generate_daily_briefing
 
 @app.post("/run-analysis")
-def trigger_analysis(background_tasks: BackgroundTasks):
-    """수동으로 분석(Analyst)만 실행합니다 (백그라운드)"""
-    background_tasks.add_task(generate_daily_briefing)
-    return {"message": "Analysis started in background."}
+def trigger_analysis():
+    """
+    수동으로 분석(Analyst)만 실행합니다 (백그라운드).
+    이미 실행 중인 분석(수동/스케줄)이 있으면 새로 시작하지 않고 그 작업에 합류합니다.
+    """
+    job_id, joined = job_manager.submit("analysis", generate_daily_briefing)
+    if joined:
+        return {"message": "Analysis already running. Joined existing job.", "job_id": job_id, "joined": True}
+    return {"message": "Analysis started in background.", "job_id": job_id, "joined": False}
+
+@app.get("/jobs/{job_id}")
+def get_job_status(job_id: str):
+    """분석 작업 상태 조회 (queued / waiting / running / completed / failed / unknown: 다른 프로세스 실행에 합류)"""
+    job = job_manager.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
@@ -0,0 +1,52 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core import context_packer
+
+
+def test_article_mentioning_copyright_survives_pack():
+    docs = [
+        {"source": "ai_news", "header": "[ai_news] 저작권 소송:",
+         "text": "OpenAI faces a new copyright lawsuit from news publishers over training data. "
+                 "The case could reshape how ⓒ-marked content is licensed for LLMs. "
+                 "ⓒ 연합뉴스 무단전재 및 재배포 금지"},
+        {"source": "community", "header": "[community] 후기:",
+         "text": "이번 엔비디아 실적 발표 글에 좋아요가 천 개 넘게 달렸다. 구독하기 버튼을 누른 사람도 많았다."},
+    ]
+    text, usage = context_packer.pack(docs, 2000, "test")
+
+    assert set(usage) == {"ai_news", "community"}
+    assert "copyright lawsuit" in text
+    assert "좋아요가 천 개" in text
+    # 꼬리말 문장만 빠짐
+    assert "무단전재" not in text
+
+
+def test_standalone_footer_lines_are_dropped():
+    text = "금리 인하 기대감에 국채 금리가 하락했다.\nⓒ 연합뉴스 무단전재 및 재배포 금지\n홍길동 기자 hong@yna.co.kr\n3 / 12\nhttps://example.com/a"
+    assert context_packer.clean_passages(text) == ["금리 인하 기대감에 국채 금리가 하락했다."]
+
+
+def test_footer_glued_to_last_sentence_is_trimmed():
+    passages = context_packer.clean_passages("OpenAI copyright lawsuit 확대 ⓒ 연합뉴스 무단전재")
+    assert passages == ["OpenAI copyright lawsuit 확대"]
+
+
+def test_sentence_starting_with_like_is_kept():
+    text = "좋아요 수가 급증했다. 구독과 좋아요 부탁드립니다!"
+    assert context_packer.clean_passages(text) == ["좋아요 수가 급증했다."]
+
+
+def test_header_is_charged_only_for_documents_that_keep_text():
+    news = "금리 인하 기대감에 국채 금리가 하락했다."
+    docs = [
+        {"source": "news", "header": "[news] 금리:", "text": news},
+        {"source": "reports", "header": "[reports] " + "아주 긴 리포트 제목 " * 20 + ":", "text": "반도체 업황 " * 40},
+    ]
+    text, usage = context_packer.pack(docs, 40, "test")
+
+    # 들어가지 못한 리포트의 긴 헤더가 예산을 먼저 깎아 뉴스까지 밀어내면 안 됨
+    assert text == f"[news] 금리: {news}"
+    assert usage == {"news": context_packer.estimate_tokens("[news] 금리:") + context_packer.estimate_tokens(news) + 2}
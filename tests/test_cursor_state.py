@@ -0,0 +1,45 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core import cursor_state
+
+
+def _items(start, stop):
+    # 최신순 (id가 클수록 최신)
+    return [{"id": i, "created_at": f"2026-01-01 00:{i:02d}:00"} for i in range(stop - 1, start - 1, -1)]
+
+
+def test_failed_page_keeps_mark_so_gap_is_retried(tmp_path, monkeypatch):
+    monkeypatch.setattr(cursor_state, "CURSOR_FILE", str(tmp_path / "cursor.json"))
+    cursor_state.save_mark("news", {"created_at": "2026-01-01 00:00:00", "ids": ["0"]})
+    feed = _items(1, 46)    # 새 글 45개
+
+    def failing(page):
+        return feed[:20] if page == 1 else None
+
+    items, complete = cursor_state.walk_pages("news", failing, 20)
+    cursor_state.advance("news", items, complete=complete)
+
+    assert len(items) == 20 and complete is False
+    assert cursor_state.load_mark("news")["created_at"] == "2026-01-01 00:00:00"
+
+    items, complete = cursor_state.walk_pages("news", lambda page: feed[(page - 1) * 20:page * 20], 20)
+    cursor_state.advance("news", items, complete=complete)
+
+    assert len(items) == 45 and complete is True
+    assert cursor_state.load_mark("news") == {"created_at": "2026-01-01 00:45:00", "ids": ["45"]}
+
+
+def test_mark_not_reached_within_max_pages_keeps_mark(tmp_path, monkeypatch):
+    monkeypatch.setattr(cursor_state, "CURSOR_FILE", str(tmp_path / "cursor.json"))
+    monkeypatch.setattr(cursor_state, "MAX_PAGES", 2)
+    cursor_state.save_mark("news", {"created_at": "2026-01-01 00:00:00", "ids": ["0"]})
+    feed = _items(1, 60)
+
+    items, complete = cursor_state.walk_pages("news", lambda page: feed[(page - 1) * 20:page * 20], 20)
+    cursor_state.advance("news", items, complete=complete)
+
+    assert len(items) == 40 and complete is False
+    assert cursor_state.load_mark("news")["created_at"] == "2026-01-01 00:00:00"